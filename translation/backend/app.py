@@ -4,20 +4,50 @@ Provides REST API endpoints for text and speech translation
 """
 
 import os
+import json
+import uuid
+import asyncio
 import shutil
 import traceback
 import requests
 import zipfile
-from fastapi import FastAPI, File, UploadFile, HTTPException
-from fastapi.responses import FileResponse
+from functools import partial
+from urllib.parse import quote
+from fastapi import FastAPI, File, Form, UploadFile, HTTPException, Response, WebSocket
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.background import BackgroundTask
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import Callable, List, Optional, Tuple
 import uvicorn
 from pathlib import Path
 
-from inference import TranslationPipeline
-from speech_module import SpeechPipeline
+from inference import (
+    TranslationPipeline,
+    create_translation_cache,
+    load_de_en_model,
+    load_en_mr_model,
+    resolve_decoding
+)
+from speech_module import (
+    AudioDecodeError,
+    SpeechPipeline,
+    SpeechToText,
+    TTS_CONCURRENCY,
+    TextToSpeech,
+    VAD_ENABLED,
+    decode_audio_bytes,
+    detect_speech_segments
+)
+from model_registry import ModelRegistry
+from batching import MicroBatcher, WHISPER_BATCH_MAX_SIZE, WHISPER_BATCH_WINDOW_MS
+from executors import ExecutorBusyError, create_executors
+from cascade import PIPELINE_CHUNK_SIZE, run_pipelined, run_sequential
+from streaming import run_streaming_session
+from janitor import AudioJanitor
+from cache import SPEECH_CACHE_SIZE, TranslationCache, make_cache_key
+from uploads import UploadInfo, UploadLimitMiddleware, UploadTooLargeError, check_upload
+from jobs import Job, JobQueueFullError, create_job_broker, run_with_retry
 
 # ========================================================
 # Configuration
@@ -29,6 +59,17 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# File size limit (10 MB)
+MAX_FILE_SIZE = 10 * 1024 * 1024
+
+# Reject oversized uploads before their body is read
+# (added before CORS so the 413 still carries CORS headers)
+app.add_middleware(
+    UploadLimitMiddleware,
+    max_file_bytes=MAX_FILE_SIZE,
+    paths=["/speech-translate", "/speech-translate-stream", "/jobs/speech"]
+)
+
 # CORS Configuration (Allow Flutter app to connect)
 app.add_middleware(
     CORSMiddleware,
@@ -36,16 +77,32 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-German-Text", "X-English-Text", "X-Marathi-Text", "X-Audio-Url"],
 )
 
 # Create directories
 UPLOAD_DIR = Path("./uploads")
 AUDIO_OUTPUT_DIR = Path("./audio_outputs")
+
+# Content types of the audio formats the TTS backends write
+AUDIO_MEDIA_TYPES = {".mp3": "audio/mpeg", ".wav": "audio/wav"}
 UPLOAD_DIR.mkdir(exist_ok=True)
 AUDIO_OUTPUT_DIR.mkdir(exist_ok=True)
 
-# File size limit (10 MB)
-MAX_FILE_SIZE = 10 * 1024 * 1024
+# Retention for audio_outputs/ (files being downloaded are leased, never deleted)
+audio_janitor = AudioJanitor(AUDIO_OUTPUT_DIR)
+
+# Whisper model size
+WHISPER_MODEL = os.getenv("WHISPER_MODEL", "base")
+
+# Sentence limit for /translate-batch
+MAX_BATCH_SENTENCES = 256
+
+# Sentence limit for translation jobs (run in chunks of MAX_BATCH_SENTENCES)
+MAX_JOB_SENTENCES = int(os.getenv("MAX_JOB_SENTENCES", "5000"))
+
+# Speech mode never shows the intermediate English verbatim, so decode it greedily
+SPEECH_DECODING_PROFILE = os.getenv("SPEECH_DECODING_PROFILE", "fast")
 
 # ========================================================
 # Request/Response Models
@@ -56,11 +113,14 @@ class TextTranslationRequest(BaseModel):
     Request model for text translation
     """
     german: str
+    profile: Optional[str] = None  # quality | balanced | fast | greedy
+    num_beams: Optional[int] = Field(None, ge=1, le=8)  # overrides the profile
     
     class Config:
         json_schema_extra = {
             "example": {
-                "german": "Ich lerne Deutsch."
+                "german": "Ich lerne Deutsch.",
+                "profile": "quality"
             }
         }
 
@@ -81,6 +141,28 @@ class TextTranslationResponse(BaseModel):
             }
         }
 
+class BatchTranslationRequest(BaseModel):
+    """
+    Request model for batch text translation
+    """
+    sentences: List[str]
+    profile: Optional[str] = None  # quality | balanced | fast | greedy
+    num_beams: Optional[int] = Field(None, ge=1, le=8)  # overrides the profile
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "sentences": ["Guten Morgen!", "Ich lerne Deutsch."],
+                "profile": "balanced"
+            }
+        }
+
+class BatchTranslationResponse(BaseModel):
+    """
+    Response model for batch text translation (same order as the request)
+    """
+    translations: List[TextTranslationResponse]
+
 class SpeechTranslationResponse(BaseModel):
     """
     Response model for speech translation
@@ -100,6 +182,31 @@ class SpeechTranslationResponse(BaseModel):
             }
         }
 
+class JobTranslationRequest(BatchTranslationRequest):
+    """
+    Request model for a document translation job
+    """
+    priority: int = Field(0, ge=-10, le=10)  # higher runs first
+
+class JobSubmitResponse(BaseModel):
+    """
+    Response model for a submitted job
+    """
+    job_id: str
+    status: str
+    status_url: str
+    events_url: str
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "job_id": "5f0c7e4b9d2a4c1e8b3f6a7d2e1c0b9a",
+                "status": "queued",
+                "status_url": "/jobs/5f0c7e4b9d2a4c1e8b3f6a7d2e1c0b9a",
+                "events_url": "/jobs/5f0c7e4b9d2a4c1e8b3f6a7d2e1c0b9a/events"
+            }
+        }
+
 # ========================================================
 # Initialize Models (Load once at startup)
 # ========================================================
@@ -107,65 +214,291 @@ class SpeechTranslationResponse(BaseModel):
 translation_pipeline: Optional[TranslationPipeline] = None
 speech_pipeline: Optional[SpeechPipeline] = None
 
-@app.on_event("startup")
+# Blocking inference runs here, one bounded pool per model
+executors = create_executors(tts_workers=TTS_CONCURRENCY)
 
+async def _de_en_stage(german_texts: List[str], decoding: dict) -> List[str]:
+    """
+    German → English on the DE→EN executor
+    """
+    return await executors["de_en"].run(
+        translation_pipeline.de_en_model.translate, german_texts, **decoding
+    )
 
-def download_models():
-    models = [
-        {
-            "dir": "./models/de_en_finetuned_10k",
-            "zip": "./models/de_en_finetuned_10k.zip",
-            "url": "https://drive.google.com/drive/folders/1bdCVSqZbTnOKO1cjbXSIfWW5ertxMWCM?usp=sharing"  # Replace with your direct link
-        },
-        {
-            "dir": "./models/en_mr_finetuned_10k",
-            "zip": "./models/en_mr_finetuned_10k.zip",
-            "url": "https://drive.google.com/drive/folders/1cUaTVOGh7pYDF71gkL67wpNDt-Xoeo0N?usp=sharing"  # Replace with your direct link
-        }
-    ]
+async def _en_mr_stage(english_texts: List[str], decoding: dict) -> List[str]:
+    """
+    English → Marathi on the EN→MR executor
+    """
+    return await executors["en_mr"].run(
+        translation_pipeline.en_mr_model.translate, english_texts, **decoding
+    )
+
+async def _translate_batch(german_texts: List[str], decoding: dict) -> List[dict]:
+    """
+    Run a list of sentences through the DE→EN→MR pipeline
+    Large lists overlap the two stages chunk by chunk
+    
+    Args:
+        german_texts: German input sentences
+        decoding: Per-stage settings from resolve_decoding()
+    """
+    de_en_stage = partial(_de_en_stage, decoding=decoding["de_en"])
+    en_mr_stage = partial(_en_mr_stage, decoding=decoding["en_mr"])
+    if len(german_texts) > PIPELINE_CHUNK_SIZE:
+        # Chunk by source length, not request order, so each chunk still pads little
+        lengths = await asyncio.get_running_loop().run_in_executor(
+            None, translation_pipeline.de_en_model.token_lengths, german_texts
+        )
+        return await run_pipelined(german_texts, de_en_stage, en_mr_stage, lengths=lengths)
+    return await run_sequential(german_texts, de_en_stage, en_mr_stage)
+
+async def _translate_coalesced(items: List[Tuple[str, Optional[str], Optional[int]]]) -> List[dict]:
+    """
+    Translate a coalesced batch of (german, profile, num_beams) requests
+    Requests with different decoding settings cannot share a generate() call,
+    so the batch is split per setting
+    """
+    groups = {}
+    for i, (_, profile, num_beams) in enumerate(items):
+        groups.setdefault((profile, num_beams), []).append(i)
+    
+    results = [None] * len(items)
+    for (profile, num_beams), indices in groups.items():
+        group_results = await _translate_batch(
+            [items[i][0] for i in indices],
+            resolve_decoding(profile, num_beams)
+        )
+        for i, result in zip(indices, group_results):
+            results[i] = result
+    return results
+
+# Concurrent /translate-text requests share one generate() call per stage
+translation_batcher = MicroBatcher(_translate_coalesced, name="Translation batcher")
+
+async def _decode_whisper_batch(items: List[Tuple]) -> list:
+    """
+    Decode a coalesced batch of (clip, language, prompt) speech segments
+    Whisper takes one language/prompt per decode call, so the batch is split by those
+    """
+    groups = {}
+    for i, (_, language, prompt) in enumerate(items):
+        groups.setdefault((language, prompt), []).append(i)
+    
+    results = [None] * len(items)
+    for (language, prompt), indices in groups.items():
+        group_results = await executors["whisper"].run(
+            speech_pipeline.stt.decode_clips,
+            [items[i][0] for i in indices],
+            language,
+            prompt
+        )
+        for i, result in zip(indices, group_results):
+            results[i] = result
+    return results
+
+# Speech segments from concurrent requests share one Whisper forward pass
+whisper_batcher = MicroBatcher(
+    _decode_whisper_batch,
+    max_batch_size=WHISPER_BATCH_MAX_SIZE,
+    max_wait_ms=WHISPER_BATCH_WINDOW_MS,
+    name="Whisper batcher"
+)
+
+async def _transcribe(
+    audio,
+    speech_segments: Optional[List[Tuple[int, int]]],
+    language: str = "de",
+    prompt: Optional[str] = None
+) -> dict:
+    """
+    Transcribe audio, batching its speech segments with other requests
+    
+    Args:
+        audio: 16 kHz mono float32 samples
+        speech_segments: VAD segments (None = VAD disabled, whole-clip transcribe)
+        language: Language code
+        prompt: Optional previous text for context
+        
+    Returns:
+        Dictionary with "text" and timestamped "segments"
+    """
+    if speech_segments is None:
+        return await executors["whisper"].run(
+            speech_pipeline.stt.transcribe, audio, language, initial_prompt=prompt
+        )
+    
+    clips = [audio[start:end] for start, end in speech_segments]
+    results = await asyncio.gather(*(
+        whisper_batcher.submit((clip, language, prompt)) for clip in clips
+    ))
+    segments = await executors["whisper"].run(
+        speech_pipeline.stt.finalize_segments, speech_segments, clips, results, language, prompt
+    )
+    return {
+        "text": " ".join(segment["text"] for segment in segments),
+        "segments": segments
+    }
+
+# Models load in parallel in the background; routes check what is ready
+model_registry = ModelRegistry()
+translation_cache = None
+
+# Whole speech results keyed on the upload digest (created in startup, shares the store)
+speech_cache = None
+
+MODEL_DOWNLOADS = {
+    "de_en": {
+        "dir": "./models/de_en_finetuned_10k",
+        "zip": "./models/de_en_finetuned_10k.zip",
+        "url": "https://drive.google.com/drive/folders/1bdCVSqZbTnOKO1cjbXSIfWW5ertxMWCM?usp=sharing"  # Replace with your direct link
+    },
+    "en_mr": {
+        "dir": "./models/en_mr_finetuned_10k",
+        "zip": "./models/en_mr_finetuned_10k.zip",
+        "url": "https://drive.google.com/drive/folders/1cUaTVOGh7pYDF71gkL67wpNDt-Xoeo0N?usp=sharing"  # Replace with your direct link
+    }
+}
+
+def download_model(name: str):
+    """
+    Download and extract a fine-tuned model if it is not on disk yet
+    
+    Args:
+        name: Key in MODEL_DOWNLOADS
+    """
+    model = MODEL_DOWNLOADS[name]
     os.makedirs('./models', exist_ok=True)
-    for model in models:
-        if not os.path.exists(model["dir"]):
-            print(f"Downloading {model['dir']} ...")
-            response = requests.get(model["url"], stream=True)
-            with open(model["zip"], 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            with zipfile.ZipFile(model["zip"], 'r') as zip_ref:
-                zip_ref.extractall('./models/')
-            os.remove(model["zip"])
-            print(f"{model['dir']} download and extraction complete.")
-
-# Call download_models() at startup
-download_models()
+    if not os.path.exists(model["dir"]):
+        print(f"Downloading {model['dir']} ...")
+        response = requests.get(model["url"], stream=True)
+        with open(model["zip"], 'wb') as f:
+            for chunk in response.iter_content(chunk_size=8192):
+                f.write(chunk)
+        with zipfile.ZipFile(model["zip"], 'r') as zip_ref:
+            zip_ref.extractall('./models/')
+        os.remove(model["zip"])
+        print(f"{model['dir']} download and extraction complete.")
+
+def _load_de_en():
+    download_model("de_en")
+    return load_de_en_model(translation_cache)
+
+def _load_en_mr():
+    download_model("en_mr")
+    return load_en_mr_model(translation_cache)
+
+def _load_whisper():
+    return SpeechToText(WHISPER_MODEL)
+
+def _load_tts():
+    return TextToSpeech(output_dir=str(AUDIO_OUTPUT_DIR))
+
+def _on_translation_ready(de_en_model, en_mr_model):
+    """
+    Both MarianMT models are up: start serving text translation
+    """
+    global translation_pipeline
+    # Models preloaded before the fork (serve.py) predate this worker's cache
+    for model in (de_en_model, en_mr_model):
+        if model.cache is None:
+            model.cache = translation_cache
+    translation_pipeline = TranslationPipeline(de_en_model, en_mr_model, cache=translation_cache)
+    print("🌐 Text translation is ready to serve requests")
+
+def _on_speech_ready(stt, tts):
+    """
+    Whisper and TTS are up: speech translation can be served
+    """
+    global speech_pipeline
+    speech_pipeline = SpeechPipeline(stt=stt, tts=tts)
+    if tts.cache is not None:
+        # Janitor deletes through the cache index; the cache skips leased files
+        audio_janitor.cache = tts.cache
+        tts.cache.is_protected = audio_janitor.is_leased
+    print("🌐 Speech translation is ready to serve requests")
+
+model_registry.register("de_en", _load_de_en)
+model_registry.register("en_mr", _load_en_mr)
+model_registry.register("whisper", _load_whisper)
+model_registry.register("tts", _load_tts)
+model_registry.when_ready(["de_en", "en_mr"], _on_translation_ready)
+model_registry.when_ready(["whisper", "tts"], _on_speech_ready)
+
+def _speech_model_id(de_en_model, en_mr_model, stt, tts) -> str:
+    """
+    Identity of everything that shapes a speech result
+    (models, TTS engine and its audio format, profile, VAD)
+    """
+    return "|".join([
+        stt.model_id,
+        de_en_model.model_id,
+        en_mr_model.model_id,
+        f"tts={tts.model_id}{tts.backend.extension}",
+        f"profile={SPEECH_DECODING_PROFILE}",
+        f"vad={VAD_ENABLED}"
+    ])
+
+def _on_all_ready(de_en_model, en_mr_model, stt, tts):
+    """
+    Every model is up: drop speech results from replaced models, then warm up
+
+    The model id is built from the callback's own arguments: the pipelines
+    are set by other callbacks, possibly still running on another loader thread.
+    """
+    if speech_cache is None or speech_cache.store is None:
+        return
+    removed = speech_cache.store.invalidate_stale("speech", _speech_model_id(de_en_model, en_mr_model, stt, tts))
+    if removed:
+        print(f"🧹 Invalidated {removed} cached speech results (model changed)")
+    print(f"🔥 Warm-started speech cache with {speech_cache.warm_start(stages=('speech',))} entries")
+
+model_registry.when_ready(["de_en", "en_mr", "whisper", "tts"], _on_all_ready)
+
+@app.on_event("startup")
 async def startup_event():
     """
-    Load models when the application starts
+    Start loading models in the background
+    The server accepts requests immediately; /ready reports progress
     """
-    global translation_pipeline, speech_pipeline
+    global translation_cache, speech_cache
     
     print("=" * 60)
     print("🚀 Starting Multilingual Translation API")
     print("=" * 60)
     
-    try:
-        # Load translation models
-        translation_pipeline = TranslationPipeline()
-        
-        # Load speech models
-        speech_pipeline = SpeechPipeline(
-            whisper_model="base",
-            output_dir=str(AUDIO_OUTPUT_DIR)
+    if translation_cache is None:
+        translation_cache = create_translation_cache()
+    if speech_cache is None and SPEECH_CACHE_SIZE > 0:
+        speech_cache = TranslationCache(
+            max_entries=SPEECH_CACHE_SIZE,
+            store=translation_cache.store if translation_cache is not None else None
         )
-        
-        print("\n✅ All models loaded successfully!")
-        print("🌐 API is ready to serve requests")
-        print("=" * 60)
-        
-    except Exception as e:
-        print(f"\n❌ Error loading models: {e}")
-        print("💡 Make sure fine-tuned models are in ./models/ directory")
-        raise
+    model_registry.start()
+    audio_janitor.start()
+    job_broker.start()
+    
+    # Jobs do not survive a restart; neither should their spooled uploads
+    for leftover in UPLOAD_DIR.glob("job_*"):
+        leftover.unlink(missing_ok=True)
+    
+    print("⏳ Models are loading in the background (see /ready)")
+    print("=" * 60)
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """
+    Stop background workers
+    """
+    await translation_batcher.stop()
+    await whisper_batcher.stop()
+    await audio_janitor.stop()
+    await job_broker.stop()
+    for executor in executors.values():
+        executor.shutdown()
+    if speech_pipeline is not None and speech_pipeline.tts.cache is not None:
+        speech_pipeline.tts.cache.flush()
+    if translation_cache is not None and translation_cache.store is not None:
+        translation_cache.store.flush()
 
 # ========================================================
 # Health Check Endpoint
@@ -191,7 +524,42 @@ async def health_check():
     return {
         "status": "healthy",
         "translation_model": translation_pipeline is not None,
-        "speech_model": speech_pipeline is not None
+        "speech_model": speech_pipeline is not None,
+        "stt_backend": speech_pipeline.stt.backend.name if speech_pipeline else None,
+        "tts_backend": speech_pipeline.tts.backend.name if speech_pipeline else None,
+        "batching": translation_batcher.stats(),
+        "whisper_batching": whisper_batcher.stats(),
+        "executors": {name: executor.stats() for name, executor in executors.items()},
+        "translation_cache": (
+            translation_pipeline.cache.stats()
+            if translation_pipeline and translation_pipeline.cache else None
+        ),
+        "tts_cache": (
+            speech_pipeline.tts.cache.stats()
+            if speech_pipeline and speech_pipeline.tts.cache else None
+        ),
+        "speech_cache": speech_cache.stats() if speech_cache is not None else None,
+        "audio_storage": audio_janitor.stats(),
+        "jobs": job_broker.stats()
+    }
+
+@app.get("/ready")
+async def readiness_check(response: Response):
+    """
+    Readiness check with per-model load status
+    Returns 503 until text translation can be served
+    """
+    text_ready = translation_pipeline is not None
+    speech_ready = text_ready and speech_pipeline is not None
+    
+    if not text_ready:
+        response.status_code = 503
+    
+    return {
+        "ready": text_ready,
+        "text_translation": text_ready,
+        "speech_translation": speech_ready,
+        "models": model_registry.status()
     }
 
 # ========================================================
@@ -212,7 +580,15 @@ async def translate_text(request: TextTranslationRequest):
     if not translation_pipeline:
         raise HTTPException(
             status_code=503,
-            detail="Translation model not loaded"
+            detail="Translation model not loaded yet, see /ready"
+        )
+    
+    try:
+        resolve_decoding(request.profile, request.num_beams)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
         )
     
     try:
@@ -223,8 +599,10 @@ async def translate_text(request: TextTranslationRequest):
                 detail="German text cannot be empty"
             )
         
-        # Perform translation
-        result = translation_pipeline.translate_de_to_mr(request.german)
+        # Perform translation (coalesced with concurrent requests)
+        result = await translation_batcher.submit(
+            (request.german, request.profile, request.num_beams)
+        )
         
         return TextTranslationResponse(
             german=result["german"],
@@ -232,39 +610,98 @@ async def translate_text(request: TextTranslationRequest):
             marathi=result["marathi"]
         )
         
+    except ExecutorBusyError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e)
+        )
+        
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Translation error: {str(e)}"
         )
 
-# ========================================================
-# Speech Translation Endpoint
-# ========================================================
-
-@app.post("/speech-translate", response_model=SpeechTranslationResponse)
-async def speech_translate(audio_file: UploadFile = File(...)):
+@app.post("/translate-batch", response_model=BatchTranslationResponse)
+async def translate_batch(request: BatchTranslationRequest):
     """
-    Translate German speech to Marathi speech
-    
-    Pipeline:
-    1. German Speech → German Text (Whisper)
-    2. German Text → English Text (MarianMT)
-    3. English Text → Marathi Text (MarianMT)
-    4. Marathi Text → Marathi Speech (gTTS)
+    Translate many German sentences to English and Marathi in one call
+    Sentences are bucketed by token length internally; results keep request order
     
     Args:
-        audio_file: German audio file (wav, mp3, m4a, etc.)
+        request: BatchTranslationRequest with German sentences
         
     Returns:
-        SpeechTranslationResponse with translations and audio URL
+        BatchTranslationResponse with all translations
     """
-    if not translation_pipeline or not speech_pipeline:
+    if not translation_pipeline:
+        raise HTTPException(
+            status_code=503,
+            detail="Translation model not loaded yet, see /ready"
+        )
+    
+    if not request.sentences:
+        raise HTTPException(
+            status_code=400,
+            detail="Sentence list cannot be empty"
+        )
+    
+    if len(request.sentences) > MAX_BATCH_SENTENCES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many sentences. Max per request: {MAX_BATCH_SENTENCES}"
+        )
+    
+    if any(not sentence or not sentence.strip() for sentence in request.sentences):
+        raise HTTPException(
+            status_code=400,
+            detail="Sentences cannot be empty"
+        )
+    
+    try:
+        decoding = resolve_decoding(request.profile, request.num_beams)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+    
+    try:
+        results = await _translate_batch(request.sentences, decoding)
+        
+        return BatchTranslationResponse(
+            translations=[TextTranslationResponse(**result) for result in results]
+        )
+        
+    except ExecutorBusyError as e:
         raise HTTPException(
             status_code=503,
-            detail="Models not loaded"
+            detail=str(e)
         )
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Translation error: {str(e)}"
+        )
+
+# ========================================================
+# Speech Translation Endpoint
+# ========================================================
+
+async def _check_audio_upload(audio_file: UploadFile) -> Tuple[str, UploadInfo]:
+    """
+    Validate an uploaded audio file without reading it into memory
     
+    Args:
+        audio_file: Uploaded German audio
+        
+    Returns:
+        (file extension, UploadInfo with size and SHA-256)
+        
+    Raises:
+        HTTPException: For missing, unsupported or oversized files
+    """
     # Validate file
     if not audio_file.filename:
         raise HTTPException(
@@ -281,72 +718,255 @@ async def speech_translate(audio_file: UploadFile = File(...)):
             detail=f"File type {file_ext} not supported. Allowed: {allowed_extensions}"
         )
     
-    temp_audio_path = None
-    output_audio_path = None
-    
+    # Check file size chunk by chunk (the upload is never read into memory whole)
     try:
-        # Save uploaded file
-        temp_audio_path = UPLOAD_DIR / f"temp_{audio_file.filename}"
+        upload = await check_upload(audio_file, MAX_FILE_SIZE)
+    except UploadTooLargeError as e:
+        raise HTTPException(
+            status_code=413,
+            detail=str(e)
+        )
+    print(f"📥 Upload: {upload.size / 1024:.0f} KB, sha256 {upload.sha256[:12]}")
+    return file_ext, upload
+
+async def _audio_to_translations(
+    source,
+    sha256: str,
+    file_ext: str,
+    progress: Optional[Callable[[str, float], None]] = None
+) -> dict:
+    """
+    Decode, transcribe and translate checked audio
+    
+    Args:
+        source: Readable binary file with the audio
+        sha256: Digest of the audio (speech cache key)
+        file_ext: Audio file extension
+        progress: Optional callback(stage, fraction done) for job progress
         
-        with open(temp_audio_path, "wb") as buffer:
-            content = await audio_file.read()
-            
-            # Check file size
-            if len(content) > MAX_FILE_SIZE:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"File too large. Max size: {MAX_FILE_SIZE / (1024*1024):.1f} MB"
-                )
-            
-            buffer.write(content)
+    Returns:
+        Dictionary with german, english and marathi text and the audio file name
+        (from the speech cache when the same file was uploaded before)
         
-        # Step 1: Speech to Text (German)
-        print(f"🎤 Transcribing German audio...")
-        german_text = speech_pipeline.audio_to_text(
-            str(temp_audio_path),
-            language="de"
+    Raises:
+        HTTPException: For undecodable, silent or untranscribable audio
+    """
+    report = progress or (lambda stage, fraction: None)
+    
+    # Same bytes, same format, same models → same result: skip the whole pipeline
+    cache_key = None
+    if speech_cache is not None:
+        model_id = _speech_model_id(
+            translation_pipeline.de_en_model,
+            translation_pipeline.en_mr_model,
+            speech_pipeline.stt,
+            speech_pipeline.tts
         )
-        
-        if not german_text or not german_text.strip():
+        cache_key = make_cache_key("speech", model_id, sha256, format=file_ext)
+        cached = speech_cache.get(cache_key)
+        if cached is not None:
+            print(f"⚡ Speech cache hit")
+            return json.loads(cached)
+    
+    # Decode straight from the file: 16 kHz float32 samples for Whisper
+    report("decoding", 0.05)
+    loop = asyncio.get_running_loop()
+    try:
+        audio = await loop.run_in_executor(None, decode_audio_bytes, source)
+    except AudioDecodeError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+    
+    # Reject silent uploads before any model work
+    speech_segments = None
+    if VAD_ENABLED:
+        speech_segments = await loop.run_in_executor(None, detect_speech_segments, audio)
+        if not speech_segments:
             raise HTTPException(
                 status_code=400,
-                detail="Could not transcribe audio. Please ensure audio contains clear German speech."
+                detail="No speech detected in audio. Please record clear German speech."
             )
+    
+    # Step 1: Speech to Text (German)
+    report("transcribing", 0.15)
+    print(f"🎤 Transcribing German audio...")
+    german_text = (await _transcribe(audio, speech_segments, language="de"))["text"]
+    
+    if not german_text or not german_text.strip():
+        raise HTTPException(
+            status_code=400,
+            detail="Could not transcribe audio. Please ensure audio contains clear German speech."
+        )
+    
+    print(f"✅ Transcribed: {german_text}")
+    
+    # Step 2 & 3: Translation (DE→EN→MR)
+    report("translating", 0.6)
+    print(f"🔄 Translating...")
+    translation_result = await translation_batcher.submit(
+        (german_text, SPEECH_DECODING_PROFILE, None)
+    )
+    
+    print(f"✅ English: {translation_result['english']}")
+    print(f"✅ Marathi: {translation_result['marathi']}")
+    
+    result = {
+        "german": german_text,
+        "english": translation_result["english"],
+        "marathi": translation_result["marathi"],
+        "audio_filename": speech_pipeline.tts.cache_filename(translation_result["marathi"], "mr")
+    }
+    if cache_key is not None:
+        speech_cache.put(cache_key, json.dumps(result, ensure_ascii=False), stage="speech", model_id=model_id)
+    return result
+
+async def _speech_to_translations(audio_file: UploadFile) -> dict:
+    """
+    Shared front half of the speech endpoints: validate, decode, transcribe, translate
+    
+    Args:
+        audio_file: Uploaded German audio
         
-        print(f"✅ Transcribed: {german_text}")
-        
-        # Step 2 & 3: Translation (DE→EN→MR)
-        print(f"🔄 Translating...")
-        translation_result = translation_pipeline.translate_de_to_mr(german_text)
-        
-        english_text = translation_result["english"]
-        marathi_text = translation_result["marathi"]
-        
-        print(f"✅ English: {english_text}")
-        print(f"✅ Marathi: {marathi_text}")
+    Returns:
+        Dictionary with german, english and marathi text and the audio file name
         
-        # Step 4: Text to Speech (Marathi)
+    Raises:
+        HTTPException: For invalid, silent or untranscribable uploads
+    """
+    file_ext, upload = await _check_audio_upload(audio_file)
+    return await _audio_to_translations(audio_file.file, upload.sha256, file_ext)
+
+async def _synthesize_marathi(texts: dict) -> str:
+    """
+    Step 4: Text to Speech (Marathi), unless the audio is still on disk
+    
+    Returns:
+        Path of the audio file
+    """
+    tts_cache = speech_pipeline.tts.cache
+    output_audio_path = tts_cache.get(texts["audio_filename"]) if tts_cache is not None else None
+    if output_audio_path is None:
         print(f"🔊 Generating Marathi speech...")
-        output_filename = f"marathi_{hash(marathi_text) % 1000000}.mp3"
-        output_audio_path = speech_pipeline.text_to_audio(
-            marathi_text,
-            language="mr",
-            filename=output_filename
+        output_audio_path = await executors["tts"].run(
+            speech_pipeline.text_to_audio,
+            texts["marathi"],
+            language="mr"
         )
+    
+    print(f"✅ Audio generated: {output_audio_path}")
+    return output_audio_path
+
+@app.post("/speech-translate", response_model=SpeechTranslationResponse)
+async def speech_translate(audio_file: UploadFile = File(...)):
+    """
+    Translate German speech to Marathi speech
+    
+    Pipeline:
+    1. German Speech → German Text (Whisper)
+    2. German Text → English Text (MarianMT)
+    3. English Text → Marathi Text (MarianMT)
+    4. Marathi Text → Marathi Speech (gTTS)
+    
+    Args:
+        audio_file: German audio file (wav, mp3, m4a, etc.)
         
-        print(f"✅ Audio generated: {output_audio_path}")
+    Returns:
+        SpeechTranslationResponse with translations and audio URL
+    """
+    if not translation_pipeline or not speech_pipeline:
+        raise HTTPException(
+            status_code=503,
+            detail="Speech models not loaded yet, see /ready"
+        )
+    
+    try:
+        texts = await _speech_to_translations(audio_file)
+        output_audio_path = await _synthesize_marathi(texts)
         
         # Return response
         return SpeechTranslationResponse(
-            german_text=german_text,
-            english_text=english_text,
-            marathi_text=marathi_text,
-            marathi_audio_url=f"/audio/{output_filename}"
+            german_text=texts["german"],
+            english_text=texts["english"],
+            marathi_text=texts["marathi"],
+            marathi_audio_url=f"/audio/{Path(output_audio_path).name}"
+        )
+        
+    except HTTPException:
+        raise
+    
+    except ExecutorBusyError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e)
         )
+    
+    except Exception as e:
+        print(f"❌ Speech translation error:")
+        print(traceback.format_exc())
+        raise HTTPException(
+            status_code=500,
+            detail=f"Processing error: {str(e)}"
+        )
+
+async def _stream_audio_chunks(first_chunk: bytes, chunks):
+    """
+    Relay TTS chunks to the client, pulling each one on the TTS executor
+    """
+    try:
+        yield first_chunk
+        while True:
+            chunk = await executors["tts"].run(next, chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+    finally:
+        try:
+            chunks.close()  # client gone early: drop the partial cache file
+        except ValueError:
+            pass  # still running on a worker thread; it finishes on its own
+
+@app.post("/speech-translate-stream")
+async def speech_translate_audio_stream(audio_file: UploadFile = File(...)):
+    """
+    Translate German speech to Marathi speech, streaming the audio back
+    
+    Same pipeline as /speech-translate, but the response body is the Marathi
+    audio itself, sent chunk by chunk as synthesis produces it (no second
+    request to /audio). The texts are returned as percent-encoded UTF-8
+    headers: X-German-Text, X-English-Text, X-Marathi-Text.
+    
+    Args:
+        audio_file: German audio file (wav, mp3, m4a, etc.)
+        
+    Returns:
+        StreamingResponse with audio/mpeg (gTTS) or audio/wav (local TTS)
+    """
+    if not translation_pipeline or not speech_pipeline:
+        raise HTTPException(
+            status_code=503,
+            detail="Speech models not loaded yet, see /ready"
+        )
+    
+    try:
+        texts = await _speech_to_translations(audio_file)
+        
+        # Pull the first chunk before answering so synthesis errors still get a status code
+        print(f"🔊 Streaming Marathi speech...")
+        tts = speech_pipeline.tts
+        chunks = tts.stream(texts["marathi"], language="mr")
+        first_chunk = await executors["tts"].run(next, chunks, b"")
         
     except HTTPException:
         raise
     
+    except ExecutorBusyError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e)
+        )
+    
     except Exception as e:
         print(f"❌ Speech translation error:")
         print(traceback.format_exc())
@@ -355,10 +975,298 @@ async def speech_translate(audio_file: UploadFile = File(...)):
             detail=f"Processing error: {str(e)}"
         )
     
+    headers = {
+        "X-German-Text": quote(texts["german"]),
+        "X-English-Text": quote(texts["english"]),
+        "X-Marathi-Text": quote(texts["marathi"])
+    }
+    if tts.cache is not None:
+        # Where the same audio can be fetched again once this stream completes
+        headers["X-Audio-Url"] = f"/audio/{tts.cache_filename(texts['marathi'], 'mr')}"
+    
+    return StreamingResponse(
+        _stream_audio_chunks(first_chunk, chunks),
+        media_type=AUDIO_MEDIA_TYPES.get(tts.backend.extension, "application/octet-stream"),
+        headers=headers
+    )
+
+# ========================================================
+# Streaming Speech Translation (WebSocket)
+# ========================================================
+
+@app.websocket("/ws/speech-translate")
+async def speech_translate_stream(websocket: WebSocket):
+    """
+    Stream German audio in, get partial transcripts and translated segments out
+    See streaming.py for the message protocol
+    """
+    await websocket.accept()
+    
+    if not translation_pipeline or not speech_pipeline:
+        await websocket.send_json({
+            "type": "error",
+            "detail": "Speech models not loaded yet, see /ready"
+        })
+        await websocket.close(code=1013)  # try again later
+        return
+    
+    loop = asyncio.get_running_loop()
+    
+    async def transcribe(audio, prompt):
+        speech_segments = None
+        if VAD_ENABLED:
+            # Off the event loop, as for uploads: a 20 s window is ~650 frames of NumPy work
+            speech_segments = await loop.run_in_executor(None, detect_speech_segments, audio)
+            if not speech_segments:
+                return []
+        result = await _transcribe(audio, speech_segments, language="de", prompt=prompt or None)
+        return result["segments"]
+    
+    async def translate(german_text):
+        return await translation_batcher.submit(
+            (german_text, SPEECH_DECODING_PROFILE, None)
+        )
+    
+    await run_streaming_session(websocket, transcribe, translate)
+    
+    try:
+        await websocket.close()
+    except RuntimeError:
+        pass  # already closed by the client
+
+# ========================================================
+# Job API (long speech / document translations)
+# ========================================================
+
+async def _run_speech_job(job: Job, payload: Tuple[str, str, str]) -> dict:
+    """
+    Speech job: spooled upload → texts → Marathi audio
+    
+    Args:
+        job: Running job (receives progress updates)
+        payload: (spooled upload path, sha256, file extension)
+        
+    Returns:
+        Same fields as SpeechTranslationResponse
+    """
+    path, sha256, file_ext = payload
+    
+    async def translate_audio():
+        with open(path, "rb") as source:
+            return await _audio_to_translations(source, sha256, file_ext, progress=job.update)
+    
+    try:
+        if not translation_pipeline or not speech_pipeline:
+            raise RuntimeError("Speech models not loaded yet, see /ready")
+        # A full executor queue means "later", not "failed": each step waits and retries
+        texts = await run_with_retry(job, translate_audio, retry_on=(ExecutorBusyError,))
+        job.update("synthesizing", 0.85)
+        output_audio_path = await run_with_retry(
+            job, partial(_synthesize_marathi, texts), retry_on=(ExecutorBusyError,)
+        )
+    except HTTPException as e:
+        raise RuntimeError(e.detail) from None
     finally:
-        # Clean up temporary file
-        if temp_audio_path and temp_audio_path.exists():
-            temp_audio_path.unlink()
+        Path(path).unlink(missing_ok=True)
+    
+    return SpeechTranslationResponse(
+        german_text=texts["german"],
+        english_text=texts["english"],
+        marathi_text=texts["marathi"],
+        marathi_audio_url=f"/audio/{Path(output_audio_path).name}"
+    ).model_dump()
+
+async def _run_translation_job(job: Job, payload: JobTranslationRequest) -> dict:
+    """
+    Document job: translate the sentences chunk by chunk, reporting progress
+    
+    Returns:
+        Same fields as BatchTranslationResponse
+    """
+    if not translation_pipeline:
+        raise RuntimeError("Translation model not loaded yet, see /ready")
+    decoding = resolve_decoding(payload.profile, payload.num_beams)
+    
+    sentences = payload.sentences
+    translations = []
+    for start in range(0, len(sentences), MAX_BATCH_SENTENCES):
+        job.update(f"translating {start}/{len(sentences)} sentences", start / len(sentences))
+        chunk = sentences[start:start + MAX_BATCH_SENTENCES]
+        translations.extend(await run_with_retry(
+            job, partial(_translate_batch, chunk, decoding), retry_on=(ExecutorBusyError,)
+        ))
+    return {"translations": translations}
+
+# In-process priority queue unless JOB_BROKER selects another broker
+job_broker = create_job_broker()
+job_broker.register("speech", _run_speech_job)
+job_broker.register("translate", _run_translation_job)
+
+def _require_jobs():
+    """
+    Raises:
+        HTTPException: 503 if the job API is disabled (see serve.py)
+    """
+    if job_broker.disabled:
+        raise HTTPException(
+            status_code=503,
+            detail=job_broker.disabled
+        )
+
+async def _submit_job(kind: str, payload, priority: int) -> JobSubmitResponse:
+    """
+    Queue a job and describe where to follow it
+    
+    Raises:
+        HTTPException: 503 if the job queue is full
+    """
+    try:
+        job = await job_broker.submit(kind, payload, priority=priority)
+    except JobQueueFullError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e)
+        )
+    return JobSubmitResponse(
+        job_id=job.id,
+        status=job.status,
+        status_url=f"/jobs/{job.id}",
+        events_url=f"/jobs/{job.id}/events"
+    )
+
+@app.post("/jobs/speech", response_model=JobSubmitResponse, status_code=202)
+async def submit_speech_job(
+    audio_file: UploadFile = File(...),
+    priority: int = Form(0, ge=-10, le=10)
+):
+    """
+    Queue German audio for speech translation and return a job ID at once
+    
+    Use for long recordings that would otherwise hold the connection open
+    past proxy timeouts. Poll /jobs/{job_id} or follow /jobs/{job_id}/events;
+    the finished job's result has the same fields as /speech-translate.
+    
+    Args:
+        audio_file: German audio file (wav, mp3, m4a, etc.)
+        priority: Higher runs first (-10 to 10)
+        
+    Returns:
+        JobSubmitResponse with the job ID and status URLs
+    """
+    _require_jobs()
+    if not translation_pipeline or not speech_pipeline:
+        raise HTTPException(
+            status_code=503,
+            detail="Speech models not loaded yet, see /ready"
+        )
+    
+    file_ext, upload = await _check_audio_upload(audio_file)
+    
+    # The request (and its upload) ends before the job runs: spool it to disk
+    spool_path = UPLOAD_DIR / f"job_{uuid.uuid4().hex}{file_ext}"
+    loop = asyncio.get_running_loop()
+    
+    def _spool():
+        with open(spool_path, "wb") as spool:
+            shutil.copyfileobj(audio_file.file, spool)
+    
+    await loop.run_in_executor(None, _spool)
+    
+    try:
+        return await _submit_job("speech", (str(spool_path), upload.sha256, file_ext), priority)
+    except HTTPException:
+        spool_path.unlink(missing_ok=True)
+        raise
+
+@app.post("/jobs/translate", response_model=JobSubmitResponse, status_code=202)
+async def submit_translation_job(request: JobTranslationRequest):
+    """
+    Queue a long list of German sentences (e.g. a document) for translation
+    
+    Args:
+        request: JobTranslationRequest with sentences, decoding settings and priority
+        
+    Returns:
+        JobSubmitResponse with the job ID and status URLs
+    """
+    _require_jobs()
+    if not translation_pipeline:
+        raise HTTPException(
+            status_code=503,
+            detail="Translation model not loaded yet, see /ready"
+        )
+    
+    if not request.sentences:
+        raise HTTPException(
+            status_code=400,
+            detail="Sentence list cannot be empty"
+        )
+    
+    if len(request.sentences) > MAX_JOB_SENTENCES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many sentences. Max per job: {MAX_JOB_SENTENCES}"
+        )
+    
+    if any(not sentence or not sentence.strip() for sentence in request.sentences):
+        raise HTTPException(
+            status_code=400,
+            detail="Sentences cannot be empty"
+        )
+    
+    try:
+        resolve_decoding(request.profile, request.num_beams)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+    
+    return await _submit_job("translate", request, request.priority)
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """
+    Current state of a job: status, stage, progress and (once done) result or error
+    """
+    _require_jobs()
+    job = job_broker.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Job not found"
+        )
+    return job.to_dict()
+
+async def _job_event_stream(job_id: str):
+    """
+    Format job updates as server-sent events (comment lines keep idle proxies open)
+    """
+    async for state in job_broker.events(job_id):
+        if state is None:
+            yield ": keep-alive\n\n"
+        else:
+            yield f"data: {json.dumps(state, ensure_ascii=False)}\n\n"
+
+@app.get("/jobs/{job_id}/events")
+async def job_events(job_id: str):
+    """
+    Server-sent events stream of a job's progress
+    
+    Sends the job state (same JSON as /jobs/{job_id}) on every change and
+    closes after the job has succeeded or failed.
+    """
+    _require_jobs()
+    if job_broker.get(job_id) is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Job not found"
+        )
+    return StreamingResponse(
+        _job_event_stream(job_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 # ========================================================
 # Audio File Serving Endpoint
@@ -377,16 +1285,32 @@ async def get_audio(filename: str):
     """
     file_path = AUDIO_OUTPUT_DIR / filename
     
-    if not file_path.exists():
+    # Only finished audio (no cache index, no temp files)
+    if filename.startswith(".") or file_path.suffix not in AUDIO_MEDIA_TYPES:
         raise HTTPException(
             status_code=404,
             detail="Audio file not found"
         )
     
+    # Lease first so the janitor cannot delete the file between check and transfer
+    lease_id = audio_janitor.acquire(filename)
+    if not file_path.is_file():
+        audio_janitor.release(filename, lease_id)
+        raise HTTPException(
+            status_code=404,
+            detail="Audio file not found"
+        )
+    
+    # A download counts as a use for LRU retention
+    if speech_pipeline is not None and speech_pipeline.tts.cache is not None:
+        if speech_pipeline.tts.cache.is_managed(filename):
+            speech_pipeline.tts.cache.get(filename)
+    
     return FileResponse(
         path=file_path,
-        media_type="audio/mpeg",
-        filename=filename
+        media_type=AUDIO_MEDIA_TYPES[file_path.suffix],
+        filename=filename,
+        background=BackgroundTask(audio_janitor.release, filename, lease_id)
     )
 
 # ========================================================
@@ -0,0 +1,189 @@
+"""
+Request Batching Module
+Coalesces concurrent single-item requests into one batched model call
+Used in front of TranslationPipeline so MarianMT generate() runs on padded batches,
+and in front of Whisper so speech segments from several uploads decode together
+"""
+
+import os
+import asyncio
+from collections import Counter
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+# ========================================================
+# Configuration
+# ========================================================
+
+# How long the first request of a batch waits for company (milliseconds)
+BATCH_WINDOW_MS = float(os.getenv("BATCH_WINDOW_MS", "10"))
+
+# Upper bound on the number of requests merged into one model call
+BATCH_MAX_SIZE = int(os.getenv("BATCH_MAX_SIZE", "16"))
+
+# Same settings for Whisper: speech segments from concurrent requests
+# share one padded log-mel encoder pass and batched decode
+WHISPER_BATCH_WINDOW_MS = float(os.getenv("WHISPER_BATCH_WINDOW_MS", "50"))
+WHISPER_BATCH_MAX_SIZE = int(os.getenv("WHISPER_BATCH_MAX_SIZE", "8"))
+
+# ========================================================
+# Micro-Batcher
+# ========================================================
+
+class MicroBatcher:
+    """
+    Async request coalescer
+
+    Callers await submit(item). A single worker task collects queued items
+    for up to `max_wait_ms` (or until `max_batch_size` items are waiting),
+    runs them through `process_batch` in one call and resolves each caller's
+    future with its own result.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_batch_size: int = BATCH_MAX_SIZE,
+        max_wait_ms: float = BATCH_WINDOW_MS,
+        name: str = "batcher"
+    ):
+        """
+        Create a batcher (the worker starts lazily on first submit)
+
+        Args:
+            process_batch: Async function mapping a list of items to a list of results
+            max_batch_size: Maximum number of items per batch
+            max_wait_ms: Collection window after the first item arrives
+            name: Name used in logs and stats
+        """
+        self.process_batch = process_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self.name = name
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        # Batch-size distribution: {batch_size: number_of_batches}
+        self.batch_size_counts: Counter = Counter()
+        self.total_batches = 0
+        self.total_items = 0
+
+    def start(self):
+        """
+        Start the worker task on the running event loop
+        """
+        if self._worker is not None and not self._worker.done():
+            return
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+        print(f"✅ {self.name} started (window={self.max_wait * 1000:.0f}ms, max_batch={self.max_batch_size})")
+
+    async def stop(self):
+        """
+        Cancel the worker task and fail anything still queued
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                if not future.done():
+                    future.set_exception(RuntimeError(f"{self.name} stopped"))
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Queue one item and wait for its result
+
+        Args:
+            item: Single input for process_batch
+
+        Returns:
+            The result produced for this item
+        """
+        if self._worker is None or self._worker.done():
+            self.start()
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _collect(self) -> List[Tuple[Any, asyncio.Future]]:
+        """
+        Wait for the first item, then gather more until the window closes
+        """
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        # Anything that arrived while we were waiting rides along for free
+        while len(batch) < self.max_batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+
+        return batch
+
+    async def _run(self):
+        """
+        Worker loop: collect, process, dispatch results
+        """
+        while True:
+            batch = await self._collect()
+
+            # Drop callers that gave up (client disconnect / timeout)
+            batch = [(item, future) for item, future in batch if not future.done()]
+            if not batch:
+                continue
+
+            items = [item for item, _ in batch]
+            self.batch_size_counts[len(items)] += 1
+            self.total_batches += 1
+            self.total_items += len(items)
+
+            try:
+                results = await self.process_batch(items)
+                if len(results) != len(items):
+                    raise RuntimeError(
+                        f"{self.name}: got {len(results)} results for {len(items)} items"
+                    )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    def stats(self) -> dict:
+        """
+        Batching statistics for the health endpoint
+
+        Returns:
+            Dictionary with settings and the batch-size distribution
+        """
+        return {
+            "window_ms": self.max_wait * 1000,
+            "max_batch_size": self.max_batch_size,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "batches": self.total_batches,
+            "items": self.total_items,
+            "mean_batch_size": round(self.total_items / self.total_batches, 2) if self.total_batches else 0.0,
+            "batch_size_distribution": {
+                str(size): count for size, count in sorted(self.batch_size_counts.items())
+            }
+        }
@@ -0,0 +1,106 @@
+"""
+Cascade Throughput Benchmark
+Compares sequential vs pipelined DE→EN→MR execution on the same sentences
+"""
+
+import time
+import asyncio
+from functools import partial
+
+from inference import TranslationPipeline
+from executors import InferenceExecutor
+from cascade import PIPELINE_CHUNK_SIZE, PIPELINE_QUEUE_SIZE, run_pipelined, run_sequential
+
+# ========================================================
+# Configuration
+# ========================================================
+
+NUM_SENTENCES = 128
+REPEATS = 3
+
+BASE_SENTENCES = [
+    "Guten Morgen! Wie geht es dir?",
+    "Ich lerne Deutsch.",
+    "Das Wetter ist heute schön.",
+    "Mein Name ist Student und ich studiere Informatik.",
+    "Willkommen bei der Übersetzungs-App.",
+    "Kannst du mir bitte helfen?",
+    "Wir treffen uns morgen um acht Uhr am Bahnhof.",
+    "Die Konferenz wurde wegen des schlechten Wetters auf nächste Woche verschoben."
+]
+
+# ========================================================
+# Benchmark
+# ========================================================
+
+def build_sentences(count):
+    """
+    Build distinct sentences (numbered so the models see varied input)
+    """
+    return [
+        f"{BASE_SENTENCES[i % len(BASE_SENTENCES)]} ({i})"
+        for i in range(count)
+    ]
+
+async def time_mode(name, runner, sentences, de_en_stage, en_mr_stage):
+    """
+    Time one execution mode (best of REPEATS)
+    """
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        await runner(sentences, de_en_stage, en_mr_stage)
+        best = min(best, time.perf_counter() - start)
+
+    print(f"   {name:<12} {best:7.2f}s   {len(sentences) / best:6.2f} sentences/s")
+    return best
+
+async def run_benchmark(pipeline):
+    """
+    Run both modes with one executor per stage (as in app.py)
+    """
+    de_en_executor = InferenceExecutor("de_en", 1)
+    en_mr_executor = InferenceExecutor("en_mr", 1)
+
+    async def de_en_stage(texts):
+        return await de_en_executor.run(pipeline.de_en_model.translate, texts)
+
+    async def en_mr_stage(texts):
+        return await en_mr_executor.run(pipeline.en_mr_model.translate, texts)
+
+    sentences = build_sentences(NUM_SENTENCES)
+
+    # Warm-up
+    await run_sequential(sentences[:4], de_en_stage, en_mr_stage)
+
+    print(f"\n📊 {NUM_SENTENCES} sentences, chunk={PIPELINE_CHUNK_SIZE}, queue={PIPELINE_QUEUE_SIZE}")
+    sequential = await time_mode("sequential", run_sequential, sentences, de_en_stage, en_mr_stage)
+    pipelined = await time_mode("pipelined", run_pipelined, sentences, de_en_stage, en_mr_stage)
+    lengths = pipeline.de_en_model.token_lengths(sentences)
+    sorted_run = partial(run_pipelined, lengths=lengths)
+    pipelined_sorted = await time_mode("pipe+sorted", sorted_run, sentences, de_en_stage, en_mr_stage)
+    print(f"\n✅ Pipelined speed-up: {sequential / pipelined:.2f}x "
+          f"({sequential / pipelined_sorted:.2f}x with length-sorted chunks)")
+
+    de_en_executor.shutdown()
+    en_mr_executor.shutdown()
+
+def main():
+    """
+    Main benchmark function
+    """
+    print("=" * 60)
+    print("🚀 Cascade Throughput Benchmark")
+    print("=" * 60)
+
+    pipeline = TranslationPipeline()
+
+    # Measure the models, not the cache
+    pipeline.de_en_model.cache = None
+    pipeline.en_mr_model.cache = None
+
+    asyncio.run(run_benchmark(pipeline))
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Memory Benchmark
+Starts the API with several workers in two modes and compares memory use:
+separate processes (uvicorn --workers, every worker loads its own models) vs
+pre-fork (serve.py, models loaded once and shared copy-on-write).
+Linux only: reads /proc/<pid>/smaps_rollup.
+"""
+
+import os
+import sys
+import time
+import signal
+import subprocess
+
+import requests
+
+# ========================================================
+# Configuration
+# ========================================================
+
+WORKERS = int(os.getenv("SERVE_WORKERS", "2"))
+
+PORT = 10100  # Away from the default 10000 so a running server is not hit
+
+STARTUP_TIMEOUT = 900  # Seconds to wait for every worker to have its models
+
+# Requests sent before measuring (inference touches pages, which is when copy-on-write copies)
+WARMUP_REQUESTS = 20
+
+SENTENCES = [
+    "Guten Morgen!",
+    "Ich lerne Deutsch.",
+    "Wie geht es dir heute?",
+    "Das Wetter ist heute sehr schön."
+]
+
+MODES = {
+    "separate": [sys.executable, "-m", "uvicorn", "app:app",
+                 "--host", "127.0.0.1", "--port", str(PORT), "--workers", str(WORKERS)],
+    "prefork": [sys.executable, "serve.py"]
+}
+
+# ========================================================
+# /proc Readers
+# ========================================================
+
+def read_memory(pid):
+    """
+    RSS, PSS and USS (private memory) of one process in MB
+
+    RSS counts shared pages in full for every process, PSS splits them between
+    the processes sharing them (so PSS adds up to real usage), and USS is what
+    the process alone holds: the memory freed if it exited.
+    """
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[0].endswith(":") and parts[1].isdigit():
+                fields[parts[0][:-1]] = int(parts[1]) / 1024  # kB → MB
+    return {
+        "rss": fields.get("Rss", 0.0),
+        "pss": fields.get("Pss", 0.0),
+        "uss": fields.get("Private_Clean", 0.0) + fields.get("Private_Dirty", 0.0)
+    }
+
+def child_pids(parent_pid):
+    """
+    Direct children of a process (scanned from /proc/<pid>/stat)
+    """
+    children = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # Field 4 (ppid) follows the ")" closing the command name
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        if ppid == parent_pid:
+            children.append(int(entry))
+    return sorted(children)
+
+# ========================================================
+# Benchmark
+# ========================================================
+
+def wait_until_ready(process):
+    """
+    Wait until /ready reports speech translation on every worker
+
+    Requests land on whichever worker accepts them, so readiness must be
+    seen many times in a row before all workers can be assumed ready.
+    """
+    url = f"http://127.0.0.1:{PORT}/ready"
+    streak = 0
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with status {process.returncode}")
+        try:
+            ready = requests.get(url, timeout=5).json().get("speech_translation", False)
+        except requests.RequestException:
+            ready = False
+        streak = streak + 1 if ready else 0
+        if streak >= 5 * WORKERS:
+            return
+        time.sleep(0.5 if ready else 2)
+    raise TimeoutError(f"Workers not ready after {STARTUP_TIMEOUT}s")
+
+def warm_up():
+    """
+    Send translation requests so every worker runs inference at least once
+    """
+    url = f"http://127.0.0.1:{PORT}/translate-text"
+    for i in range(WARMUP_REQUESTS):
+        requests.post(url, json={"german": SENTENCES[i % len(SENTENCES)]}, timeout=120)
+
+def benchmark_mode(name):
+    """
+    Start one serving mode, measure every process, stop it
+
+    Returns:
+        List of (role, memory) tuples
+    """
+    print(f"\n📊 {name}: {' '.join(MODES[name])}")
+    env = dict(os.environ, PORT=str(PORT), HOST="127.0.0.1", SERVE_WORKERS=str(WORKERS))
+    process = subprocess.Popen(
+        MODES[name], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        started = time.perf_counter()
+        wait_until_ready(process)
+        print(f"   Ready in {time.perf_counter() - started:.1f}s")
+        warm_up()
+        time.sleep(2)
+
+        # uvicorn --workers: parent supervisor + N workers; serve.py: parent holding models + N workers
+        processes = [("parent", process.pid)] + [("worker", pid) for pid in child_pids(process.pid)]
+        results = []
+        for role, pid in processes:
+            memory = read_memory(pid)
+            results.append((role, memory))
+            print(f"   {role:<7} pid {pid:<7} RSS {memory['rss']:8.1f}  "
+                  f"PSS {memory['pss']:8.1f}  USS {memory['uss']:8.1f} MB")
+        return results
+    finally:
+        process.send_signal(signal.SIGTERM)
+        try:
+            process.wait(timeout=60)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+# ========================================================
+# Main
+# ========================================================
+
+def main():
+    """
+    Main benchmark function
+    """
+    if not os.path.exists("/proc/self/smaps_rollup"):
+        print("❌ /proc/<pid>/smaps_rollup not available (Linux 4.14+ required)")
+        return
+
+    print("=" * 60)
+    print(f"🚀 Serving Memory Benchmark ({WORKERS} workers)")
+    print("=" * 60)
+
+    summary = {}
+    for name in MODES:
+        try:
+            results = benchmark_mode(name)
+        except Exception as e:
+            print(f"⚠️  Skipped: {e}")
+            continue
+        workers = [memory for role, memory in results if role == "worker"]
+        summary[name] = {
+            "total_pss": sum(memory["pss"] for _, memory in results),
+            "worker_uss": sum(memory["uss"] for memory in workers) / max(1, len(workers)),
+            "worker_rss": sum(memory["rss"] for memory in workers) / max(1, len(workers))
+        }
+
+    print("\n" + "=" * 60)
+    print(f"{'mode':<10} {'total PSS MB':>13} {'worker RSS MB':>14} {'worker USS MB':>14}")
+    for name, result in summary.items():
+        print(f"{name:<10} {result['total_pss']:13.1f} {result['worker_rss']:14.1f} {result['worker_uss']:14.1f}")
+    print("=" * 60)
+    print("\n💡 Total PSS = memory the server really uses; worker USS = cost of one more worker")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Quantization Benchmark
+Compares fp32 vs dynamic int8 MarianMT models per language pair:
+latency, model memory and BLEU (via evaluate.py)
+"""
+
+import io
+import os
+import time
+import torch
+
+from inference import (
+    DE_EN_BASE_MODEL,
+    DE_EN_MODEL_PATH,
+    EN_MR_BASE_MODEL,
+    EN_MR_MODEL_PATH,
+    TranslationModel
+)
+from evaluate import DE_EN_TEST_PATH, EN_MR_TEST_PATH, calculate_bleu, load_test_data
+
+# ========================================================
+# Configuration
+# ========================================================
+
+SAMPLE_SIZE = 100     # Sentences used for BLEU
+LATENCY_SAMPLES = 20  # Sentences timed one by one
+
+LANGUAGE_PAIRS = {
+    "de_en": {
+        "model_path": DE_EN_MODEL_PATH,
+        "base_model": DE_EN_BASE_MODEL,
+        "test_path": DE_EN_TEST_PATH,
+        "columns": ["german", "english"]
+    },
+    "en_mr": {
+        "model_path": EN_MR_MODEL_PATH,
+        "base_model": EN_MR_BASE_MODEL,
+        "test_path": EN_MR_TEST_PATH,
+        "columns": ["english", "marathi"]
+    }
+}
+
+FALLBACK_SOURCES = {
+    "de_en": ["Guten Morgen! Wie geht es dir?", "Ich lerne Deutsch.", "Das Wetter ist heute schön."],
+    "en_mr": ["Good morning! How are you?", "I am learning German.", "The weather is nice today."]
+}
+
+# ========================================================
+# Measurements
+# ========================================================
+
+def model_size_mb(model):
+    """
+    Serialized size of the model weights (int8 packed weights included)
+    """
+    buffer = io.BytesIO()
+    torch.save(model.state_dict(), buffer)
+    return buffer.tell() / (1024 * 1024)
+
+def measure_latency(model, sources):
+    """
+    Mean and p95 latency of single-sentence translation (milliseconds)
+    """
+    model.translate(sources[0])  # warm-up
+
+    timings = []
+    for text in sources[:LATENCY_SAMPLES]:
+        start = time.perf_counter()
+        model.translate(text)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+    return {
+        "mean_ms": sum(timings) / len(timings),
+        "p95_ms": timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    }
+
+def benchmark_pair(pair, config):
+    """
+    Benchmark fp32 and int8 for one language pair
+    """
+    print("\n" + "=" * 60)
+    print(f"📊 {pair}")
+    print("=" * 60)
+
+    source_col, target_col = config["columns"]
+    if os.path.exists(config["test_path"]):
+        test_df = load_test_data(config["test_path"], config["columns"], SAMPLE_SIZE)
+        sources = test_df[source_col].tolist()
+        references = test_df[target_col].tolist()
+    else:
+        print(f"⚠️  {config['test_path']} not found, skipping BLEU")
+        sources = FALLBACK_SOURCES[pair]
+        references = None
+
+    results = {}
+    for quantize in (False, True):
+        label = "int8" if quantize else "fp32"
+        model = TranslationModel(
+            config["model_path"], config["base_model"], name=pair, quantize=quantize
+        )
+
+        result = {"size_mb": model_size_mb(model.model)}
+        result.update(measure_latency(model, sources))
+        if references is not None:
+            predictions = model.translate(sources)
+            result["bleu"] = calculate_bleu(predictions, references)["score"]
+
+        results[label] = result
+        del model
+
+    print(f"\n{'':6} {'size MB':>9} {'mean ms':>9} {'p95 ms':>9} {'BLEU':>7}")
+    for label, result in results.items():
+        bleu = f"{result['bleu']:7.2f}" if "bleu" in result else f"{'n/a':>7}"
+        print(
+            f"{label:6} {result['size_mb']:9.1f} {result['mean_ms']:9.1f} "
+            f"{result['p95_ms']:9.1f} {bleu}"
+        )
+
+    fp32, int8 = results["fp32"], results["int8"]
+    print(f"\n✅ int8 speed-up: {fp32['mean_ms'] / int8['mean_ms']:.2f}x, "
+          f"size: {int8['size_mb'] / fp32['size_mb']:.0%} of fp32")
+    if "bleu" in fp32:
+        print(f"   BLEU change: {int8['bleu'] - fp32['bleu']:+.2f}")
+
+    return results
+
+# ========================================================
+# Main
+# ========================================================
+
+def main():
+    """
+    Main benchmark function
+    """
+    print("=" * 60)
+    print("🚀 fp32 vs int8 MarianMT Benchmark")
+    print(f"   torch threads: {torch.get_num_threads()}")
+    print("=" * 60)
+
+    for pair, config in LANGUAGE_PAIRS.items():
+        benchmark_pair(pair, config)
+
+    print("\n💡 Enable int8 per model with DE_EN_QUANTIZE=1 / EN_MR_QUANTIZE=1")
+
+if __name__ == "__main__":
+    main()
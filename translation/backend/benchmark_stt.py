@@ -0,0 +1,149 @@
+"""
+Speech-to-Text Benchmark
+Compares STT backends side by side on test_audio/*.mp3:
+real-time factor (processing time / audio duration) and word error rate
+"""
+
+import re
+import time
+from pathlib import Path
+
+from speech_module import (
+    SAMPLE_RATE,
+    STT_BACKENDS,
+    WHISPER_MODEL_NAME,
+    SpeechToText,
+    decode_audio_bytes
+)
+
+# ========================================================
+# Configuration
+# ========================================================
+
+REPEATS = 3  # Best-of timing per file
+
+# Created by generate_test_audio.py (run from backend/ or the project root)
+TEST_AUDIO_DIRS = [Path("test_audio"), Path("../test_audio")]
+
+# Reference transcripts (same sentences as generate_test_audio.py)
+REFERENCES = {
+    "test_good_morning.mp3": "Guten Morgen, wie geht es dir?",
+    "test_programming.mp3": "Ich liebe Programmierung und Technologie.",
+    "test_weather.mp3": "Das Wetter ist heute sehr schön.",
+    "test_student.mp3": "Mein Name ist Student und ich studiere Informatik.",
+    "test_welcome.mp3": "Willkommen bei der Übersetzungs-App."
+}
+
+# ========================================================
+# Word Error Rate
+# ========================================================
+
+def normalize_words(text):
+    """
+    Lowercase, strip punctuation and split into words
+    """
+    return re.sub(r"[^\w\s]", " ", text.lower()).split()
+
+def word_errors(hypothesis, reference):
+    """
+    Word-level edit distance (substitutions + insertions + deletions)
+    """
+    hyp, ref = normalize_words(hypothesis), normalize_words(reference)
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        current = [i]
+        for j, hyp_word in enumerate(hyp, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word)
+            ))
+        previous = current
+    return previous[-1], len(ref)
+
+# ========================================================
+# Benchmark
+# ========================================================
+
+def load_test_audio():
+    """
+    Decode every reference file found in the test_audio directory
+    """
+    audio_dir = next((path for path in TEST_AUDIO_DIRS if path.is_dir()), None)
+    if audio_dir is None:
+        print("❌ test_audio/ not found. Run: python generate_test_audio.py")
+        return {}
+
+    clips = {}
+    for filename in REFERENCES:
+        path = audio_dir / filename
+        if path.exists():
+            clips[filename] = decode_audio_bytes(path.read_bytes())
+        else:
+            print(f"⚠️  {path} missing, skipped")
+    return clips
+
+def benchmark_backend(backend, clips):
+    """
+    RTF and WER of one backend over all clips
+    """
+    print(f"\n📊 {backend}")
+    try:
+        stt = SpeechToText(WHISPER_MODEL_NAME, backend=backend)
+    except ImportError as e:
+        print(f"⚠️  Skipped: {e}")
+        return None
+
+    stt.transcribe(next(iter(clips.values())), language="de")  # warm-up
+
+    total_audio = total_time = 0.0
+    total_errors = total_words = 0
+    for filename, audio in clips.items():
+        best = float("inf")
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            text = stt.transcribe(audio, language="de")["text"]
+            best = min(best, time.perf_counter() - start)
+
+        errors, words = word_errors(text, REFERENCES[filename])
+        duration = len(audio) / SAMPLE_RATE
+        total_audio += duration
+        total_time += best
+        total_errors += errors
+        total_words += words
+        print(f"   {filename:<24} RTF {best / duration:5.3f}  WER {errors / words:6.1%}  {text}")
+
+    del stt
+    return {"rtf": total_time / total_audio, "wer": total_errors / total_words}
+
+# ========================================================
+# Main
+# ========================================================
+
+def main():
+    """
+    Main benchmark function
+    """
+    print("=" * 60)
+    print(f"🚀 STT Backend Benchmark (model: {WHISPER_MODEL_NAME})")
+    print("=" * 60)
+
+    clips = load_test_audio()
+    if not clips:
+        return
+
+    results = {}
+    for backend in STT_BACKENDS:
+        result = benchmark_backend(backend, clips)
+        if result is not None:
+            results[backend] = result
+
+    print("\n" + "=" * 60)
+    print(f"{'backend':<16} {'RTF':>7} {'WER':>7}")
+    for backend, result in results.items():
+        print(f"{backend:<16} {result['rtf']:7.3f} {result['wer']:7.1%}")
+    print("=" * 60)
+    print("\n💡 Select with STT_BACKEND=whisper|faster-whisper (STT_COMPUTE_TYPE=int8)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Text-to-Speech Benchmark
+Compares TTS backends side by side: model load time, time-to-first-byte
+and total synthesis time per Marathi sentence, plus how paragraph latency
+scales with sentence count (one call vs sentence-parallel synthesis)
+"""
+
+import time
+import tempfile
+
+from speech_module import (
+    TTS_BACKENDS,
+    TTS_LANGUAGE,
+    TTS_SENTENCE_WORKERS,
+    TextToSpeech,
+    create_tts_backend
+)
+
+# ========================================================
+# Configuration
+# ========================================================
+
+REPEATS = 3  # Timings per sentence (all recorded)
+
+PARAGRAPH_SIZES = [1, 2, 4, 8]  # Sentences per paragraph
+
+SENTENCES = [
+    "नमस्कार! तुमचं नाव काय आहे?",
+    "मी जर्मन शिकत आहे.",
+    "आज हवामान खूप छान आहे.",
+    "माझे नाव विद्यार्थी आहे आणि मी संगणक शास्त्राचा अभ्यास करतो.",
+    "भाषांतर अॅपमध्ये आपले स्वागत आहे."
+]
+
+# ========================================================
+# Benchmark
+# ========================================================
+
+def percentile(values, fraction):
+    """
+    Nearest-rank percentile of a list of timings
+    """
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+def time_sentence(backend, text):
+    """
+    Time-to-first-byte, total time (ms) and output size for one sentence
+    """
+    start = time.perf_counter()
+    chunks = backend.stream(text, TTS_LANGUAGE)
+    first = next(chunks)
+    ttfb = (time.perf_counter() - start) * 1000
+    size = len(first) + sum(len(chunk) for chunk in chunks)
+    total = (time.perf_counter() - start) * 1000
+    return ttfb, total, size
+
+def benchmark_backend(name):
+    """
+    TTFB / total latency of one backend over all sentences
+    """
+    print(f"\n📊 {name}")
+    start = time.perf_counter()
+    try:
+        backend = create_tts_backend(name)
+        time_sentence(backend, SENTENCES[0])  # warm-up (also checks network for gTTS)
+    except Exception as e:
+        print(f"⚠️  Skipped: {e}")
+        return None
+    load_seconds = time.perf_counter() - start
+
+    ttfbs, totals = [], []
+    for text in SENTENCES:
+        for _ in range(REPEATS):
+            ttfb, total, size = time_sentence(backend, text)
+            ttfbs.append(ttfb)
+            totals.append(total)
+        print(f"   TTFB {ttfb:7.1f}ms  total {total:7.1f}ms  {size / 1024:6.1f} KB  {text[:30]}")
+
+    benchmark_paragraphs(name)
+
+    return {
+        "load_s": load_seconds,
+        "ttfb_mean": sum(ttfbs) / len(ttfbs),
+        "ttfb_p99": percentile(ttfbs, 0.99),
+        "total_mean": sum(totals) / len(totals)
+    }
+
+def benchmark_paragraphs(name):
+    """
+    Paragraph latency vs sentence count: one backend call vs sentence-parallel
+    """
+    workers = max(2, TTS_SENTENCE_WORKERS)
+    print(f"\n   Paragraphs (cache off): 1 call vs {workers} sentence workers")
+    with tempfile.TemporaryDirectory() as output_dir:
+        serial = TextToSpeech(output_dir, cache_max_mb=0, backend=name, sentence_workers=1)
+        parallel = TextToSpeech(output_dir, cache_max_mb=0, backend=name, sentence_workers=workers)
+        for size in PARAGRAPH_SIZES:
+            text = " ".join(SENTENCES[i % len(SENTENCES)] for i in range(size))
+            timings = []
+            for tts in (serial, parallel):
+                start = time.perf_counter()
+                tts.synthesize(text, TTS_LANGUAGE)
+                timings.append((time.perf_counter() - start) * 1000)
+            print(f"   {size} sentences: {timings[0]:8.1f}ms → {timings[1]:8.1f}ms "
+                  f"({timings[0] / timings[1]:.2f}x)")
+
+# ========================================================
+# Main
+# ========================================================
+
+def main():
+    """
+    Main benchmark function
+    """
+    print("=" * 60)
+    print("🚀 TTS Backend Benchmark")
+    print("=" * 60)
+
+    results = {}
+    for name in TTS_BACKENDS:
+        result = benchmark_backend(name)
+        if result is not None:
+            results[name] = result
+
+    print("\n" + "=" * 60)
+    print(f"{'backend':<8} {'load s':>8} {'TTFB ms':>9} {'p99 ms':>9} {'total ms':>9}")
+    for name, result in results.items():
+        print(
+            f"{name:<8} {result['load_s']:8.1f} {result['ttfb_mean']:9.1f} "
+            f"{result['ttfb_p99']:9.1f} {result['total_mean']:9.1f}"
+        )
+    print("=" * 60)
+    print("\n💡 Select with TTS_BACKEND=gtts|mms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,778 @@
+"""
+Translation Cache Module
+Bounded LRU cache with TTL expiry for MarianMT stage outputs
+Optional SQLite (WAL) store shares entries across workers and restarts
+Content-addressed audio file cache (size-capped LRU) for TTS outputs
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+# ========================================================
+# Configuration
+# ========================================================
+
+# Maximum number of cached translations (0 disables the cache)
+TRANSLATION_CACHE_SIZE = int(os.getenv("TRANSLATION_CACHE_SIZE", "4096"))
+
+# Seconds before an entry expires (0 = never)
+TRANSLATION_CACHE_TTL = float(os.getenv("TRANSLATION_CACHE_TTL", "86400"))
+
+# Persistent store (empty = disabled), e.g. ./cache/translations.db
+TRANSLATION_CACHE_DB = os.getenv("TRANSLATION_CACHE_DB", "")
+
+# Maximum rows kept in the persistent store
+TRANSLATION_CACHE_DB_MAX_ENTRIES = int(os.getenv("TRANSLATION_CACHE_DB_MAX_ENTRIES", "200000"))
+
+# Store reads refresh access times in batches: after this many reads or seconds
+TRANSLATION_CACHE_ACCESS_FLUSH_EVERY = 256
+TRANSLATION_CACHE_ACCESS_FLUSH_SECONDS = 30.0
+
+# Most recently used rows copied into memory at startup
+TRANSLATION_CACHE_WARM_START = int(os.getenv("TRANSLATION_CACHE_WARM_START", "2048"))
+
+# Whole speech-pipeline results (upload digest → texts + audio file) kept in memory
+# (0 disables); they share the persistent store under the stage "speech"
+SPEECH_CACHE_SIZE = int(os.getenv("SPEECH_CACHE_SIZE", "1024"))
+
+# Disk budget for cached TTS audio in audio_outputs/ (0 disables the cache)
+TTS_CACHE_MAX_MB = float(os.getenv("TTS_CACHE_MAX_MB", "512"))
+
+# Index of cached audio files (hidden SQLite database next to the audio,
+# plus its -wal/-shm files)
+TTS_CACHE_INDEX = ".tts_cache_index.db"
+
+# JSON index written by earlier versions (imported once, then removed)
+LEGACY_TTS_CACHE_INDEX = ".tts_cache_index.json"
+
+# Only files named like this are managed (and evicted) by the audio cache
+TTS_CACHE_PREFIX = "tts_"
+TTS_CACHE_EXTENSIONS = (".mp3", ".wav")
+
+# ========================================================
+# Cache Keys
+# ========================================================
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize input text for cache lookups
+    Unicode NFC, collapsed whitespace, stripped ends (case is kept:
+    German capitalization changes meaning)
+
+    Args:
+        text: Raw input text
+
+    Returns:
+        Normalized text
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+def make_cache_key(stage: str, model_id: str, text: str, **generation_params) -> str:
+    """
+    Build the cache key for one stage output
+
+    Args:
+        stage: Pipeline stage (de_en, en_mr)
+        model_id: Identity of the loaded model (path, fine-tuned flag, weights fingerprint)
+        text: Input text (normalized here)
+        **generation_params: generate() settings such as num_beams, max_length
+
+    Returns:
+        SHA-256 hex digest (stable across processes, usable as a DB key)
+    """
+    payload = json.dumps(
+        [stage, model_id, normalize_text(text), sorted(generation_params.items())],
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+# ========================================================
+# Persistent Store (SQLite, WAL mode)
+# ========================================================
+
+class TranslationCacheStore:
+    """
+    SQLite-backed cache store shared by all workers on the host
+    WAL mode lets readers proceed while another worker writes
+
+    Rows expire ttl_seconds after they were written (created_at). Reads do
+    not write: access times are collected in memory and written in one
+    batch, which is all LRU trimming needs.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        max_entries: int = TRANSLATION_CACHE_DB_MAX_ENTRIES,
+        ttl_seconds: float = TRANSLATION_CACHE_TTL
+    ):
+        """
+        Open (or create) the cache database
+
+        Args:
+            db_path: Path to the SQLite file
+            max_entries: Row limit; least recently used rows are evicted
+            ttl_seconds: Row lifetime in seconds (0 = no expiry)
+        """
+        self.db_path = db_path
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl_seconds
+        self._lock = threading.Lock()
+        self._puts_since_trim = 0
+        self._pending_access: Dict[str, float] = {}
+        self._last_access_flush = time.monotonic()
+        self.evictions = 0
+        self.expirations = 0
+
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            db_path,
+            timeout=10,
+            isolation_level=None,  # autocommit
+            check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS translations (
+                key TEXT PRIMARY KEY,
+                stage TEXT NOT NULL,
+                model_id TEXT NOT NULL,
+                value TEXT NOT NULL,
+                accessed_at REAL NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(translations)")]
+        if "created_at" not in columns:
+            # Databases from before TTL support: age rows from their last access
+            self._conn.execute("ALTER TABLE translations ADD COLUMN created_at REAL NOT NULL DEFAULT 0")
+            self._conn.execute("UPDATE translations SET created_at = accessed_at")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_translations_created ON translations (created_at)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_translations_accessed ON translations (accessed_at)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_translations_model ON translations (stage, model_id)"
+        )
+        print(f"✅ Persistent translation cache: {db_path} ({self.count()} entries)")
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        """
+        True if a row written at created_at is past the TTL
+        """
+        return bool(self.ttl) and now - created_at > self.ttl
+
+    def lookup(self, key: str) -> Optional[Tuple[str, float]]:
+        """
+        Look up a live key and note the access (written later in a batch)
+
+        Args:
+            key: Cache key digest
+
+        Returns:
+            (value, created_at wall-clock time) or None if missing or expired
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM translations WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if self._expired(row[1], now):
+                self._conn.execute("DELETE FROM translations WHERE key = ?", (key,))
+                self._pending_access.pop(key, None)
+                self.expirations += 1
+                return None
+            self._pending_access[key] = now
+            if (
+                len(self._pending_access) >= TRANSLATION_CACHE_ACCESS_FLUSH_EVERY or
+                time.monotonic() - self._last_access_flush >= TRANSLATION_CACHE_ACCESS_FLUSH_SECONDS
+            ):
+                self._flush_access()
+            return row[0], row[1]
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a live key
+
+        Args:
+            key: Cache key digest
+
+        Returns:
+            Cached value or None
+        """
+        found = self.lookup(key)
+        return found[0] if found is not None else None
+
+    def _flush_access(self):
+        """
+        Write collected access times in one transaction (lock held)
+        """
+        self._last_access_flush = time.monotonic()
+        if not self._pending_access:
+            return
+        pending = [(accessed_at, key) for key, accessed_at in self._pending_access.items()]
+        self._pending_access.clear()
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.executemany(
+                "UPDATE translations SET accessed_at = ? WHERE key = ?", pending
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def flush(self):
+        """
+        Write pending access times now (e.g. at shutdown)
+        """
+        with self._lock:
+            self._flush_access()
+
+    def put(self, key: str, value: str, stage: str, model_id: str):
+        """
+        Store a value and trim the table when it outgrows the limit
+
+        Args:
+            key: Cache key digest
+            value: Translation
+            stage: Pipeline stage (for invalidation)
+            model_id: Model identity (for invalidation)
+        """
+        with self._lock:
+            now = time.time()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO translations (key, stage, model_id, value, accessed_at, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, stage, model_id, value, now, now)
+            )
+            self._pending_access.pop(key, None)
+            # Counting rows on every put is wasteful; trim in bulk
+            self._puts_since_trim += 1
+            if self._puts_since_trim >= 256:
+                self._puts_since_trim = 0
+                self._trim()
+
+    def _trim(self):
+        """
+        Drop expired rows, then evict least recently used rows above the limit (lock held)
+        """
+        self._flush_access()
+        if self.ttl:
+            cursor = self._conn.execute(
+                "DELETE FROM translations WHERE created_at < ?", (time.time() - self.ttl,)
+            )
+            self.expirations += max(0, cursor.rowcount)
+        excess = self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0] - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM translations WHERE key IN "
+                "(SELECT key FROM translations ORDER BY accessed_at ASC LIMIT ?)",
+                (excess,)
+            )
+            self.evictions += excess
+
+    def invalidate_stale(self, stage: str, model_id: str) -> int:
+        """
+        Delete rows produced by a different model for this stage
+
+        Args:
+            stage: Pipeline stage
+            model_id: Identity of the currently loaded model
+
+        Returns:
+            Number of rows removed
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM translations WHERE stage = ? AND model_id != ?",
+                (stage, model_id)
+            )
+            return cursor.rowcount
+
+    def most_recent(self, limit: int, stages: Optional[Sequence[str]] = None):
+        """
+        Most recently used rows, for warm-starting the memory cache
+
+        Args:
+            limit: Maximum number of rows
+            stages: Only rows of these stages (None = all)
+
+        Returns:
+            List of live (key, value, created_at) tuples, most recent last
+        """
+        query = "SELECT key, value, created_at FROM translations WHERE created_at >= ?"
+        params = [time.time() - self.ttl if self.ttl else 0.0]
+        if stages:
+            query += f" AND stage IN ({', '.join('?' * len(stages))})"
+            params.extend(stages)
+        query += " ORDER BY accessed_at DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            self._flush_access()
+            rows = self._conn.execute(query, params).fetchall()
+        return list(reversed(rows))
+
+    def count(self) -> int:
+        """
+        Number of rows in the store
+        """
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+    def stats(self) -> dict:
+        """
+        Store statistics for the health endpoint
+        """
+        return {
+            "path": self.db_path,
+            "entries": self.count(),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
+
+# ========================================================
+# LRU Cache
+# ========================================================
+
+class TranslationCache:
+    """
+    Thread-safe LRU cache with optional TTL expiry
+    Misses fall through to the persistent store when one is attached
+    """
+
+    def __init__(
+        self,
+        max_entries: int = TRANSLATION_CACHE_SIZE,
+        ttl_seconds: float = TRANSLATION_CACHE_TTL,
+        store: Optional[TranslationCacheStore] = None
+    ):
+        """
+        Create cache
+
+        Args:
+            max_entries: Maximum number of entries kept
+            ttl_seconds: Entry lifetime in seconds (0 = no expiry)
+            store: Optional persistent store behind the memory cache
+        """
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl_seconds
+        self.store = store
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.store_hits = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a key and mark it as recently used
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                if self.ttl and time.monotonic() - stored_at > self.ttl:
+                    del self._entries[key]
+                    self.expirations += 1
+                else:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+
+        # Another worker (or an earlier run) may have produced it
+        found = self.store.lookup(key) if self.store is not None else None
+
+        with self._lock:
+            if found is None:
+                self.misses += 1
+                return None
+            value, created_at = found
+            self.hits += 1
+            self.store_hits += 1
+            self._insert(key, value, created_at)
+            return value
+
+    def put(self, key: str, value: Any, stage: str = "", model_id: str = ""):
+        """
+        Store a value, evicting the least recently used entries if full
+
+        Args:
+            key: Cache key
+            value: Value to store
+            stage: Pipeline stage (recorded in the persistent store)
+            model_id: Model identity (recorded in the persistent store)
+        """
+        with self._lock:
+            self._insert(key, value)
+        if self.store is not None:
+            self.store.put(key, value, stage, model_id)
+
+    def _insert(self, key: str, value: Any, created_at: Optional[float] = None):
+        """
+        Insert into the memory LRU (lock held)
+        created_at (wall clock) keeps a stored entry's age, so the TTL counts from its first write
+        """
+        stored_at = time.monotonic()
+        if created_at is not None:
+            stored_at -= max(0.0, time.time() - created_at)
+        self._entries[key] = (stored_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def warm_start(
+        self,
+        limit: int = TRANSLATION_CACHE_WARM_START,
+        stages: Optional[Sequence[str]] = None
+    ) -> int:
+        """
+        Preload the most recently used persistent entries into memory
+
+        Args:
+            limit: Maximum number of entries to load
+            stages: Only entries of these stages (None = all)
+
+        Returns:
+            Number of entries loaded
+        """
+        if self.store is None or limit <= 0:
+            return 0
+        rows = self.store.most_recent(min(limit, self.max_entries), stages)
+        with self._lock:
+            for key, value, created_at in rows:
+                self._insert(key, value, created_at)
+        return len(rows)
+
+    def clear(self):
+        """
+        Drop all entries (counters are kept)
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Cache statistics for the health endpoint
+
+        Returns:
+            Dictionary with size, limits and hit/miss counters
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "store_hits": self.store_hits,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "store": self.store.stats() if self.store is not None else None
+            }
+
+# ========================================================
+# Audio File Cache
+# ========================================================
+
+class AudioFileCache:
+    """
+    Size-capped LRU index over content-addressed audio files
+
+    Files are named from a stable digest of their input (see make_cache_key),
+    so any worker or restart that needs the same audio finds it on disk.
+    The index (size and last use per file) is a SQLite table next to the
+    audio, written row by row, so workers sharing the directory add to one
+    index instead of overwriting each other's. Lookups batch their
+    access-time writes like TranslationCacheStore.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = int(TTS_CACHE_MAX_MB * 1024 * 1024),
+        index_name: str = TTS_CACHE_INDEX
+    ):
+        """
+        Open (or build) the index for a directory
+
+        Args:
+            directory: Directory holding the audio files
+            max_bytes: Total size kept before least recently used files are deleted
+            index_name: Index database name inside `directory`
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max(0, max_bytes)
+        self.index_path = self.directory / index_name
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        self._pending_access: Dict[str, Tuple[float, int]] = {}
+        self._last_access_flush = time.monotonic()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # Files this returns True for are never evicted (e.g. being downloaded)
+        self.is_protected: Optional[Callable[[str], bool]] = None
+
+        with self._lock:
+            self._reconcile()
+            self._evict()
+
+    @staticmethod
+    def is_managed(filename: str) -> bool:
+        """
+        True for file names the cache owns
+        """
+        return filename.startswith(TTS_CACHE_PREFIX) and filename.endswith(TTS_CACHE_EXTENSIONS)
+
+    def _db(self) -> sqlite3.Connection:
+        """
+        Connection for this process (lock held)
+
+        The cache can be created before serve.py forks its workers, and a
+        SQLite connection must not cross fork(): each process opens its own.
+        """
+        if self._conn is None or self._conn_pid != os.getpid():
+            self._conn = sqlite3.connect(
+                str(self.index_path),
+                timeout=10,
+                isolation_level=None,  # autocommit
+                check_same_thread=False
+            )
+            self._conn_pid = os.getpid()
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS audio_files (
+                    filename TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_audio_files_accessed ON audio_files (accessed_at)"
+            )
+        return self._conn
+
+    def _reconcile(self):
+        """
+        Add files on disk the index does not know (written before a crash, or
+        listed in the old JSON index) and drop rows whose file is gone (lock held)
+        """
+        db = self._db()
+        legacy_path = self.directory / LEGACY_TTS_CACHE_INDEX
+        try:
+            legacy = json.loads(legacy_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            legacy = {}
+
+        on_disk = {
+            path.name: path.stat()
+            for path in self.directory.iterdir()
+            if path.is_file() and self.is_managed(path.name)
+        }
+        indexed = {filename for (filename,) in db.execute("SELECT filename FROM audio_files")}
+
+        db.execute("BEGIN")
+        try:
+            db.executemany(
+                "INSERT OR IGNORE INTO audio_files (filename, size, accessed_at) VALUES (?, ?, ?)",
+                [
+                    (filename, stat.st_size, (legacy.get(filename) or {}).get("accessed_at", stat.st_mtime))
+                    for filename, stat in on_disk.items() if filename not in indexed
+                ]
+            )
+            db.executemany(
+                "DELETE FROM audio_files WHERE filename = ?",
+                [(filename,) for filename in indexed - set(on_disk)]
+            )
+            db.execute("COMMIT")
+        except Exception:
+            db.execute("ROLLBACK")
+            raise
+        legacy_path.unlink(missing_ok=True)
+
+    def _flush_access(self):
+        """
+        Write collected access times in one transaction (lock held)
+
+        Upserts, so files another worker wrote without indexing them yet are adopted.
+        """
+        self._last_access_flush = time.monotonic()
+        if not self._pending_access:
+            return
+        pending = [
+            (filename, size, accessed_at)
+            for filename, (accessed_at, size) in self._pending_access.items()
+        ]
+        self._pending_access.clear()
+        db = self._db()
+        db.execute("BEGIN")
+        try:
+            db.executemany(
+                "INSERT INTO audio_files (filename, size, accessed_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(filename) DO UPDATE SET accessed_at = max(accessed_at, excluded.accessed_at)",
+                pending
+            )
+            db.execute("COMMIT")
+        except Exception:
+            db.execute("ROLLBACK")
+            raise
+
+    def _total_bytes(self) -> int:
+        """
+        Size of all indexed files (lock held)
+        """
+        return self._db().execute("SELECT COALESCE(SUM(size), 0) FROM audio_files").fetchone()[0]
+
+    def _evict(self, keep: Optional[str] = None):
+        """
+        Delete least recently used files until under budget (lock held)
+        """
+        self._flush_access()
+        db = self._db()
+        excess = self._total_bytes() - self.max_bytes
+        if excess <= 0:
+            return
+        for filename, size in db.execute(
+            "SELECT filename, size FROM audio_files ORDER BY accessed_at ASC"
+        ).fetchall():
+            if excess <= 0:
+                break
+            if filename == keep or (self.is_protected is not None and self.is_protected(filename)):
+                continue
+            db.execute("DELETE FROM audio_files WHERE filename = ?", (filename,))
+            (self.directory / filename).unlink(missing_ok=True)
+            excess -= size
+            self.evictions += 1
+
+    def get(self, filename: str) -> Optional[str]:
+        """
+        Path of a cached file (marked as recently used), or None
+
+        Args:
+            filename: Content-addressed file name
+
+        Returns:
+            Path to the file, or None on a miss
+        """
+        path = self.directory / filename
+        with self._lock:
+            try:
+                size = path.stat().st_size
+            except FileNotFoundError:
+                self._pending_access.pop(filename, None)
+                self._db().execute("DELETE FROM audio_files WHERE filename = ?", (filename,))
+                self.misses += 1
+                return None
+
+            self._pending_access[filename] = (time.time(), size)
+            if (
+                len(self._pending_access) >= TRANSLATION_CACHE_ACCESS_FLUSH_EVERY or
+                time.monotonic() - self._last_access_flush >= TRANSLATION_CACHE_ACCESS_FLUSH_SECONDS
+            ):
+                self._flush_access()
+            self.hits += 1
+            return str(path)
+
+    def put(self, filename: str):
+        """
+        Record a newly written file and evict to stay within budget
+
+        Args:
+            filename: File name inside the cache directory
+        """
+        size = (self.directory / filename).stat().st_size
+        with self._lock:
+            self._pending_access.pop(filename, None)
+            self._db().execute(
+                "INSERT OR REPLACE INTO audio_files (filename, size, accessed_at) VALUES (?, ?, ?)",
+                (filename, size, time.time())
+            )
+            self._evict(keep=filename)
+
+    def last_access(self, filename: str) -> Optional[float]:
+        """
+        Last time a file was written or looked up by any worker (None if not indexed)
+        """
+        with self._lock:
+            pending = self._pending_access.get(filename)
+            row = self._db().execute(
+                "SELECT accessed_at FROM audio_files WHERE filename = ?", (filename,)
+            ).fetchone()
+        times = [value for value in (pending[0] if pending else None, row[0] if row else None) if value is not None]
+        return max(times) if times else None
+
+    def discard(self, filename: str):
+        """
+        Delete a file and drop it from the index (used by the audio janitor)
+
+        Args:
+            filename: File name inside the cache directory
+        """
+        with self._lock:
+            self._pending_access.pop(filename, None)
+            self._db().execute("DELETE FROM audio_files WHERE filename = ?", (filename,))
+            (self.directory / filename).unlink(missing_ok=True)
+
+    def flush(self):
+        """
+        Write pending recency updates from lookups (after sweeps and at shutdown)
+        """
+        with self._lock:
+            self._flush_access()
+
+    def stats(self) -> dict:
+        """
+        Cache statistics for the health endpoint
+
+        Returns:
+            Dictionary with size, limits and hit/miss counters
+        """
+        with self._lock:
+            files, total_bytes = self._db().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM audio_files"
+            ).fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "files": files,
+                "bytes": total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions
+            }
@@ -0,0 +1,137 @@
+"""
+Cascade Execution Module
+Runs the DE→EN and EN→MR stages over many sentences, either one stage
+after the other (sequential) or overlapped chunk by chunk (pipelined)
+"""
+
+import os
+import asyncio
+from typing import Awaitable, Callable, List, Optional, Sequence
+
+# ========================================================
+# Configuration
+# ========================================================
+
+# Sentences handed from one stage to the next at a time
+PIPELINE_CHUNK_SIZE = int(os.getenv("PIPELINE_CHUNK_SIZE", "16"))
+
+# Finished DE→EN chunks allowed to wait for the EN→MR stage
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "2"))
+
+# A stage maps a list of input texts to a list of translations
+Stage = Callable[[List[str]], Awaitable[List[str]]]
+
+# ========================================================
+# Helpers
+# ========================================================
+
+def _combine(german_texts: List[str], english_texts: List[str], marathi_texts: List[str]) -> List[dict]:
+    """
+    Zip the three stages into per-sentence result dictionaries
+    """
+    return [
+        {"german": german, "english": english, "marathi": marathi}
+        for german, english, marathi in zip(german_texts, english_texts, marathi_texts)
+    ]
+
+# ========================================================
+# Sequential Mode
+# ========================================================
+
+async def run_sequential(german_texts: List[str], de_en_stage: Stage, en_mr_stage: Stage) -> List[dict]:
+    """
+    Run DE→EN over all sentences, then EN→MR over all sentences
+
+    Args:
+        german_texts: German input sentences
+        de_en_stage: Async German → English stage
+        en_mr_stage: Async English → Marathi stage
+
+    Returns:
+        List of dictionaries with all translation stages (input order)
+    """
+    english_texts = await de_en_stage(list(german_texts))
+    marathi_texts = await en_mr_stage(english_texts)
+    return _combine(german_texts, english_texts, marathi_texts)
+
+# ========================================================
+# Pipelined Mode
+# ========================================================
+
+async def run_pipelined(
+    german_texts: List[str],
+    de_en_stage: Stage,
+    en_mr_stage: Stage,
+    chunk_size: int = PIPELINE_CHUNK_SIZE,
+    queue_size: int = PIPELINE_QUEUE_SIZE,
+    lengths: Optional[Sequence[int]] = None
+) -> List[dict]:
+    """
+    Overlap the two stages: EN→MR works on chunk N while DE→EN works on chunk N+1
+
+    Each stage runs in its own worker task; a bounded queue between them
+    applies back-pressure so DE→EN cannot run arbitrarily far ahead.
+    Real overlap needs the stages to run on different executors.
+
+    Chunks are cut in input order, so a model only buckets by length within a
+    chunk. Pass `lengths` to sort the sentences first: every chunk then holds
+    similar lengths and pads little, and results still come back in input order.
+
+    Args:
+        german_texts: German input sentences
+        de_en_stage: Async German → English stage
+        en_mr_stage: Async English → Marathi stage
+        chunk_size: Sentences per chunk
+        queue_size: Maximum chunks waiting between the stages
+        lengths: Optional source token length per sentence
+
+    Returns:
+        List of dictionaries with all translation stages (input order)
+    """
+    if lengths is not None:
+        order = sorted(range(len(german_texts)), key=lambda i: lengths[i])
+        ordered = await run_pipelined(
+            [german_texts[i] for i in order], de_en_stage, en_mr_stage, chunk_size, queue_size
+        )
+        results: List[dict] = [None] * len(german_texts)
+        for i, result in zip(order, ordered):
+            results[i] = result
+        return results
+
+    chunk_size = max(1, chunk_size)
+    english_texts: List[str] = [""] * len(german_texts)
+    marathi_texts: List[str] = [""] * len(german_texts)
+    handoff: asyncio.Queue = asyncio.Queue(maxsize=max(1, queue_size))
+
+    async def de_en_worker():
+        for start in range(0, len(german_texts), chunk_size):
+            chunk = list(german_texts[start:start + chunk_size])
+            translated = await de_en_stage(chunk)
+            english_texts[start:start + len(translated)] = translated
+            await handoff.put((start, translated))
+        await handoff.put(None)  # no more chunks
+
+    async def en_mr_worker():
+        while True:
+            item = await handoff.get()
+            if item is None:
+                return
+            start, chunk = item
+            translated = await en_mr_stage(chunk)
+            marathi_texts[start:start + len(translated)] = translated
+
+    workers = [
+        asyncio.ensure_future(de_en_worker()),
+        asyncio.ensure_future(en_mr_worker())
+    ]
+    try:
+        await asyncio.gather(*workers)
+    except BaseException:
+        # One stage failed: stop the other instead of leaving it blocked on the queue
+        for worker in workers:
+            worker.cancel()
+        # Wait for the cancellations so no stage task outlives this call
+        await asyncio.gather(*workers, return_exceptions=True)
+        raise
+
+    return _combine(german_texts, english_texts, marathi_texts)
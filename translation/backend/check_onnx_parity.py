@@ -0,0 +1,107 @@
+"""
+ONNX Parity Check
+Compares ONNX Runtime and PyTorch translations (greedy and beam search)
+Exits with status 1 if any sentence differs beyond the tolerance
+"""
+
+import sys
+from difflib import SequenceMatcher
+
+from inference import (
+    DE_EN_BASE_MODEL,
+    DE_EN_MODEL_PATH,
+    EN_MR_BASE_MODEL,
+    EN_MR_MODEL_PATH,
+    OnnxTranslationModel,
+    TranslationModel
+)
+
+# ========================================================
+# Configuration
+# ========================================================
+
+# Minimum character-level similarity between the two outputs (1.0 = identical)
+PARITY_TOLERANCE = 0.95
+
+# Decoding settings to compare: greedy and beam search
+DECODING_SETTINGS = [
+    {"num_beams": 1},
+    {"num_beams": 4}
+]
+
+TEST_SENTENCES = {
+    "de_en": [
+        "Guten Morgen! Wie geht es dir?",
+        "Ich lerne Deutsch.",
+        "Das Wetter ist heute schön.",
+        "Mein Name ist Student und ich studiere Informatik.",
+        "Die Konferenz wurde wegen des schlechten Wetters auf nächste Woche verschoben."
+    ],
+    "en_mr": [
+        "Good morning! How are you?",
+        "I am learning German.",
+        "The weather is nice today.",
+        "My name is Student and I study computer science.",
+        "The conference was postponed to next week because of the bad weather."
+    ]
+}
+
+MODELS = [
+    ("de_en", DE_EN_MODEL_PATH, DE_EN_BASE_MODEL),
+    ("en_mr", EN_MR_MODEL_PATH, EN_MR_BASE_MODEL)
+]
+
+# ========================================================
+# Parity Check
+# ========================================================
+
+def check_model(name, model_path, base_model):
+    """
+    Compare both backends for one model
+
+    Returns:
+        Number of sentences below the tolerance
+    """
+    print("\n" + "=" * 60)
+    print(f"🔍 {name}")
+    print("=" * 60)
+
+    reference = TranslationModel(model_path, base_model, name=name)
+    candidate = OnnxTranslationModel(model_path, base_model, name=name)
+    sentences = TEST_SENTENCES[name]
+    failures = 0
+
+    for settings in DECODING_SETTINGS:
+        expected = reference.translate(sentences, **settings)
+        actual = candidate.translate(sentences, **settings)
+        exact = 0
+
+        for source, want, got in zip(sentences, expected, actual):
+            similarity = SequenceMatcher(None, want, got).ratio()
+            exact += want == got
+            if similarity < PARITY_TOLERANCE:
+                failures += 1
+                print(f"❌ num_beams={settings['num_beams']} similarity={similarity:.3f}")
+                print(f"   Source:  {source}")
+                print(f"   PyTorch: {want}")
+                print(f"   ONNX:    {got}")
+
+        print(f"✅ num_beams={settings['num_beams']}: {exact}/{len(sentences)} identical")
+
+    return failures
+
+def main():
+    """
+    Run the parity check for both models
+    """
+    failures = sum(check_model(*model) for model in MODELS)
+
+    print("\n" + "=" * 60)
+    if failures:
+        print(f"❌ {failures} translations outside tolerance ({PARITY_TOLERANCE})")
+        sys.exit(1)
+    print(f"✅ ONNX matches PyTorch within tolerance ({PARITY_TOLERANCE})")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
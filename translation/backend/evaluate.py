@@ -4,7 +4,7 @@ Evaluates translation quality using BLEU metrics
 """
 
 import pandas as pd
-import evaluate
+import sacrebleu
 from inference import TranslationPipeline
 from tqdm import tqdm
 
@@ -60,17 +60,15 @@ def calculate_bleu(predictions, references):
     Returns:
         BLEU score dictionary
     """
-    bleu_metric = evaluate.load("sacrebleu")
-    
-    # Format references (each reference needs to be in a list)
-    formatted_refs = [[ref] for ref in references]
-    
-    result = bleu_metric.compute(
-        predictions=predictions,
-        references=formatted_refs
-    )
-    
-    return result
+    # sacrebleu is called directly: this file is itself named "evaluate",
+    # so `import evaluate` here would import this module, not HuggingFace's
+    bleu = sacrebleu.corpus_bleu(predictions, [references])
+    
+    return {
+        "score": bleu.score,
+        "precisions": bleu.precisions,
+        "bp": bleu.bp
+    }
 
 # ========================================================
 # Evaluate German → English
@@ -0,0 +1,151 @@
+"""
+Inference Executor Module
+Runs blocking model calls (Whisper, MarianMT, TTS) in bounded thread pools
+so the asyncio event loop keeps serving /health, /audio and other requests
+"""
+
+import os
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+# ========================================================
+# Configuration
+# ========================================================
+
+# Concurrency limit per model (threads running that model at once)
+WHISPER_WORKERS = int(os.getenv("WHISPER_WORKERS", "1"))
+DE_EN_WORKERS = int(os.getenv("DE_EN_WORKERS", "1"))
+EN_MR_WORKERS = int(os.getenv("EN_MR_WORKERS", "1"))
+# 0 = the TTS backend's own default, passed to create_executors() by the app
+TTS_WORKERS = int(os.getenv("TTS_WORKERS", "0"))
+
+# Jobs allowed to wait per executor before new ones are rejected (0 = unbounded)
+INFERENCE_MAX_QUEUE = int(os.getenv("INFERENCE_MAX_QUEUE", "64"))
+
+# ========================================================
+# Errors
+# ========================================================
+
+class ExecutorBusyError(RuntimeError):
+    """
+    Raised when an executor's wait queue is full
+    """
+    pass
+
+# ========================================================
+# Executor
+# ========================================================
+
+class InferenceExecutor:
+    """
+    Bounded thread pool for one model with queue-depth accounting
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int = INFERENCE_MAX_QUEUE):
+        """
+        Create executor
+
+        Args:
+            name: Model name (used in stats and thread names)
+            max_workers: Number of calls that may run concurrently
+            max_queue: Number of calls that may wait (0 = unbounded)
+        """
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max_queue
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix=f"infer-{name}"
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+        self._rejected = 0
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking call in this executor and await its result
+
+        Args:
+            fn: Blocking function to call
+            *args, **kwargs: Arguments passed to fn
+
+        Returns:
+            Whatever fn returns
+
+        Raises:
+            ExecutorBusyError: If the wait queue is full
+        """
+        with self._lock:
+            if self.max_queue and self._queued >= self.max_queue:
+                self._rejected += 1
+                raise ExecutorBusyError(f"{self.name} executor is busy, try again later")
+            self._queued += 1
+
+        def _call():
+            with self._lock:
+                self._queued -= 1
+                self._active += 1
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self._active -= 1
+                    self._completed += 1
+
+        def _on_done(future):
+            # A job cancelled before it started never ran _call()
+            if future.cancelled():
+                with self._lock:
+                    self._queued -= 1
+
+        future = self._pool.submit(_call)
+        future.add_done_callback(_on_done)
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> dict:
+        """
+        Current load of this executor
+
+        Returns:
+            Dictionary with worker limit, queue depth and counters
+        """
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "active": self._active,
+                "queued": self._queued,
+                "completed": self._completed,
+                "rejected": self._rejected
+            }
+
+    def shutdown(self):
+        """
+        Stop accepting work; running calls finish in the background
+        """
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+# ========================================================
+# Executor Set
+# ========================================================
+
+def create_executors(tts_workers: int = 4) -> Dict[str, InferenceExecutor]:
+    """
+    Create one executor per model
+
+    Args:
+        tts_workers: TTS threads unless TTS_WORKERS is set (depends on the backend)
+
+    Returns:
+        Dictionary: whisper, de_en, en_mr, tts → InferenceExecutor
+    """
+    return {
+        "whisper": InferenceExecutor("whisper", WHISPER_WORKERS),
+        "de_en": InferenceExecutor("de_en", DE_EN_WORKERS),
+        "en_mr": InferenceExecutor("en_mr", EN_MR_WORKERS),
+        "tts": InferenceExecutor("tts", TTS_WORKERS or tts_workers)
+    }
@@ -0,0 +1,94 @@
+"""
+ONNX Export Script
+Converts the MarianMT models into ONNX Runtime format for CPU inference
+Exports encoder, decoder and decoder-with-past (cached key/values) graphs
+"""
+
+import os
+import json
+from transformers import MarianTokenizer
+
+from inference import (
+    DE_EN_BASE_MODEL,
+    DE_EN_MODEL_PATH,
+    EN_MR_BASE_MODEL,
+    EN_MR_MODEL_PATH,
+    ONNX_EXPORT_INFO,
+    model_fingerprint,
+    onnx_model_path
+)
+
+# ========================================================
+# Configuration
+# ========================================================
+
+MODELS = [
+    ("de_en", DE_EN_MODEL_PATH, DE_EN_BASE_MODEL),
+    ("en_mr", EN_MR_MODEL_PATH, EN_MR_BASE_MODEL)
+]
+
+# ========================================================
+# Export
+# ========================================================
+
+def export_model(name, model_path, base_model):
+    """
+    Export one model to <model_path>_onnx
+
+    Args:
+        name: Stage name
+        model_path: Path to fine-tuned model
+        base_model: HuggingFace base model name (used if no fine-tuned weights)
+
+    Returns:
+        Output directory
+    """
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+
+    # Same fallback rule as TranslationModel
+    source = model_path if (
+        os.path.exists(os.path.join(model_path, "model.safetensors")) or
+        os.path.exists(os.path.join(model_path, "pytorch_model.bin"))
+    ) else base_model
+    output_dir = onnx_model_path(model_path)
+
+    print(f"\n📦 Exporting {name}: {source} → {output_dir}")
+
+    # use_cache=True exports decoder_with_past so beam/greedy decoding
+    # reuses key/value states instead of re-running the full decoder
+    model = ORTModelForSeq2SeqLM.from_pretrained(source, export=True, use_cache=True)
+    model.save_pretrained(output_dir)
+    MarianTokenizer.from_pretrained(source).save_pretrained(output_dir)
+
+    # Lets OnnxTranslationModel detect an export older than the weights
+    with open(os.path.join(output_dir, ONNX_EXPORT_INFO), "w") as f:
+        json.dump({"source": source, "fingerprint": model_fingerprint(source)}, f, indent=2)
+
+    print(f"✅ Exported {name} to {output_dir}")
+    return output_dir
+
+def main():
+    """
+    Export both translation models
+    """
+    print("=" * 60)
+    print("🚀 Exporting MarianMT models to ONNX")
+    print("=" * 60)
+
+    try:
+        import optimum.onnxruntime  # noqa: F401
+    except ImportError:
+        print("❌ optimum not installed. Run: pip install optimum[onnxruntime]")
+        return
+
+    for name, model_path, base_model in MODELS:
+        export_model(name, model_path, base_model)
+
+    print("\n" + "=" * 60)
+    print("✅ Export complete")
+    print("   Verify with:  python check_onnx_parity.py")
+    print("   Serve with:   TRANSLATION_BACKEND=onnx uvicorn app:app")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
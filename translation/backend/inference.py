@@ -5,9 +5,22 @@ Uses fine-tuned MarianMT models or base models as fallback
 """
 
 import os
+import json
+import time
+import hashlib
+import itertools
 import torch
-from transformers import MarianMTModel, MarianTokenizer
-from typing import List, Union
+from safetensors import safe_open
+from transformers import GenerationConfig, MarianConfig, MarianMTModel, MarianTokenizer
+from typing import List, Optional, Union
+
+from cache import (
+    TRANSLATION_CACHE_DB,
+    TRANSLATION_CACHE_SIZE,
+    TranslationCache,
+    TranslationCacheStore,
+    make_cache_key
+)
 
 # ========================================================
 # Configuration
@@ -19,10 +32,144 @@ DE_EN_BASE_MODEL = "Helsinki-NLP/opus-mt-de-en"
 EN_MR_BASE_MODEL = "Helsinki-NLP/opus-mt-en-mr"
 MAX_LENGTH = 128
 
+# Sentences per generate() call when translating long lists
+TRANSLATION_BATCH_SIZE = int(os.getenv("TRANSLATION_BATCH_SIZE", "32"))
+
+# Dynamic int8 quantization of Linear layers, per model ("1" to enable)
+DE_EN_QUANTIZE = os.getenv("DE_EN_QUANTIZE", "0").lower() in ("1", "true", "yes")
+EN_MR_QUANTIZE = os.getenv("EN_MR_QUANTIZE", "0").lower() in ("1", "true", "yes")
+
+# Load fine-tuned safetensors weights memory-mapped into a meta-device model
+# (no random init, no second copy); "0" = always use from_pretrained()
+TRANSLATION_FAST_LOAD = os.getenv("TRANSLATION_FAST_LOAD", "1").lower() in ("1", "true", "yes")
+
+# Cold-start budget per model in seconds: slower loads are flagged in the log
+MODEL_LOAD_BUDGET = float(os.getenv("MODEL_LOAD_BUDGET", "20"))
+
+# Extra tokens allowed on top of a length-derived budget
+LENGTH_BUDGET_MARGIN = 8
+
+# Decoding profiles: generate() settings per stage
+# "fast" decodes the intermediate English greedily; it is only fed to EN→MR
+DECODING_PROFILES = {
+    "quality": {
+        "de_en": {"num_beams": 4, "length_ratio": None},
+        "en_mr": {"num_beams": 4, "length_ratio": None}
+    },
+    "balanced": {
+        "de_en": {"num_beams": 2, "length_ratio": 2.0},
+        "en_mr": {"num_beams": 4, "length_ratio": 2.0}
+    },
+    "fast": {
+        "de_en": {"num_beams": 1, "length_ratio": 1.5},
+        "en_mr": {"num_beams": 2, "length_ratio": 2.0}
+    },
+    "greedy": {
+        "de_en": {"num_beams": 1, "length_ratio": 1.5},
+        "en_mr": {"num_beams": 1, "length_ratio": 2.0}
+    }
+}
+DEFAULT_DECODING_PROFILE = os.getenv("DECODING_PROFILE", "quality")
+
+# Inference backend: "pytorch" (default) or "onnx" (run export_onnx.py first)
+TRANSLATION_BACKEND = os.getenv("TRANSLATION_BACKEND", "pytorch").lower()
+
+# Exported ONNX models live next to the PyTorch ones: <model_path>_onnx
+ONNX_SUFFIX = "_onnx"
+ONNX_EXPORT_INFO = "export_info.json"
+
 # Force CPU to avoid RTX 5060 sm_120 incompatibility
 device = torch.device("cpu")
 print(f"⚠️  Using CPU (RTX 5060 GPU incompatible with PyTorch)")
 
+# ========================================================
+# Decoding Profiles
+# ========================================================
+
+def resolve_decoding(
+    profile: Optional[str] = None,
+    num_beams: Optional[int] = None
+) -> dict:
+    """
+    Resolve a profile name (and optional beam override) to per-stage settings
+    
+    Args:
+        profile: Name from DECODING_PROFILES (None = default profile)
+        num_beams: Beam count applied to both stages (overrides the profile)
+        
+    Returns:
+        Dictionary: de_en, en_mr → translate() keyword arguments
+        
+    Raises:
+        ValueError: Unknown profile or invalid beam count
+    """
+    profile = profile or DEFAULT_DECODING_PROFILE
+    if profile not in DECODING_PROFILES:
+        raise ValueError(
+            f"Unknown decoding profile '{profile}'. Options: {list(DECODING_PROFILES)}"
+        )
+    if num_beams is not None and num_beams < 1:
+        raise ValueError("num_beams must be at least 1")
+    
+    decoding = {stage: dict(settings) for stage, settings in DECODING_PROFILES[profile].items()}
+    if num_beams is not None:
+        for settings in decoding.values():
+            settings["num_beams"] = num_beams
+    return decoding
+
+def length_budget(source_tokens: int, max_length: int, length_ratio: Optional[float]) -> dict:
+    """
+    Output length limit for one generate() call
+    
+    Args:
+        source_tokens: (Padded) source length of the batch
+        max_length: Hard cap on output tokens
+        length_ratio: Output tokens per source token (None = max_length only)
+        
+    Returns:
+        generate() keyword arguments: max_new_tokens, or max_length without a ratio
+    """
+    if length_ratio is None:
+        return {"max_length": max_length}
+    return {
+        "max_new_tokens": min(max_length, int(source_tokens * length_ratio) + LENGTH_BUDGET_MARGIN)
+    }
+
+# ========================================================
+# Model Identity
+# ========================================================
+
+# Files whose change means "a different model" for cache purposes
+FINGERPRINT_FILES = [
+    "model.safetensors",
+    "pytorch_model.bin",
+    "config.json",
+    "generation_config.json"
+]
+
+def model_fingerprint(model_path: str) -> str:
+    """
+    Cheap fingerprint of a local model folder (name, size, mtime of weights/config)
+    Re-downloading or re-training the model changes it, which invalidates cached
+    translations without hashing gigabytes of weights
+    
+    Args:
+        model_path: Local model directory
+        
+    Returns:
+        Short hex digest ("hub" for HuggingFace model names)
+    """
+    if not os.path.isdir(model_path):
+        return "hub"
+    
+    digest = hashlib.sha256()
+    for filename in FINGERPRINT_FILES:
+        path = os.path.join(model_path, filename)
+        if os.path.exists(path):
+            stat = os.stat(path)
+            digest.update(f"{filename}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return digest.hexdigest()[:16]
+
 # ========================================================
 # Model Loader
 # ========================================================
@@ -33,14 +180,29 @@ class TranslationModel:
     Automatically falls back to base model if fine-tuned model not available
     """
     
-    def __init__(self, model_path: str, base_model: str):
+    def __init__(
+        self,
+        model_path: str,
+        base_model: str,
+        name: Optional[str] = None,
+        cache: Optional[TranslationCache] = None,
+        quantize: bool = False
+    ):
         """
         Load model and tokenizer from path or fallback to base model
         
         Args:
             model_path: Path to fine-tuned model
             base_model: HuggingFace base model name (fallback)
+            name: Stage name used in cache keys (defaults to folder name)
+            cache: Optional translation cache shared with other stages
+            quantize: Apply dynamic int8 quantization to Linear layers (CPU)
         """
+        self.name = name or os.path.basename(os.path.normpath(model_path))
+        self.model_path = model_path
+        self.cache = cache
+        self.quantized = quantize
+        
         # Check if fine-tuned model exists (check for model.safetensors)
         model_exists = os.path.exists(model_path) and (
             os.path.exists(os.path.join(model_path, "model.safetensors")) or
@@ -57,10 +219,28 @@ class TranslationModel:
             load_path = base_model
             self.is_finetuned = False
         
+        self.load_path = load_path
+        self.fingerprint = model_fingerprint(load_path)
+        
+        started = time.perf_counter()
         self.tokenizer = MarianTokenizer.from_pretrained(load_path)
-        self.model = MarianMTModel.from_pretrained(load_path)
-        self.model.to(device)
-        self.model.eval()  # Set to evaluation mode
+        tokenizer_seconds = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        self.load_method = "from_pretrained"
+        self.model = self._load_model(load_path)
+        weights_seconds = time.perf_counter() - started
+        
+        # Reported per model on /ready
+        self.load_info = {
+            "method": self.load_method,
+            "tokenizer_seconds": round(tokenizer_seconds, 2),
+            "weights_seconds": round(weights_seconds, 2)
+        }
+        print(f"⏱️  {self.name}: weights {weights_seconds:.2f}s ({self.load_method}), "
+              f"tokenizer {tokenizer_seconds:.2f}s")
+        if tokenizer_seconds + weights_seconds > MODEL_LOAD_BUDGET:
+            print(f"⚠️  {self.name} load exceeded the {MODEL_LOAD_BUDGET:.0f}s cold-start budget")
         
         if self.is_finetuned:
             print(f"✅ Fine-tuned model loaded on {device}")
@@ -68,11 +248,116 @@ class TranslationModel:
             print(f"✅ Base model loaded on {device} (will work but not optimized)")
         print(f"   Use this temporarily until you download trained models from Colab")
     
+    backend = "pytorch"
+    
+    def _load_model(self, load_path: str):
+        """
+        Load the PyTorch seq2seq model (overridden by other backends)
+        
+        Args:
+            load_path: Fine-tuned model folder or HuggingFace model name
+            
+        Returns:
+            Model exposing generate()
+        """
+        model = self._fast_load_model(load_path) if TRANSLATION_FAST_LOAD else None
+        if model is None:
+            model = MarianMTModel.from_pretrained(load_path)
+        else:
+            self.load_method = "safetensors-mmap"
+        model.to(device)
+        model.eval()  # Set to evaluation mode
+        
+        if self.quantized:
+            # int8 weights, activations quantized on the fly: ~4x smaller Linear
+            # layers and faster matmuls on CPU; embeddings stay fp32
+            model = torch.ao.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+            print(f"⚡ Applied dynamic int8 quantization to {self.name}")
+        
+        return model
+    
+    def _fast_load_model(self, load_path: str) -> Optional[MarianMTModel]:
+        """
+        Build the model around memory-mapped safetensors weights
+        
+        The module tree is created on the meta device (no memory, no random
+        init), then the tensors of the mmap'd checkpoint replace the meta
+        parameters (assign=True) instead of being copied into freshly
+        initialized ones. Pages are read on first use and shared through the
+        page cache by every process loading the same file.
+        
+        Args:
+            load_path: Fine-tuned model folder
+            
+        Returns:
+            Model, or None when there is no local safetensors checkpoint or it
+            does not fit the model (the caller then uses from_pretrained())
+        """
+        weights_path = os.path.join(load_path, "model.safetensors")
+        if not os.path.isfile(weights_path):
+            return None
+        
+        try:
+            config = MarianConfig.from_pretrained(load_path)
+            with torch.device("meta"):
+                model = MarianMTModel(config)
+            
+            with safe_open(weights_path, framework="pt", device="cpu") as f:
+                state_dict = {key: f.get_tensor(key) for key in f.keys()}
+            _, unexpected = model.load_state_dict(state_dict, strict=False, assign=True)
+            if unexpected:
+                raise ValueError(f"unexpected weights {unexpected[:3]}")
+            
+            # Shared embeddings / LM head are saved once; positional tables not at all
+            model.tie_weights()
+            self._materialize_positions(model)
+            
+            still_meta = [
+                name for name, tensor in itertools.chain(model.named_parameters(), model.named_buffers())
+                if tensor.is_meta
+            ]
+            if still_meta:
+                raise ValueError(f"weights missing from checkpoint: {still_meta[:3]}")
+            
+            if os.path.exists(os.path.join(load_path, "generation_config.json")):
+                model.generation_config = GenerationConfig.from_pretrained(load_path)
+            return model
+        except Exception as e:
+            print(f"⚠️  Fast load of {self.name} failed ({e}), using from_pretrained()")
+            return None
+    
+    @staticmethod
+    def _materialize_positions(model: MarianMTModel):
+        """
+        Compute the sinusoidal position tables left on the meta device
+        (they are derived from the config, so checkpoints do not store them)
+        """
+        for name, module in list(model.named_modules()):
+            if type(module).__name__.endswith("SinusoidalPositionalEmbedding") and module.weight.is_meta:
+                table = type(module)(module.num_embeddings, module.embedding_dim, module.padding_idx)
+                model._init_weights(table)  # fills the table on versions that do not do it in __init__
+                parent_name, _, attribute = name.rpartition(".")
+                setattr(model.get_submodule(parent_name), attribute, table)
+    
+    @property
+    def model_id(self) -> str:
+        """
+        Identity of the loaded weights (part of every cache key)
+        """
+        precision = "int8" if self.quantized else "fp32"
+        return (
+            f"{self.load_path}|finetuned={self.is_finetuned}|{self.backend}|"
+            f"{precision}|{self.fingerprint}"
+        )
+    
     def translate(
         self, 
         texts: Union[str, List[str]], 
         max_length: int = MAX_LENGTH,
-        num_beams: int = 4
+        num_beams: int = 4,
+        length_ratio: Optional[float] = None
     ) -> Union[str, List[str]]:
         """
         Translate text(s)
@@ -80,7 +365,9 @@ class TranslationModel:
         Args:
             texts: Single text or list of texts to translate
             max_length: Maximum output length
-            num_beams: Number of beams for beam search
+            num_beams: Number of beams for beam search (1 = greedy)
+            length_ratio: If set, cap new tokens at length_ratio × source
+                tokens + LENGTH_BUDGET_MARGIN (still bounded by max_length)
             
         Returns:
             Translated text(s)
@@ -90,6 +377,137 @@ class TranslationModel:
         if single_input:
             texts = [texts]
         
+        if self.cache is None:
+            translations = self._generate(texts, max_length, num_beams, length_ratio)
+        else:
+            translations = self._translate_cached(texts, max_length, num_beams, length_ratio)
+        
+        # Return single string or list based on input
+        return translations[0] if single_input else translations
+    
+    def _translate_cached(
+        self,
+        texts: List[str],
+        max_length: int,
+        num_beams: int,
+        length_ratio: Optional[float]
+    ) -> List[str]:
+        """
+        Serve texts from the cache and generate only the misses
+        
+        Args:
+            texts: List of texts to translate
+            max_length: Maximum output length
+            num_beams: Number of beams for beam search
+            length_ratio: Output token budget per source token (None = max_length only)
+            
+        Returns:
+            Translations in input order
+        """
+        keys = [
+            make_cache_key(
+                self.name, self.model_id, text,
+                max_length=max_length, num_beams=num_beams, length_ratio=length_ratio
+            )
+            for text in texts
+        ]
+        translations = [self.cache.get(key) for key in keys]
+        
+        # Generate each distinct missing input once
+        missing = {}
+        for i, translation in enumerate(translations):
+            if translation is None:
+                missing.setdefault(keys[i], []).append(i)
+        
+        if missing:
+            positions = list(missing.values())
+            generated = self._generate(
+                [texts[indices[0]] for indices in positions],
+                max_length,
+                num_beams,
+                length_ratio
+            )
+            for key, indices, translation in zip(missing.keys(), positions, generated):
+                self.cache.put(key, translation, self.name, self.model_id)
+                for i in indices:
+                    translations[i] = translation
+        
+        return translations
+    
+    def token_lengths(self, texts: List[str], max_length: int = MAX_LENGTH) -> List[int]:
+        """
+        Source token count per text (what generate() pads to within a batch)
+        
+        Args:
+            texts: List of texts
+            max_length: Truncation length
+            
+        Returns:
+            Token counts in input order
+        """
+        return [
+            len(ids) for ids in self.tokenizer(
+                texts, truncation=True, max_length=max_length
+            )["input_ids"]
+        ]
+    
+    def _generate(
+        self,
+        texts: List[str],
+        max_length: int,
+        num_beams: int,
+        length_ratio: Optional[float]
+    ) -> List[str]:
+        """
+        Run the model on a list of texts, bucketed by token length
+        Sorting before chunking keeps similar lengths together, so little
+        compute is wasted on padding inside each generate() call
+        
+        Args:
+            texts: List of texts to translate
+            max_length: Maximum output length
+            num_beams: Number of beams for beam search
+            length_ratio: Output token budget per source token (None = max_length only)
+            
+        Returns:
+            Translations in input order
+        """
+        if len(texts) <= 1:
+            return self._generate_batch(texts, max_length, num_beams, length_ratio)
+        
+        lengths = self.token_lengths(texts, max_length)
+        order = sorted(range(len(texts)), key=lambda i: lengths[i])
+        
+        translations = [None] * len(texts)
+        for start in range(0, len(order), TRANSLATION_BATCH_SIZE):
+            bucket = order[start:start + TRANSLATION_BATCH_SIZE]
+            outputs = self._generate_batch(
+                [texts[i] for i in bucket], max_length, num_beams, length_ratio
+            )
+            for i, translation in zip(bucket, outputs):
+                translations[i] = translation
+        
+        return translations
+    
+    def _generate_batch(
+        self,
+        texts: List[str],
+        max_length: int,
+        num_beams: int,
+        length_ratio: Optional[float]
+    ) -> List[str]:
+        """
+        Run the model on a list of texts (one padded generate() call)
+        
+        Args:
+            texts: List of texts to translate
+            max_length: Maximum output length
+            num_beams: Number of beams for beam search
+            length_ratio: Output token budget per source token (None = max_length only)
+            
+        Returns:
+            Translations in input order
+        """
         # Tokenize
         inputs = self.tokenizer(
             texts,
@@ -99,23 +517,134 @@ class TranslationModel:
             max_length=max_length
         ).to(device)
         
+        generation_kwargs = {"num_beams": num_beams}
+        if num_beams > 1:
+            generation_kwargs["early_stopping"] = True
+        
+        # Budget from the (padded) source length of this batch
+        generation_kwargs.update(length_budget(inputs["input_ids"].shape[1], max_length, length_ratio))
+        
         # Generate translations
         with torch.no_grad():
-            outputs = self.model.generate(
-                **inputs,
-                max_length=max_length,
-                num_beams=num_beams,
-                early_stopping=True
-            )
+            outputs = self.model.generate(**inputs, **generation_kwargs)
         
         # Decode
-        translations = self.tokenizer.batch_decode(
+        return self.tokenizer.batch_decode(
             outputs, 
             skip_special_tokens=True
         )
+
+class OnnxTranslationModel(TranslationModel):
+    """
+    MarianMT running on ONNX Runtime (encoder + decoder-with-past graphs)
+    Same translate() signature as TranslationModel; export with export_onnx.py
+    """
+    
+    backend = "onnx"
+    
+    def _load_model(self, load_path: str):
+        """
+        Load the exported ONNX model for this stage
         
-        # Return single string or list based on input
-        return translations[0] if single_input else translations
+        Args:
+            load_path: Source of the PyTorch weights (used to check export freshness)
+            
+        Returns:
+            ORTModelForSeq2SeqLM exposing generate()
+        """
+        try:
+            from optimum.onnxruntime import ORTModelForSeq2SeqLM
+        except ImportError:
+            raise ImportError(
+                "ONNX backend needs optimum: pip install optimum[onnxruntime]"
+            )
+        
+        onnx_path = onnx_model_path(self.model_path)
+        if not os.path.isdir(onnx_path):
+            raise FileNotFoundError(
+                f"No ONNX export at {onnx_path}. Run: python export_onnx.py"
+            )
+        
+        info_path = os.path.join(onnx_path, ONNX_EXPORT_INFO)
+        if os.path.exists(info_path):
+            with open(info_path) as f:
+                info = json.load(f)
+            if info.get("fingerprint") != self.fingerprint:
+                print(f"⚠️  ONNX export in {onnx_path} is older than {load_path}; re-run export_onnx.py")
+        
+        if self.quantized:
+            print(f"⚠️  Dynamic int8 quantization applies to the PyTorch backend only")
+            self.quantized = False
+        
+        print(f"⚡ Loading ONNX Runtime model from {onnx_path}...")
+        self.load_method = "onnx"
+        return ORTModelForSeq2SeqLM.from_pretrained(onnx_path, use_cache=True)
+
+def onnx_model_path(model_path: str) -> str:
+    """
+    Folder holding the ONNX export of a model
+    
+    Args:
+        model_path: Path to the fine-tuned PyTorch model
+        
+    Returns:
+        Path of the exported model
+    """
+    return os.path.normpath(model_path) + ONNX_SUFFIX
+
+def load_translation_model(
+    model_path: str,
+    base_model: str,
+    backend: str = TRANSLATION_BACKEND,
+    **kwargs
+) -> TranslationModel:
+    """
+    Create a translation model for the configured backend
+    
+    Args:
+        model_path: Path to fine-tuned model
+        base_model: HuggingFace base model name (fallback)
+        backend: "pytorch" or "onnx"
+        **kwargs: Passed to the model class (name, cache, quantize)
+        
+    Returns:
+        TranslationModel (or subclass) instance
+    """
+    if backend == "onnx":
+        return OnnxTranslationModel(model_path, base_model, **kwargs)
+    if backend != "pytorch":
+        raise ValueError(f"Unknown translation backend: {backend}")
+    return TranslationModel(model_path, base_model, **kwargs)
+
+def create_translation_cache() -> Optional[TranslationCache]:
+    """
+    Create the cache shared by both stages (keys include the stage name)
+    
+    Returns:
+        TranslationCache (with persistent store if configured) or None if disabled
+    """
+    if TRANSLATION_CACHE_SIZE <= 0:
+        return None
+    store = TranslationCacheStore(TRANSLATION_CACHE_DB) if TRANSLATION_CACHE_DB else None
+    return TranslationCache(store=store)
+
+def load_de_en_model(cache: Optional[TranslationCache] = None) -> TranslationModel:
+    """
+    Load the German → English model with the configured backend/quantization
+    """
+    return load_translation_model(
+        DE_EN_MODEL_PATH, DE_EN_BASE_MODEL, name="de_en", cache=cache,
+        quantize=DE_EN_QUANTIZE
+    )
+
+def load_en_mr_model(cache: Optional[TranslationCache] = None) -> TranslationModel:
+    """
+    Load the English → Marathi model with the configured backend/quantization
+    """
+    return load_translation_model(
+        EN_MR_MODEL_PATH, EN_MR_BASE_MODEL, name="en_mr", cache=cache,
+        quantize=EN_MR_QUANTIZE
+    )
 
 # ========================================================
 # Pipeline Manager
@@ -126,23 +655,52 @@ class TranslationPipeline:
     Complete translation pipeline: German → English → Marathi
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        de_en_model: Optional[TranslationModel] = None,
+        en_mr_model: Optional[TranslationModel] = None,
+        cache: Optional[TranslationCache] = None
+    ):
         """
         Initialize translation models
+        
+        Args:
+            de_en_model: Already loaded DE→EN model (loaded here if None)
+            en_mr_model: Already loaded EN→MR model (loaded here if None)
+            cache: Cache the preloaded models were created with
         """
         print("=" * 60)
         print("🚀 Initializing Translation Pipeline")
         print("=" * 60)
         print(f"🔧 Device: {device}")
+        print(f"🔧 Backend: {TRANSLATION_BACKEND}")
         print()
         
+        self.cache = cache
+        if de_en_model is None or en_mr_model is None:
+            if self.cache is None:
+                self.cache = create_translation_cache()
+        
         # Load models (with automatic fallback to base models)
-        print("📦 Loading German → English model...")
-        self.de_en_model = TranslationModel(DE_EN_MODEL_PATH, DE_EN_BASE_MODEL)
-        print()
+        if de_en_model is None:
+            print("📦 Loading German → English model...")
+            de_en_model = load_de_en_model(self.cache)
+            print()
+        self.de_en_model = de_en_model
         
-        print("📦 Loading English → Marathi model...")
-        self.en_mr_model = TranslationModel(EN_MR_MODEL_PATH, EN_MR_BASE_MODEL)
+        if en_mr_model is None:
+            print("📦 Loading English → Marathi model...")
+            en_mr_model = load_en_mr_model(self.cache)
+        self.en_mr_model = en_mr_model
+        
+        if self.cache is not None and self.cache.store is not None:
+            # Drop entries from models that have since been replaced, then warm up
+            for model in (self.de_en_model, self.en_mr_model):
+                removed = self.cache.store.invalidate_stale(model.name, model.model_id)
+                if removed:
+                    print(f"🧹 Invalidated {removed} cached {model.name} translations (model changed)")
+            warmed = self.cache.warm_start(stages=(self.de_en_model.name, self.en_mr_model.name))
+            print(f"🔥 Warm-started translation cache with {warmed} entries")
         
         print()
         print("=" * 60)
@@ -154,45 +712,50 @@ class TranslationPipeline:
             print("⚠️  Pipeline ready with BASE models (download trained models soon)")
         print("=" * 60)
     
-    def translate_de_to_en(self, german_text: str) -> str:
+    def translate_de_to_en(self, german_text: str, **decoding) -> str:
         """
         Translate German to English
         
         Args:
             german_text: German input text
+            **decoding: translate() settings (num_beams, max_length, length_ratio)
             
         Returns:
             English translation
         """
-        return self.de_en_model.translate(german_text)
+        return self.de_en_model.translate(german_text, **decoding)
     
-    def translate_en_to_mr(self, english_text: str) -> str:
+    def translate_en_to_mr(self, english_text: str, **decoding) -> str:
         """
         Translate English to Marathi
         
         Args:
             english_text: English input text
+            **decoding: translate() settings (num_beams, max_length, length_ratio)
             
         Returns:
             Marathi translation
         """
-        return self.en_mr_model.translate(english_text)
+        return self.en_mr_model.translate(english_text, **decoding)
     
-    def translate_de_to_mr(self, german_text: str) -> dict:
+    def translate_de_to_mr(self, german_text: str, profile: Optional[str] = None) -> dict:
         """
         Complete pipeline: German → English → Marathi
         
         Args:
             german_text: German input text
+            profile: Decoding profile name (see DECODING_PROFILES)
             
         Returns:
             Dictionary with all translation stages
         """
+        decoding = resolve_decoding(profile)
+        
         # Step 1: German to English
-        english_text = self.translate_de_to_en(german_text)
+        english_text = self.translate_de_to_en(german_text, **decoding["de_en"])
         
         # Step 2: English to Marathi
-        marathi_text = self.translate_en_to_mr(english_text)
+        marathi_text = self.translate_en_to_mr(english_text, **decoding["en_mr"])
         
         return {
             "german": german_text,
@@ -0,0 +1,323 @@
+"""
+Audio Janitor Module
+Background cleanup of audio_outputs/ with retention by age, total size and file count
+Files being downloaded hold a lease and are never deleted mid-transfer
+(leases are files, so every worker process sees the others' downloads)
+"""
+
+import os
+import time
+import shutil
+import asyncio
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Set
+
+from cache import TTS_CACHE_INDEX, AudioFileCache
+
+# ========================================================
+# Configuration
+# ========================================================
+
+# Files unused for longer than this are deleted (0 = no age limit)
+AUDIO_RETENTION_HOURS = float(os.getenv("AUDIO_RETENTION_HOURS", "24"))
+
+# Least recently used files are deleted beyond these limits (0 = no limit)
+AUDIO_MAX_MB = float(os.getenv("AUDIO_MAX_MB", "1024"))
+AUDIO_MAX_FILES = int(os.getenv("AUDIO_MAX_FILES", "5000"))
+
+# Seconds between sweeps
+AUDIO_JANITOR_INTERVAL = float(os.getenv("AUDIO_JANITOR_INTERVAL", "300"))
+
+# Fresh files are kept regardless, so a returned audio URL stays valid
+AUDIO_MIN_AGE_SECONDS = 60
+
+# Leftover *.tmp files (interrupted writes) older than this are removed
+TEMP_FILE_MAX_AGE_SECONDS = 3600
+
+# A lease not released after this long is treated as abandoned
+LEASE_TIMEOUT_SECONDS = 600
+
+# Lease files live here, inside the audio directory (hidden from /audio and the sweep)
+LEASE_DIR_NAME = ".leases"
+
+# ========================================================
+# Janitor
+# ========================================================
+
+class AudioJanitor:
+    """
+    Periodic cleanup of generated audio
+
+    Files are ordered by last use (the TTS cache index where it knows the
+    file, otherwise the modification time). Each sweep deletes expired files,
+    then the least recently used ones until the size and count limits hold.
+    Cached files are deleted through the TTS cache so its index stays right.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        cache: Optional[AudioFileCache] = None,
+        retention_hours: float = AUDIO_RETENTION_HOURS,
+        max_mb: float = AUDIO_MAX_MB,
+        max_files: int = AUDIO_MAX_FILES,
+        interval_seconds: float = AUDIO_JANITOR_INTERVAL
+    ):
+        """
+        Create a janitor (the background task starts with start())
+
+        Args:
+            directory: Audio output directory
+            cache: TTS audio cache managing part of the directory
+            retention_hours: Maximum time since last use
+            max_mb: Maximum total size of the directory
+            max_files: Maximum number of files
+            interval_seconds: Time between sweeps
+        """
+        self.directory = Path(directory)
+        self.cache = cache
+        self.max_age = retention_hours * 3600
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.max_files = max_files
+        self.interval = interval_seconds
+
+        self.lease_dir = self.directory / LEASE_DIR_NAME
+        self.lease_dir.mkdir(parents=True, exist_ok=True)
+        self._next_lease = 0
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+        self.sweeps = 0
+        self.deleted_files = 0
+        self.deleted_bytes = 0
+        self.last_sweep: Optional[dict] = None
+
+    # ----------------------------------------------------
+    # Leases
+    # ----------------------------------------------------
+
+    def _lease_path(self, filename: str, lease_id: int) -> Path:
+        """
+        Lease file for one holder: <file>@<pid>-<lease id>
+        """
+        return self.lease_dir / f"{filename}@{os.getpid()}-{lease_id}"
+
+    def acquire(self, filename: str) -> int:
+        """
+        Protect a file from deletion (e.g. while it is being downloaded)
+
+        The lease is a file, so janitors and caches in other worker processes
+        honour it too.
+
+        Args:
+            filename: File name inside the directory
+
+        Returns:
+            Lease id for release()
+        """
+        with self._lock:
+            self._next_lease += 1
+            lease_id = self._next_lease
+        self._lease_path(filename, lease_id).touch()
+        return lease_id
+
+    def release(self, filename: str, lease_id: int):
+        """
+        Drop a lease taken with acquire()
+        """
+        self._lease_path(filename, lease_id).unlink(missing_ok=True)
+
+    @contextmanager
+    def lease(self, filename: str):
+        """
+        Hold a lease for the duration of a with-block
+        """
+        lease_id = self.acquire(filename)
+        try:
+            yield
+        finally:
+            self.release(filename, lease_id)
+
+    def leased_files(self) -> Set[str]:
+        """
+        Names of files protected by a live lease from any process
+        (abandoned lease files older than the timeout are removed)
+        """
+        now = time.time()
+        leased = set()
+        for path in self.lease_dir.iterdir():
+            try:
+                acquired_at = path.stat().st_mtime
+            except FileNotFoundError:
+                continue  # released meanwhile
+            if now - acquired_at < LEASE_TIMEOUT_SECONDS:
+                leased.add(path.name.rpartition("@")[0])
+            else:
+                path.unlink(missing_ok=True)
+        return leased
+
+    def is_leased(self, filename: str) -> bool:
+        """
+        True if a live (not timed out) lease protects the file
+        """
+        return filename in self.leased_files()
+
+    # ----------------------------------------------------
+    # Sweeping
+    # ----------------------------------------------------
+
+    def _delete(self, path: Path) -> bool:
+        """
+        Remove one file (through the TTS cache when it manages the file)
+        unless a download leased it since the sweep started
+
+        Returns:
+            True if the file was deleted
+        """
+        if self.is_leased(path.name):
+            return False
+        if self.cache is not None and self.cache.is_managed(path.name):
+            self.cache.discard(path.name)
+        else:
+            path.unlink(missing_ok=True)
+        return True
+
+    def sweep(self) -> dict:
+        """
+        Run one cleanup pass (blocking; called from a worker thread)
+
+        Returns:
+            Dictionary with what was deleted and what remains
+        """
+        started = time.perf_counter()
+        now = time.time()
+
+        files = []
+        for path in self.directory.iterdir():
+            if not path.is_file() or path.name.startswith(TTS_CACHE_INDEX):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue  # deleted meanwhile (cache eviction, finished temp file)
+            last_used = stat.st_mtime
+            if self.cache is not None and self.cache.is_managed(path.name):
+                last_used = max(last_used, self.cache.last_access(path.name) or 0.0)
+            files.append([last_used, path, stat.st_size])
+        files.sort(key=lambda item: item[0])
+        leased = self.leased_files()
+
+        total_bytes = sum(size for _, _, size in files)
+        kept = []
+        deleted = deleted_bytes = 0
+
+        for last_used, path, size in files:
+            age = now - last_used
+            if path.suffix == ".tmp":
+                expired = age > TEMP_FILE_MAX_AGE_SECONDS
+            else:
+                expired = bool(self.max_age) and age > self.max_age
+            if expired and path.name not in leased and self._delete(path):
+                deleted += 1
+                deleted_bytes += size
+                total_bytes -= size
+            else:
+                kept.append((last_used, path, size))
+
+        # Oldest first until within the size and count limits
+        remaining = len(kept)
+        for last_used, path, size in kept:
+            over_bytes = self.max_bytes and total_bytes > self.max_bytes
+            over_files = self.max_files and remaining > self.max_files
+            if not (over_bytes or over_files):
+                break
+            if path.suffix == ".tmp" or now - last_used < AUDIO_MIN_AGE_SECONDS or path.name in leased:
+                continue
+            if not self._delete(path):
+                continue
+            deleted += 1
+            deleted_bytes += size
+            total_bytes -= size
+            remaining -= 1
+
+        if self.cache is not None:
+            self.cache.flush()
+
+        with self._lock:
+            self.sweeps += 1
+            self.deleted_files += deleted
+            self.deleted_bytes += deleted_bytes
+            self.last_sweep = {
+                "at": round(now, 1),
+                "seconds": round(time.perf_counter() - started, 3),
+                "deleted_files": deleted,
+                "deleted_bytes": deleted_bytes,
+                "files": remaining,
+                "bytes": total_bytes
+            }
+
+        if deleted:
+            print(f"🧹 Audio janitor: deleted {deleted} files ({deleted_bytes / (1024 * 1024):.1f} MB), "
+                  f"{remaining} files left ({total_bytes / (1024 * 1024):.1f} MB)")
+        return self.last_sweep
+
+    async def _run(self):
+        """
+        Background loop: sweep, then sleep for the interval
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                await loop.run_in_executor(None, self.sweep)
+            except Exception as e:
+                print(f"⚠️  Audio janitor sweep failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        """
+        Start the background task on the running event loop
+        """
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        print(f"✅ Audio janitor started (every {self.interval:.0f}s, "
+              f"retention={self.max_age / 3600:g}h, max={self.max_bytes / (1024 * 1024):.0f}MB/{self.max_files} files)")
+
+    async def stop(self):
+        """
+        Cancel the background task
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> dict:
+        """
+        Disk usage and cleanup statistics for the health endpoint
+
+        Returns:
+            Dictionary with limits, last sweep and volume usage
+        """
+        disk = shutil.disk_usage(self.directory)
+        with self._lock:
+            return {
+                "retention_hours": self.max_age / 3600,
+                "max_bytes": self.max_bytes,
+                "max_files": self.max_files,
+                "leased_files": len(self.leased_files()),
+                "sweeps": self.sweeps,
+                "deleted_files": self.deleted_files,
+                "deleted_bytes": self.deleted_bytes,
+                "last_sweep": self.last_sweep,
+                "disk": {
+                    "total_bytes": disk.total,
+                    "used_bytes": disk.used,
+                    "free_bytes": disk.free
+                }
+            }
@@ -0,0 +1,442 @@
+"""
+Job Queue Module
+Asynchronous jobs for long speech/document translations: submit returns a job ID,
+workers process jobs in priority order, clients poll or follow progress events
+"""
+
+import os
+import time
+import uuid
+import asyncio
+import itertools
+import traceback
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, Type
+
+# ========================================================
+# Configuration
+# ========================================================
+
+# Broker implementation ("local" = in-process queue)
+JOB_BROKER = os.getenv("JOB_BROKER", "local")
+
+# Jobs processed at the same time
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+
+# Queued jobs allowed before new submissions are rejected
+JOB_MAX_QUEUE = int(os.getenv("JOB_MAX_QUEUE", "100"))
+
+# Seconds finished jobs (and their results) are kept for polling
+JOB_RESULT_TTL = float(os.getenv("JOB_RESULT_TTL", "3600"))
+
+# Seconds between keep-alive comments on an idle event stream
+JOB_EVENT_KEEPALIVE = 15.0
+
+# Backoff for job steps refused because the server is busy (jobs wait, they do not fail)
+JOB_RETRY_INITIAL_SECONDS = 1.0
+JOB_RETRY_MAX_SECONDS = 30.0
+
+# ========================================================
+# Job States
+# ========================================================
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+FINISHED_STATES = (SUCCEEDED, FAILED)
+
+# ========================================================
+# Errors
+# ========================================================
+
+class JobQueueFullError(RuntimeError):
+    """
+    Raised when a job is submitted while the queue is full
+    """
+    pass
+
+# ========================================================
+# Job
+# ========================================================
+
+class Job:
+    """
+    One submitted job: state, progress and result
+
+    Every change bumps `version` and wakes anyone waiting in wait_for_change(),
+    which is what the event stream follows.
+    """
+
+    def __init__(self, kind: str, payload: Any, priority: int = 0):
+        """
+        Args:
+            kind: Handler name (e.g. "speech", "translate")
+            payload: Handler input
+            priority: Higher runs first
+        """
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.payload = payload
+        self.priority = priority
+        self.status = QUEUED
+        self.stage = "queued"
+        self.progress = 0.0
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.version = 0
+        self._waiters: List[asyncio.Future] = []
+
+    def update(self, stage: Optional[str] = None, progress: Optional[float] = None, **fields):
+        """
+        Record progress (or a state change) and notify waiters
+
+        Args:
+            stage: Short description of the current step
+            progress: Fraction done, 0.0 - 1.0
+            **fields: Other attributes to set (status, result, error, ...)
+        """
+        if stage is not None:
+            self.stage = stage
+        if progress is not None:
+            self.progress = round(min(1.0, max(0.0, progress)), 3)
+        for name, value in fields.items():
+            setattr(self, name, value)
+        self.version += 1
+
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def wait_for_change(self, seen_version: int, timeout: float) -> bool:
+        """
+        Wait until the job changes after `seen_version`
+
+        Returns:
+            True if it changed, False on timeout
+        """
+        if self.version > seen_version:
+            return True
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            # An idle job is polled every keep-alive: do not pile up dead waiters
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    def to_dict(self) -> dict:
+        """
+        Public view of the job (payload not included)
+        """
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "stage": self.stage,
+            "progress": self.progress,
+            "priority": self.priority,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at
+        }
+
+# Handlers receive the job (for progress updates) and its payload
+JobHandler = Callable[[Job, Any], Awaitable[Any]]
+
+async def run_with_retry(
+    job: Job,
+    step: Callable[[], Awaitable[Any]],
+    retry_on: Tuple[Type[BaseException], ...],
+    initial_delay: float = JOB_RETRY_INITIAL_SECONDS,
+    max_delay: float = JOB_RETRY_MAX_SECONDS
+) -> Any:
+    """
+    Run one job step, retrying with exponential backoff while it raises `retry_on`
+
+    Meant for "try again later" errors (a full executor queue): a job has no
+    client waiting on the connection, so it waits for capacity instead of failing.
+    The step is called again from scratch, so it must be safe to repeat.
+
+    Args:
+        job: Running job (its stage shows that it is waiting)
+        step: Coroutine function running the step
+        retry_on: Exception types that mean "busy"
+        initial_delay: First wait in seconds
+        max_delay: Longest wait in seconds
+
+    Returns:
+        Whatever the step returns
+    """
+    delay = initial_delay
+    while True:
+        try:
+            return await step()
+        except retry_on as e:
+            stage = job.stage
+            job.update(f"waiting for capacity ({e})")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_delay)
+            job.update(stage)
+
+# ========================================================
+# Broker Interface
+# ========================================================
+
+class JobBroker(ABC):
+    """
+    Interface between the API and whatever runs the jobs
+
+    The API only uses these methods, so an external broker (Redis, a cloud
+    queue, ...) can replace LocalJobBroker by implementing them and being
+    added to JOB_BROKERS.
+    """
+
+    # True if every server process sees the same jobs (state kept outside the process)
+    shared = False
+
+    # Why jobs are refused, or None while they are accepted (see disable())
+    disabled: Optional[str] = None
+
+    def disable(self, reason: str):
+        """
+        Refuse jobs from now on, e.g. when several server processes would each
+        hold their own jobs and status requests could land on the wrong one
+
+        Args:
+            reason: Explanation returned to clients
+        """
+        self.disabled = reason
+
+    @abstractmethod
+    def register(self, kind: str, handler: JobHandler):
+        """
+        Set the coroutine that processes jobs of one kind
+        """
+
+    @abstractmethod
+    async def submit(self, kind: str, payload: Any, priority: int = 0) -> Job:
+        """
+        Queue a job and return it (status "queued")
+
+        Raises:
+            JobQueueFullError: If no more jobs can be queued
+        """
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Job]:
+        """
+        Job by ID, or None if unknown or expired
+        """
+
+    @abstractmethod
+    def events(self, job_id: str) -> AsyncIterator[Optional[dict]]:
+        """
+        Yield the job's state on every change until it finishes
+        (None = nothing changed for a while, send a keep-alive)
+        """
+
+    @abstractmethod
+    def start(self):
+        """
+        Start processing jobs
+        """
+
+    @abstractmethod
+    async def stop(self):
+        """
+        Stop processing jobs
+        """
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """
+        Queue statistics for the health endpoint
+        """
+
+# ========================================================
+# Local Broker (in-process priority queue)
+# ========================================================
+
+class LocalJobBroker(JobBroker):
+    """
+    In-process broker: asyncio priority queue + a fixed number of worker tasks
+
+    Jobs run on this server's event loop (their handlers hand model work to
+    the inference executors), so state lives in memory and is lost on restart.
+    """
+
+    def __init__(
+        self,
+        workers: int = JOB_WORKERS,
+        max_queue: int = JOB_MAX_QUEUE,
+        result_ttl: float = JOB_RESULT_TTL
+    ):
+        """
+        Args:
+            workers: Jobs processed concurrently
+            max_queue: Queued jobs allowed before submit() is rejected
+            result_ttl: Seconds finished jobs are kept
+        """
+        self.workers = max(1, workers)
+        self.max_queue = max_queue
+        self.result_ttl = result_ttl
+
+        self._handlers: Dict[str, JobHandler] = {}
+        self._jobs: Dict[str, Job] = {}
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._sequence = itertools.count()  # FIFO among equal priorities
+
+        self.submitted = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.rejected = 0
+
+    def register(self, kind: str, handler: JobHandler):
+        self._handlers[kind] = handler
+
+    def _purge(self):
+        """
+        Forget finished jobs older than the result TTL
+        """
+        cutoff = time.time() - self.result_ttl
+        for job_id in [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished and job.finished_at < cutoff
+        ]:
+            del self._jobs[job_id]
+
+    def _queued(self) -> int:
+        return sum(1 for job in self._jobs.values() if job.status == QUEUED)
+
+    async def submit(self, kind: str, payload: Any, priority: int = 0) -> Job:
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+        self.start()
+        self._purge()
+
+        if self.max_queue and self._queued() >= self.max_queue:
+            self.rejected += 1
+            raise JobQueueFullError(f"Job queue is full ({self.max_queue} queued jobs), retry later")
+
+        job = Job(kind, payload, priority)
+        self._jobs[job.id] = job
+        await self._queue.put((-priority, next(self._sequence), job.id))
+        self.submitted += 1
+        print(f"📥 Job {job.id[:8]} queued ({kind}, priority {priority})")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        self._purge()
+        return self._jobs.get(job_id)
+
+    async def events(self, job_id: str) -> AsyncIterator[Optional[dict]]:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        seen = -1
+        while True:
+            if job.version > seen:
+                seen = job.version
+                yield job.to_dict()
+                if job.finished:
+                    return
+            elif not await job.wait_for_change(seen, JOB_EVENT_KEEPALIVE):
+                yield None
+
+    async def _worker(self):
+        """
+        Take the highest-priority job, run its handler, record the outcome
+        """
+        while True:
+            _, _, job_id = await self._queue.get()
+            job = self._jobs.get(job_id)
+            if job is None:
+                continue
+
+            job.update("started", 0.0, status=RUNNING, started_at=time.time())
+            try:
+                result = await self._handlers[job.kind](job, job.payload)
+            except asyncio.CancelledError:
+                job.update("cancelled", status=FAILED, error="Server shutting down", finished_at=time.time())
+                raise
+            except Exception as e:
+                print(f"❌ Job {job.id[:8]} failed: {e}")
+                print(traceback.format_exc())
+                self.failed += 1
+                job.update("failed", status=FAILED, error=str(e), finished_at=time.time())
+            else:
+                self.succeeded += 1
+                job.update("done", 1.0, status=SUCCEEDED, result=result, finished_at=time.time())
+                print(f"✅ Job {job.id[:8]} done in {job.finished_at - job.started_at:.1f}s")
+            finally:
+                job.payload = None  # release uploads/texts held by the job
+
+    def start(self):
+        if self._tasks and not all(task.done() for task in self._tasks):
+            return
+        loop = asyncio.get_running_loop()
+        # Created once: restarting the workers must not drop jobs already queued
+        if self._queue is None:
+            self._queue = asyncio.PriorityQueue()
+        self._tasks = [loop.create_task(self._worker()) for _ in range(self.workers)]
+        print(f"✅ Job broker started ({self.workers} workers, max queue {self.max_queue})")
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+    def stats(self) -> dict:
+        running = sum(1 for job in self._jobs.values() if job.status == RUNNING)
+        return {
+            "broker": "local",
+            "disabled": self.disabled,
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "queued": self._queued(),
+            "running": running,
+            "submitted": self.submitted,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "rejected": self.rejected
+        }
+
+JOB_BROKERS = {
+    "local": LocalJobBroker
+}
+
+def create_job_broker(broker: str = JOB_BROKER) -> JobBroker:
+    """
+    Create a job broker by name
+
+    Args:
+        broker: Broker name (see JOB_BROKERS)
+
+    Returns:
+        JobBroker instance
+    """
+    if broker not in JOB_BROKERS:
+        raise ValueError(f"Unknown job broker: {broker} (options: {', '.join(JOB_BROKERS)})")
+    return JOB_BROKERS[broker]()
@@ -0,0 +1,194 @@
+"""
+Model Registry Module
+Loads models in parallel background threads and tracks per-model readiness
+so the API can start serving as soon as the models a route needs are up
+"""
+
+import time
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+# ========================================================
+# Model States
+# ========================================================
+
+PENDING = "pending"
+LOADING = "loading"
+READY = "ready"
+FAILED = "failed"
+
+# ========================================================
+# Registry
+# ========================================================
+
+class ModelRegistry:
+    """
+    Registry of named model loaders
+
+    register() adds a loader, start() runs all loaders in parallel in the
+    background, when_ready() runs a callback once a set of models is loaded.
+    """
+
+    def __init__(self):
+        """
+        Create an empty registry
+        """
+        self._entries: Dict[str, dict] = {}
+        self._callbacks: List[dict] = []
+        self._lock = threading.Lock()
+        # Callbacks run one at a time, in registration order, whichever loader
+        # thread triggers them (a hook never sees an earlier one half-done)
+        self._callback_lock = threading.RLock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._callbacks_paused = False
+
+    def register(self, name: str, loader: Callable[[], Any]):
+        """
+        Register a model loader
+
+        Args:
+            name: Model name (reported on /ready)
+            loader: Function that loads and returns the model
+        """
+        with self._lock:
+            self._entries[name] = {
+                "loader": loader,
+                "status": PENDING,
+                "model": None,
+                "error": None,
+                "load_seconds": None
+            }
+
+    def when_ready(self, names: List[str], callback: Callable[..., None]):
+        """
+        Call callback(*models) once all named models are loaded
+
+        Args:
+            names: Models the callback needs
+            callback: Receives the loaded models in the order of `names`
+        """
+        with self._lock:
+            self._callbacks.append({"names": list(names), "callback": callback, "done": False})
+        self._run_callbacks()
+
+    def start(self):
+        """
+        Start loading every pending model in parallel (returns immediately)
+        Callbacks held back by load_all(run_callbacks=False) fire now
+        """
+        with self._lock:
+            self._callbacks_paused = False
+            pending = [name for name, entry in self._entries.items() if entry["status"] == PENDING]
+        self._run_callbacks()
+        if not pending:
+            return
+        with self._lock:
+            self._pool = ThreadPoolExecutor(
+                max_workers=len(pending),
+                thread_name_prefix="model-loader"
+            )
+            for name in pending:
+                self._entries[name]["status"] = LOADING
+        for name in pending:
+            self._pool.submit(self._load, name)
+        self._pool.shutdown(wait=False)
+
+    def load_all(self, run_callbacks: bool = True):
+        """
+        Load every pending model in the calling thread (blocking)
+
+        Args:
+            run_callbacks: False holds when_ready() callbacks back until start(),
+                e.g. to load in a parent process and build per-process state
+                (caches, pipelines) in the forked workers
+        """
+        with self._lock:
+            self._callbacks_paused = not run_callbacks
+        for name, entry in list(self._entries.items()):
+            if entry["status"] == PENDING:
+                entry["status"] = LOADING
+                self._load(name)
+
+    def _load(self, name: str):
+        """
+        Run one loader and record the outcome
+        """
+        entry = self._entries[name]
+        started = time.perf_counter()
+        print(f"📦 Loading {name}...")
+        try:
+            model = entry["loader"]()
+        except Exception as e:
+            with self._lock:
+                entry["status"] = FAILED
+                entry["error"] = str(e)
+                entry["load_seconds"] = round(time.perf_counter() - started, 2)
+            print(f"❌ Failed to load {name}: {e}")
+            print(traceback.format_exc())
+            return
+
+        with self._lock:
+            entry["model"] = model
+            entry["status"] = READY
+            entry["load_seconds"] = round(time.perf_counter() - started, 2)
+        print(f"✅ {name} ready in {entry['load_seconds']:.1f}s")
+        self._run_callbacks()
+
+    def _run_callbacks(self):
+        """
+        Fire callbacks whose models are now all loaded (each fires once)
+        """
+        with self._callback_lock:
+            with self._lock:
+                if self._callbacks_paused:
+                    return
+                due = []
+                for hook in self._callbacks:
+                    if not hook["done"] and all(
+                        self._entries.get(name, {}).get("status") == READY for name in hook["names"]
+                    ):
+                        hook["done"] = True
+                        due.append((hook["callback"], [self._entries[name]["model"] for name in hook["names"]]))
+
+            for callback, models in due:
+                try:
+                    callback(*models)
+                except Exception as e:
+                    print(f"❌ Model ready callback failed: {e}")
+                    print(traceback.format_exc())
+
+    def get(self, name: str) -> Optional[Any]:
+        """
+        Loaded model or None if not (yet) available
+        """
+        entry = self._entries.get(name)
+        return entry["model"] if entry and entry["status"] == READY else None
+
+    def is_ready(self, *names: str) -> bool:
+        """
+        True if all named models are loaded
+        """
+        return all(
+            self._entries.get(name, {}).get("status") == READY for name in names
+        )
+
+    def status(self) -> Dict[str, dict]:
+        """
+        Per-model status for the readiness endpoint
+
+        Returns:
+            Dictionary: name → {status, load_seconds, error, details}
+            (details: the model's own load_info breakdown, if it has one)
+        """
+        with self._lock:
+            return {
+                name: {
+                    "status": entry["status"],
+                    "load_seconds": entry["load_seconds"],
+                    "error": entry["error"],
+                    "details": getattr(entry["model"], "load_info", None)
+                }
+                for name, entry in self._entries.items()
+            }
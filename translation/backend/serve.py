@@ -0,0 +1,198 @@
+"""
+Pre-fork Server
+Loads every model once in a parent process, then forks uvicorn workers that
+share the weights copy-on-write instead of each loading its own copy
+"""
+
+import os
+import gc
+import sys
+import time
+import signal
+import socket
+import traceback
+
+# Set before transformers/tokenizers are imported: their thread pool does not survive fork()
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+
+import torch
+import uvicorn
+
+# ========================================================
+# Configuration
+# ========================================================
+
+SERVE_HOST = os.getenv("HOST", "0.0.0.0")
+SERVE_PORT = int(os.getenv("PORT", "10000"))
+
+# Worker processes sharing the preloaded models
+SERVE_WORKERS = int(os.getenv("SERVE_WORKERS", "2"))
+
+# Torch threads per worker (default: cores split between workers, so they do not oversubscribe)
+SERVE_TORCH_THREADS = int(os.getenv(
+    "SERVE_TORCH_THREADS",
+    str(max(1, (os.cpu_count() or 1) // max(1, SERVE_WORKERS)))
+))
+
+# Seconds to wait for workers to exit on shutdown before killing them
+SHUTDOWN_TIMEOUT = 30
+
+# ========================================================
+# Workers
+# ========================================================
+
+def bind_socket(host: str, port: int) -> socket.socket:
+    """
+    Listening socket created in the parent and inherited by every worker
+    (the kernel spreads connections between the processes accepting on it)
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+def run_worker(app, sock: socket.socket, index: int):
+    """
+    Worker process body: serve the app on the shared socket, never return
+    """
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    # Before any torch op in this process (the parent loaded models single-threaded)
+    torch.set_num_threads(SERVE_TORCH_THREADS)
+    print(f"🚀 Worker {index} started (pid {os.getpid()}, {SERVE_TORCH_THREADS} torch threads)")
+
+    # Executors, caches (SQLite), batchers and the janitor start here, in
+    # startup_event, so no thread or connection is shared across processes
+    server = uvicorn.Server(uvicorn.Config(app, log_level="info"))
+    exit_code = 0
+    try:
+        server.run(sockets=[sock])
+    except BaseException:
+        traceback.print_exc()
+        exit_code = 1
+    os._exit(exit_code)
+
+def spawn_worker(app, sock: socket.socket, index: int) -> int:
+    """
+    Fork one worker
+
+    Returns:
+        Worker pid (in the parent)
+    """
+    pid = os.fork()
+    if pid == 0:
+        run_worker(app, sock, index)
+    return pid
+
+def stop_workers(workers: dict):
+    """
+    SIGTERM every worker, then SIGKILL the ones still running after the timeout
+    """
+    for pid in workers:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+    deadline = time.monotonic() + SHUTDOWN_TIMEOUT
+    while workers and time.monotonic() < deadline:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return  # all reaped
+        if pid:
+            workers.pop(pid, None)
+        else:
+            time.sleep(0.1)
+
+    for pid in workers:
+        print(f"⚠️  Worker pid {pid} did not stop, killing it")
+        try:
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+        except (ProcessLookupError, ChildProcessError):
+            pass
+
+# ========================================================
+# Main
+# ========================================================
+
+def main():
+    """
+    Load models, freeze them out of the GC, fork workers and supervise them
+    """
+    print("=" * 60)
+    print(f"🚀 Pre-fork server: {SERVE_WORKERS} workers on {SERVE_HOST}:{SERVE_PORT}")
+    print("=" * 60)
+
+    import app as app_module
+    from jobs import JOB_BROKER
+
+    # Load in this process only; pipelines and caches are built per worker.
+    # Loading runs torch ops (quantization, position tables), so keep them on
+    # this thread: with one intra-op thread no OpenMP worker threads exist at
+    # fork time, and each worker sizes its own pool before its first op.
+    torch.set_num_threads(1)
+    started = time.perf_counter()
+    app_module.model_registry.load_all(run_callbacks=False)
+    failed = [
+        name for name, status in app_module.model_registry.status().items()
+        if status["status"] != "ready"
+    ]
+    if failed:
+        print(f"⚠️  Not loaded: {', '.join(failed)} (workers serve without them)")
+    print(f"📦 Models loaded in {time.perf_counter() - started:.1f}s")
+
+    # Each worker would keep its own in-memory jobs, and a status request can
+    # reach any worker: refuse jobs rather than answer "Job not found" at random
+    if SERVE_WORKERS > 1 and not app_module.job_broker.shared:
+        app_module.job_broker.disable(
+            f"Job API unavailable: JOB_BROKER={JOB_BROKER} keeps jobs inside one "
+            f"worker process and this server runs {SERVE_WORKERS}; use SERVE_WORKERS=1 or a shared broker"
+        )
+        print(f"⚠️  /jobs disabled: JOB_BROKER={JOB_BROKER} is not shared between workers")
+
+    # Move everything allocated so far out of GC tracking: collections in the
+    # workers then never write to (and un-share) the pages holding these objects
+    gc.collect()
+    gc.freeze()
+
+    sock = bind_socket(SERVE_HOST, SERVE_PORT)
+    workers = {}
+    for index in range(SERVE_WORKERS):
+        workers[spawn_worker(app_module.app, sock, index)] = index
+
+    stopping = False
+
+    def _on_signal(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, _on_signal)
+    signal.signal(signal.SIGINT, _on_signal)
+
+    # Replace workers that die; the models are still in memory, so this is fast
+    while not stopping:
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            break
+        if not pid:
+            time.sleep(0.5)  # polled: a blocking wait is resumed after signals
+            continue
+        index = workers.pop(pid, None)
+        if index is None or stopping:
+            continue
+        print(f"⚠️  Worker {index} (pid {pid}) exited with status {status}, restarting")
+        time.sleep(1)
+        workers[spawn_worker(app_module.app, sock, index)] = index
+
+    print("⏹️  Stopping workers...")
+    stop_workers(workers)
+    sock.close()
+    print("✅ Server stopped")
+
+if __name__ == "__main__":
+    sys.exit(main())
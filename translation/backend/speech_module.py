@@ -1,27 +1,508 @@
 """
 Speech Processing Module
-Provides Speech-to-Text (Whisper) and Text-to-Speech (gTTS) functionality
+Provides Speech-to-Text (Whisper) and Text-to-Speech (gTTS or local MMS-TTS) functionality
 """
 
+import io
 import os
+import re
+import wave
+import shutil
+import subprocess
 import torch
 import whisper
+import numpy as np
 from gtts import gTTS
+from cache import TTS_CACHE_MAX_MB, AudioFileCache, make_cache_key
 from pathlib import Path
 import tempfile
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+try:
+    import soundfile  # optional: native FLAC/OGG/WAV decoding
+except ImportError:
+    soundfile = None
 
 # ========================================================
 # Configuration
 # ========================================================
 
-WHISPER_MODEL_NAME = "base"  # Options: tiny, base, small, medium, large
+WHISPER_MODEL_NAME = os.getenv("WHISPER_MODEL", "base")  # Options: tiny, base, small, medium, large
 TTS_LANGUAGE = "mr"  # Marathi
+
+# Text-to-speech engine: "gtts" (Google, network, MP3) or
+# "mms" (local VITS model on CPU, WAV; works offline)
+TTS_BACKEND = os.getenv("TTS_BACKEND", "gtts")
+TTS_LOCAL_MODEL = os.getenv("TTS_LOCAL_MODEL", "facebook/mms-tts-mar")
+TTS_STREAM_CHUNK_BYTES = 64 * 1024  # Read size when streaming cached audio
+
+# Calls the backend handles well at once: gTTS is network-bound,
+# the local MMS engine is CPU-bound like the other models
+TTS_CONCURRENCY = 1 if TTS_BACKEND == "mms" else 4
+
+# Sentences of one text synthesized concurrently (1 = one call for the whole text)
+TTS_SENTENCE_WORKERS = int(os.getenv("TTS_SENTENCE_WORKERS", str(TTS_CONCURRENCY)))
+
+# Sentence ends: danda / double danda, ? and ! (runs like "?!" count once), or a
+# period followed by a space; closing quotes/brackets stay with the sentence they end
+SENTENCE_END = re.compile(r"(?:[।॥?!]+|\.)[\"'”’)\]]*")
+
+# A period after these (or after a single-letter initial) does not end a sentence
+SENTENCE_ABBREVIATIONS = {"डॉ", "श्री", "सौ", "कु", "प्रा", "सु", "क्र", "Dr", "Mr", "Mrs", "Nr", "St"}
 AUDIO_OUTPUT_DIR = "./audio_outputs"
 
+# Speech-to-text implementation: "whisper" (reference, PyTorch) or
+# "faster-whisper" (CTranslate2, int8 weights on CPU; optional dependency)
+STT_BACKEND = os.getenv("STT_BACKEND", "whisper")
+STT_COMPUTE_TYPE = os.getenv("STT_COMPUTE_TYPE", "int8")  # faster-whisper weight precision
+STT_CPU_THREADS = int(os.getenv("STT_CPU_THREADS", "0"))  # 0 = CTranslate2 default
+
+# Whisper expects 16 kHz mono float32
+SAMPLE_RATE = whisper.audio.SAMPLE_RATE
+
+# Voice activity detection before Whisper ("0" sends whole clips as before)
+VAD_ENABLED = os.getenv("VAD_ENABLED", "1").lower() in ("1", "true", "yes")
+VAD_FRAME_MS = 30              # Analysis frame length
+VAD_MIN_DB = -50.0             # Frames quieter than this (dBFS) are never speech
+VAD_NOISE_MARGIN_DB = 12.0     # Speech must be this far above the noise floor...
+VAD_PEAK_MARGIN_DB = 30.0      # ...but the threshold never exceeds peak - this
+VAD_MIN_SPEECH_MS = 250        # Shorter bursts are dropped (clicks, bumps)
+VAD_MIN_SILENCE_MS = 400       # Shorter pauses do not split a segment
+VAD_PAD_MS = 200               # Context kept around each segment
+VAD_MAX_SEGMENT_SECONDS = 28.0 # Whisper sees at most 30 s at once
+VAD_BATCH_SIZE = int(os.getenv("VAD_BATCH_SIZE", "8"))  # Segments per decode call
+
+# Greedy segment decodes below these are retried with temperature fallback
+FALLBACK_LOGPROB_THRESHOLD = -1.0
+FALLBACK_COMPRESSION_RATIO = 2.4
+NO_SPEECH_THRESHOLD = 0.6
+
 # Create output directory
 Path(AUDIO_OUTPUT_DIR).mkdir(parents=True, exist_ok=True)
 
+# ========================================================
+# In-Memory Audio Decoding
+# ========================================================
+
+class AudioDecodeError(ValueError):
+    """
+    Raised when uploaded bytes cannot be decoded as audio
+    """
+    pass
+
+def _open_source(source: Union[bytes, BinaryIO]) -> BinaryIO:
+    """
+    Readable file object at position 0 for bytes or an already open file
+    """
+    if isinstance(source, (bytes, bytearray)):
+        return io.BytesIO(source)
+    source.seek(0)
+    return source
+
+def _decode_native(source: Union[bytes, BinaryIO]) -> Optional[np.ndarray]:
+    """
+    Decode 16 kHz audio without ffmpeg (soundfile if installed, else WAV via `wave`)
+    Other sample rates return None so ffmpeg's proper resampler is used
+    
+    Args:
+        source: Encoded audio bytes or a binary file object
+        
+    Returns:
+        Mono float32 samples, or None if this path cannot handle the input
+    """
+    if soundfile is not None:
+        try:
+            samples, rate = soundfile.read(_open_source(source), dtype="float32", always_2d=True)
+        except Exception:
+            return None
+        return samples.mean(axis=1).astype(np.float32) if rate == SAMPLE_RATE else None
+    
+    header = _open_source(source).read(12)
+    if header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+        return None
+    try:
+        with wave.open(_open_source(source)) as wav:
+            if wav.getframerate() != SAMPLE_RATE or wav.getsampwidth() != 2:
+                return None
+            channels = wav.getnchannels()
+            frames = wav.readframes(wav.getnframes())
+    except (wave.Error, EOFError):
+        return None
+    
+    samples = np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768.0
+    if channels > 1:
+        samples = samples[:len(samples) - len(samples) % channels].reshape(-1, channels).mean(axis=1)
+    return samples
+
+def _decode_ffmpeg(source: Union[bytes, BinaryIO]) -> np.ndarray:
+    """
+    Decode any ffmpeg-supported format over stdin/stdout pipes
+    Files with a descriptor are handed to ffmpeg as stdin, never read into Python
+    
+    Args:
+        source: Encoded audio bytes or a binary file object
+        
+    Returns:
+        16 kHz mono float32 samples
+    """
+    command = [
+        "ffmpeg", "-nostdin", "-threads", "0",
+        "-i", "pipe:0",
+        "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(SAMPLE_RATE),
+        "pipe:1"
+    ]
+    if isinstance(source, (bytes, bytearray)):
+        stdin_args = {"input": source}
+    else:
+        try:
+            source.fileno()  # spooled uploads move to disk here
+            stdin_args = {"stdin": _open_source(source)}
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            stdin_args = {"input": _open_source(source).read()}
+    
+    try:
+        result = subprocess.run(command, capture_output=True, check=True, **stdin_args)
+        if result.stdout:
+            return np.frombuffer(result.stdout, dtype="<i2").astype(np.float32) / 32768.0
+    except subprocess.CalledProcessError:
+        pass
+    
+    # MP4/M4A files with the index at the end cannot be read from a pipe;
+    # fall back to a uniquely named temp file (no collisions between requests)
+    with tempfile.NamedTemporaryFile() as temp_file:
+        shutil.copyfileobj(_open_source(source), temp_file)
+        temp_file.flush()
+        try:
+            return whisper.load_audio(temp_file.name, sr=SAMPLE_RATE)
+        except RuntimeError as e:
+            raise AudioDecodeError(f"Could not decode audio: {e}")
+
+def decode_audio_bytes(data: Union[bytes, BinaryIO]) -> np.ndarray:
+    """
+    Decode an uploaded audio file straight into Whisper's input format
+    
+    Args:
+        data: Encoded audio bytes (wav, mp3, m4a, ogg, flac, ...), or a binary
+            file object holding them (read in place, e.g. a spooled upload)
+        
+    Returns:
+        16 kHz mono float32 NumPy array
+        
+    Raises:
+        AudioDecodeError: If the input is not decodable audio
+    """
+    if isinstance(data, (bytes, bytearray)):
+        empty = not data
+    else:
+        empty = not _open_source(data).read(1)
+    if empty:
+        raise AudioDecodeError("Empty audio file")
+    
+    samples = _decode_native(data)
+    if samples is None:
+        samples = _decode_ffmpeg(data)
+    
+    if len(samples) == 0:
+        raise AudioDecodeError("Audio file contains no samples")
+    return samples
+
+# ========================================================
+# Voice Activity Detection
+# ========================================================
+
+def detect_speech_segments(audio: np.ndarray) -> List[Tuple[int, int]]:
+    """
+    Find speech regions with an adaptive energy threshold
+    Cheap (NumPy only), so silent uploads can be rejected before any model work
+    
+    Args:
+        audio: 16 kHz mono float32 samples
+        
+    Returns:
+        List of (start_sample, end_sample); empty if the clip is (near) silent
+    """
+    frame = SAMPLE_RATE * VAD_FRAME_MS // 1000
+    n_frames = len(audio) // frame
+    if n_frames == 0:
+        return []
+    
+    frames = audio[:n_frames * frame].reshape(n_frames, frame)
+    energy_db = 10 * np.log10(np.mean(frames ** 2, axis=1) + 1e-10)
+    peak_db = float(energy_db.max())
+    if peak_db < VAD_MIN_DB:
+        return []
+    
+    noise_floor_db = float(np.percentile(energy_db, 10))
+    threshold_db = max(
+        VAD_MIN_DB,
+        min(noise_floor_db + VAD_NOISE_MARGIN_DB, peak_db - VAD_PEAK_MARGIN_DB)
+    )
+    
+    # Runs of speech frames as [start, end) frame indices
+    is_speech = np.concatenate([[False], energy_db > threshold_db, [False]])
+    edges = np.flatnonzero(is_speech[1:] != is_speech[:-1])
+    runs = edges.reshape(-1, 2).tolist()
+    
+    # Bridge short pauses, then drop short bursts
+    min_silence = VAD_MIN_SILENCE_MS // VAD_FRAME_MS
+    merged = []
+    for start, end in runs:
+        if merged and start - merged[-1][1] < min_silence:
+            merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    min_speech = VAD_MIN_SPEECH_MS // VAD_FRAME_MS
+    merged = [run for run in merged if run[1] - run[0] >= min_speech]
+    
+    # Pad for context (merging any overlap)
+    pad = VAD_PAD_MS // VAD_FRAME_MS
+    padded = []
+    for start, end in merged:
+        start, end = max(0, start - pad), min(n_frames, end + pad)
+        if padded and start <= padded[-1][1]:
+            padded[-1][1] = end
+        else:
+            padded.append([start, end])
+    
+    # Split anything longer than Whisper's window at its quietest frame
+    max_frames = int(VAD_MAX_SEGMENT_SECONDS * 1000 / VAD_FRAME_MS)
+    segments = []
+    for start, end in padded:
+        while end - start > max_frames:
+            low, high = start + max_frames // 2, start + max_frames
+            cut = low + int(np.argmin(energy_db[low:high]))
+            segments.append((start, cut))
+            start = cut
+        segments.append((start, end))
+    
+    return [(start * frame, end * frame) for start, end in segments]
+
+# ========================================================
+# Speech-to-Text Backends
+# ========================================================
+
+class ClipResult(NamedTuple):
+    """
+    Backend-neutral decode result for one clip (fields as in whisper's DecodingResult)
+    """
+    text: str
+    avg_logprob: float
+    no_speech_prob: float
+    compression_ratio: float
+
+class WhisperBackend:
+    """
+    Reference backend: openai-whisper (PyTorch)
+    """
+    
+    name = "whisper"
+    
+    def __init__(self, model_name: str, device: str = "cpu"):
+        """
+        Load a Whisper checkpoint
+        
+        Args:
+            model_name: Whisper model size (tiny, base, small, medium, large)
+            device: "cpu" or "cuda"
+        """
+        self.device = device
+        self.fp16 = device == "cuda"  # half precision only where the model actually runs on GPU
+        self.model = whisper.load_model(model_name, device=device)
+    
+    def decode_clips(
+        self,
+        clips: List[np.ndarray],
+        language: str = "de",
+        prompt: Optional[str] = None
+    ) -> List[ClipResult]:
+        """
+        One batched encoder pass + greedy decode over several ≤ 30 s clips
+        """
+        options = whisper.DecodingOptions(
+            language=language,
+            task="transcribe",
+            without_timestamps=True,
+            fp16=self.fp16,
+            prompt=prompt
+        )
+        mel = torch.stack([
+            whisper.log_mel_spectrogram(
+                whisper.pad_or_trim(clip), n_mels=self.model.dims.n_mels
+            )
+            for clip in clips
+        ]).to(self.model.device)
+        
+        return [
+            ClipResult(result.text, result.avg_logprob, result.no_speech_prob, result.compression_ratio)
+            for result in whisper.decode(self.model, mel, options)
+        ]
+    
+    def transcribe_full(
+        self,
+        audio: Union[str, np.ndarray],
+        language: str = "de",
+        **decode_options
+    ) -> dict:
+        """
+        Whisper's own long-form transcribe() (beam search + temperature fallback)
+        """
+        result = self.model.transcribe(
+            audio,
+            language=language,
+            fp16=self.fp16,
+            **decode_options
+        )
+        
+        return {
+            "text": result["text"].strip(),
+            "language": result.get("language", language),
+            "segments": result.get("segments", [])
+        }
+
+class FasterWhisperBackend:
+    """
+    CPU-optimized backend: faster-whisper (CTranslate2) with int8 weights
+    
+    decode_clips() encodes all clips in one batched encoder pass and decodes
+    them together in one greedy CTranslate2 generate() call (beam 1), as
+    faster-whisper's BatchedInferencePipeline does; only low-confidence clips
+    go through transcribe_full()'s beam search + temperature fallback.
+    """
+    
+    name = "faster-whisper"
+    
+    def __init__(self, model_name: str, device: str = "cpu", compute_type: str = STT_COMPUTE_TYPE):
+        """
+        Load (and on first use convert/download) a CTranslate2 Whisper model
+        
+        Args:
+            model_name: Whisper model size (tiny, base, small, medium, large)
+            device: "cpu" or "cuda"
+            compute_type: Weight precision (int8, int8_float16, float16, float32)
+        """
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:
+            raise ImportError(
+                "STT_BACKEND=faster-whisper requires faster-whisper: pip install faster-whisper"
+            )
+        
+        from faster_whisper.tokenizer import Tokenizer
+        from faster_whisper.transcribe import get_compression_ratio
+        
+        self._tokenizer_class = Tokenizer
+        self._compression_ratio = get_compression_ratio
+        self.device = device
+        self.compute_type = compute_type
+        self.model = WhisperModel(
+            model_name,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=STT_CPU_THREADS
+        )
+    
+    def decode_clips(
+        self,
+        clips: List[np.ndarray],
+        language: str = "de",
+        prompt: Optional[str] = None
+    ) -> List[ClipResult]:
+        """
+        One batched encoder pass + one batched greedy decode over several ≤ 30 s clips
+        """
+        # Log-mel per clip (NumPy), padded to Whisper's 30 s window so they stack
+        features = np.stack([
+            whisper.pad_or_trim(
+                self.model.feature_extractor(whisper.pad_or_trim(clip))[:, :whisper.audio.N_FRAMES],
+                whisper.audio.N_FRAMES
+            )
+            for clip in clips
+        ]).astype(np.float32)
+        encoder_output = self.model.encode(features)
+        
+        tokenizer = self._tokenizer_class(
+            self.model.hf_tokenizer,
+            self.model.model.is_multilingual,
+            task="transcribe",
+            language=language
+        )
+        previous_tokens = tokenizer.encode(" " + prompt.strip()) if prompt else []
+        prompt_tokens = self.model.get_prompt(tokenizer, previous_tokens, without_timestamps=True)
+        
+        outputs = self.model.model.generate(
+            encoder_output,
+            [prompt_tokens] * len(clips),
+            beam_size=1,
+            max_length=self.model.max_length,
+            return_scores=True,
+            return_no_speech_prob=True,
+            suppress_blank=True,
+            suppress_tokens=[-1]
+        )
+        
+        results = []
+        for output in outputs:
+            tokens = [token for token in output.sequences_ids[0] if token < tokenizer.eot]
+            text = tokenizer.decode(tokens).strip()
+            # Score is the length-normalized sum of log-probs (as faster-whisper computes it)
+            avg_logprob = output.scores[0] * len(tokens) / (len(tokens) + 1)
+            results.append(ClipResult(
+                text=text,
+                avg_logprob=avg_logprob if text else float("-inf"),
+                no_speech_prob=output.no_speech_prob,
+                compression_ratio=self._compression_ratio(text) if text else 0.0
+            ))
+        return results
+    
+    def transcribe_full(
+        self,
+        audio: Union[str, np.ndarray],
+        language: str = "de",
+        **decode_options
+    ) -> dict:
+        """
+        Long-form transcribe with beam search and temperature fallback
+        """
+        segments, info = self.model.transcribe(
+            audio,
+            language=language,
+            beam_size=5,
+            initial_prompt=decode_options.get("initial_prompt"),
+            vad_filter=False
+        )
+        segments = [
+            {"start": round(segment.start, 2), "end": round(segment.end, 2), "text": segment.text.strip()}
+            for segment in segments
+        ]
+        
+        return {
+            "text": " ".join(segment["text"] for segment in segments).strip(),
+            "language": info.language or language,
+            "segments": segments
+        }
+
+STT_BACKENDS = {
+    WhisperBackend.name: WhisperBackend,
+    FasterWhisperBackend.name: FasterWhisperBackend
+}
+
+def create_stt_backend(backend: str, model_name: str, device: str = "cpu"):
+    """
+    Create a speech-to-text backend by name
+    
+    Args:
+        backend: "whisper" or "faster-whisper"
+        model_name: Whisper model size
+        device: "cpu" or "cuda"
+        
+    Returns:
+        Backend instance with decode_clips() and transcribe_full()
+    """
+    if backend not in STT_BACKENDS:
+        raise ValueError(f"Unknown STT backend: {backend} (options: {', '.join(STT_BACKENDS)})")
+    return STT_BACKENDS[backend](model_name, device=device)
+
 # ========================================================
 # Speech-to-Text (Whisper)
 # ========================================================
@@ -29,55 +510,180 @@ Path(AUDIO_OUTPUT_DIR).mkdir(parents=True, exist_ok=True)
 class SpeechToText:
     """
     German Speech-to-Text using OpenAI Whisper
+    VAD, batching and confidence fallback live here; model calls go to the backend
     """
     
-    def __init__(self, model_name: str = WHISPER_MODEL_NAME):
+    def __init__(self, model_name: str = WHISPER_MODEL_NAME, backend: str = STT_BACKEND):
         """
         Initialize Whisper model
         
         Args:
             model_name: Whisper model size (tiny, base, small, medium, large)
+            backend: STT backend name (see STT_BACKENDS)
         """
-        print(f"🔄 Loading Whisper model: {model_name}")
+        print(f"🔄 Loading Whisper model: {model_name} ({backend})")
         # Force CPU mode to avoid RTX 5060 sm_120 incompatibility
         self.device = "cpu"
-        self.model = whisper.load_model(model_name, device=self.device)
-        print(f"✅ Whisper model loaded on CPU")
+        self.backend = create_stt_backend(backend, model_name, self.device)
+        # Identity for caches keyed on transcription results
+        self.model_id = f"{self.backend.name}|{model_name}|{getattr(self.backend, 'compute_type', 'fp32')}"
+        print(f"✅ Whisper model loaded on CPU ({self.backend.name})")
     
     def transcribe(
         self, 
-        audio_path: str, 
-        language: str = "de"
+        audio: Union[str, np.ndarray], 
+        language: str = "de",
+        speech_segments: Optional[List[Tuple[int, int]]] = None,
+        **decode_options
     ) -> dict:
         """
-        Transcribe audio file to text
+        Transcribe audio to text
+        
+        With VAD enabled, silence is skipped and the speech segments are
+        decoded together in batches, then stitched back with their timestamps
         
         Args:
-            audio_path: Path to audio file
+            audio: Path to audio file, or 16 kHz mono float32 samples
             language: Language code (de for German)
+            speech_segments: Precomputed detect_speech_segments() result
+            **decode_options: Extra Whisper options (e.g. initial_prompt)
             
         Returns:
             Dictionary with transcription and metadata
         """
-        print(f"🎤 Transcribing audio: {audio_path}")
+        if isinstance(audio, np.ndarray):
+            print(f"🎤 Transcribing audio: {len(audio) / SAMPLE_RATE:.1f}s in memory")
+        else:
+            print(f"🎤 Transcribing audio: {audio}")
         
-        # Transcribe
-        result = self.model.transcribe(
-            audio_path,
-            language=language,
-            fp16=torch.cuda.is_available()  # Use fp16 if GPU available
-        )
+        if not VAD_ENABLED:
+            result = self._transcribe_full(audio, language, **decode_options)
+            print(f"✅ Transcription: {result['text']}")
+            return result
+        
+        if isinstance(audio, str):
+            audio = whisper.load_audio(audio, sr=SAMPLE_RATE)
+        if speech_segments is None:
+            speech_segments = detect_speech_segments(audio)
+        if not speech_segments:
+            print(f"🔇 No speech detected")
+            return {"text": "", "language": language, "segments": []}
         
-        text = result["text"].strip()
+        segments = self.transcribe_segments(
+            audio, speech_segments, language, prompt=decode_options.get("initial_prompt")
+        )
+        text = " ".join(segment["text"] for segment in segments)
         
-        print(f"✅ Transcription: {text}")
+        print(f"✅ Transcription ({len(speech_segments)} segments): {text}")
         
         return {
             "text": text,
-            "language": result.get("language", language),
-            "segments": result.get("segments", [])
+            "language": language,
+            "segments": segments
         }
     
+    def transcribe_segments(
+        self,
+        audio: np.ndarray,
+        speech_segments: List[Tuple[int, int]],
+        language: str = "de",
+        prompt: Optional[str] = None
+    ) -> List[dict]:
+        """
+        Decode speech segments in batches and return them with timestamps
+        
+        Args:
+            audio: 16 kHz mono float32 samples
+            speech_segments: (start_sample, end_sample) pairs, each ≤ 30 s
+            language: Language code
+            prompt: Optional previous text for context
+            
+        Returns:
+            List of {"start", "end", "text"} (seconds relative to `audio`)
+        """
+        clips = [audio[start:end] for start, end in speech_segments]
+        results = []
+        for i in range(0, len(clips), VAD_BATCH_SIZE):
+            results.extend(self.decode_clips(clips[i:i + VAD_BATCH_SIZE], language, prompt))
+        
+        return self.finalize_segments(speech_segments, clips, results, language, prompt)
+    
+    def finalize_segments(
+        self,
+        speech_segments: List[Tuple[int, int]],
+        clips: List[np.ndarray],
+        results: list,
+        language: str = "de",
+        prompt: Optional[str] = None
+    ) -> List[dict]:
+        """
+        Turn decode_clips() results into timestamped segments
+        
+        Args:
+            speech_segments: (start_sample, end_sample) pairs
+            clips: The audio of each segment
+            results: ClipResult per clip
+            language: Language code
+            prompt: Prompt used for decoding
+            
+        Returns:
+            List of {"start", "end", "text"} (seconds)
+        """
+        segments = []
+        for (start, end), clip, result in zip(speech_segments, clips, results):
+            text = self._finalize_segment(clip, result, language, prompt)
+            if text:
+                segments.append({
+                    "start": round(start / SAMPLE_RATE, 2),
+                    "end": round(end / SAMPLE_RATE, 2),
+                    "text": text
+                })
+        return segments
+    
+    def decode_clips(
+        self,
+        clips: List[np.ndarray],
+        language: str = "de",
+        prompt: Optional[str] = None
+    ) -> list:
+        """
+        One batched Whisper forward/decode over several ≤ 30 s clips
+        
+        Args:
+            clips: 16 kHz mono float32 clips
+            language: Language code
+            prompt: Optional previous text for context
+            
+        Returns:
+            List of ClipResult (same order as clips)
+        """
+        return self.backend.decode_clips(clips, language, prompt)
+    
+    def _finalize_segment(self, clip: np.ndarray, result, language: str, prompt: Optional[str]) -> str:
+        """
+        Text for one decoded clip: drop non-speech, retry low-confidence decodes
+        """
+        if result.no_speech_prob > NO_SPEECH_THRESHOLD and result.avg_logprob < FALLBACK_LOGPROB_THRESHOLD:
+            return ""
+        
+        if (result.avg_logprob < FALLBACK_LOGPROB_THRESHOLD or
+                result.compression_ratio > FALLBACK_COMPRESSION_RATIO):
+            # Greedy decode looks unreliable: use transcribe()'s temperature fallback
+            return self._transcribe_full(clip, language, initial_prompt=prompt)["text"]
+        
+        return result.text.strip()
+    
+    def _transcribe_full(
+        self,
+        audio: Union[str, np.ndarray],
+        language: str,
+        **decode_options
+    ) -> dict:
+        """
+        The backend's long-form transcribe over the whole input
+        """
+        return self.backend.transcribe_full(audio, language, **decode_options)
+    
     def transcribe_german(self, audio_path: str) -> str:
         """
         Transcribe German audio to text
@@ -92,24 +698,188 @@ class SpeechToText:
         return result["text"]
 
 # ========================================================
-# Text-to-Speech (gTTS)
+# Text-to-Speech Backends
+# ========================================================
+
+class GTTSBackend:
+    """
+    Google Text-to-Speech (network round-trip per request, MP3)
+    """
+    
+    name = "gtts"
+    extension = ".mp3"
+    
+    def stream(self, text: str, language: str = TTS_LANGUAGE, slow: bool = False) -> Iterator[bytes]:
+        """
+        Yield MP3 bytes as Google returns them (one chunk per text part)
+        """
+        yield from gTTS(text=text, lang=language, slow=slow).stream()
+
+class MmsTtsBackend:
+    """
+    Local VITS engine (Meta MMS-TTS via transformers), CPU, no network
+    
+    One checkpoint covers one language (facebook/mms-tts-mar = Marathi).
+    The model is loaded once and synthesizes the whole sentence in-process.
+    """
+    
+    name = "mms"
+    extension = ".wav"
+    
+    def __init__(self, model_name: str = TTS_LOCAL_MODEL, language: str = TTS_LANGUAGE):
+        """
+        Load the VITS model and tokenizer
+        
+        Args:
+            model_name: HuggingFace MMS-TTS checkpoint
+            language: Language code the checkpoint speaks
+        """
+        from transformers import AutoTokenizer, VitsModel
+        
+        print(f"🔄 Loading local TTS model: {model_name}")
+        self.model_name = model_name
+        self.language = language
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self.model = VitsModel.from_pretrained(model_name)
+        self.model.eval()
+        self.sample_rate = self.model.config.sampling_rate
+        if getattr(self.tokenizer, "is_uroman", False):
+            print(f"⚠️  {model_name} expects romanized (uroman) input")
+    
+    def stream(self, text: str, language: str = TTS_LANGUAGE, slow: bool = False) -> Iterator[bytes]:
+        """
+        Yield one 16-bit mono WAV file (`slow` is not supported and ignored)
+        """
+        if language != self.language:
+            raise ValueError(f"{self.model_name} only speaks '{self.language}', not '{language}'")
+        
+        inputs = self.tokenizer(text, return_tensors="pt")
+        with torch.inference_mode():
+            waveform = self.model(**inputs).waveform[0].numpy()
+        pcm = (np.clip(waveform, -1.0, 1.0) * 32767).astype("<i2")
+        
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(self.sample_rate)
+            wav.writeframes(pcm.tobytes())
+        yield buffer.getvalue()
+
+TTS_BACKENDS = {
+    GTTSBackend.name: GTTSBackend,
+    MmsTtsBackend.name: MmsTtsBackend
+}
+
+def create_tts_backend(backend: str):
+    """
+    Create a text-to-speech backend by name
+    
+    Args:
+        backend: "gtts" or "mms"
+        
+    Returns:
+        Backend instance with name, extension and stream()
+    """
+    if backend not in TTS_BACKENDS:
+        raise ValueError(f"Unknown TTS backend: {backend} (options: {', '.join(TTS_BACKENDS)})")
+    return TTS_BACKENDS[backend]()
+
+# ========================================================
+# Sentence Splitting & Audio Joining
+# ========================================================
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Split (Marathi) text at sentence boundaries, keeping the punctuation
+    
+    Args:
+        text: Text to split
+        
+    Returns:
+        Non-empty sentences in order
+    """
+    sentences = []
+    start = 0
+    for match in SENTENCE_END.finditer(text):
+        end = match.end()
+        if match.group().startswith("."):
+            if end < len(text) and not text[end].isspace():
+                continue  # 3.5, URLs, "..." before its last dot
+            words = text[start:match.start()].split()
+            if words and (words[-1] in SENTENCE_ABBREVIATIONS or len(words[-1]) == 1):
+                continue
+        sentences.append(text[start:end])
+        start = end
+    sentences.append(text[start:])
+    return [sentence.strip() for sentence in sentences if sentence.strip()]
+
+def join_wav(parts: List[bytes]) -> bytes:
+    """
+    Concatenate WAV files with identical formats (PCM frames copied, no re-encoding)
+    
+    Args:
+        parts: Complete WAV files
+        
+    Returns:
+        One WAV file
+    """
+    buffer = io.BytesIO()
+    params = None
+    with wave.open(buffer, "wb") as output:
+        for part in parts:
+            with wave.open(io.BytesIO(part)) as wav:
+                if params is None:
+                    params = wav.getparams()
+                    output.setnchannels(params.nchannels)
+                    output.setsampwidth(params.sampwidth)
+                    output.setframerate(params.framerate)
+                elif wav.getparams()[:3] != params[:3]:
+                    raise ValueError("Cannot join WAV files with different formats")
+                output.writeframes(wav.readframes(wav.getnframes()))
+    return buffer.getvalue()
+
+# ========================================================
+# Text-to-Speech
 # ========================================================
 
 class TextToSpeech:
     """
-    Text-to-Speech using Google TTS (gTTS)
+    Text-to-Speech through the configured backend (gTTS or local MMS-TTS)
+    Outputs are content-addressed, so repeated text is served from disk
     """
     
-    def __init__(self, output_dir: str = AUDIO_OUTPUT_DIR):
+    def __init__(
+        self,
+        output_dir: str = AUDIO_OUTPUT_DIR,
+        cache_max_mb: float = TTS_CACHE_MAX_MB,
+        backend: str = TTS_BACKEND,
+        sentence_workers: int = TTS_SENTENCE_WORKERS
+    ):
         """
         Initialize TTS
         
         Args:
             output_dir: Directory to save generated audio files
+            cache_max_mb: Disk budget for cached audio (0 disables caching)
+            backend: TTS backend name (see TTS_BACKENDS)
+            sentence_workers: Sentences synthesized concurrently per text
         """
+        self.backend = create_tts_backend(backend)
+        # Engine (and checkpoint, for local models): part of every audio cache key
+        model_name = getattr(self.backend, "model_name", None)
+        self.model_id = f"{self.backend.name}|{model_name}" if model_name else self.backend.name
+        self._sentence_pool = (
+            ThreadPoolExecutor(max_workers=sentence_workers, thread_name_prefix="tts-sentence")
+            if sentence_workers > 1 else None
+        )
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        print(f"✅ TTS initialized, output: {self.output_dir}")
+        self.cache = (
+            AudioFileCache(self.output_dir, max_bytes=int(cache_max_mb * 1024 * 1024))
+            if cache_max_mb > 0 else None
+        )
+        print(f"✅ TTS initialized ({self.backend.name}), output: {self.output_dir}")
     
     def synthesize(
         self, 
@@ -124,32 +894,135 @@ class TextToSpeech:
         Args:
             text: Text to convert
             language: Language code (mr for Marathi)
-            filename: Output filename (auto-generated if None)
+            filename: Output filename (content-addressed and cached if None)
             slow: Speak slowly
             
         Returns:
             Path to generated audio file
         """
-        print(f"🔊 Generating speech for: {text[:50]}...")
+        extension = self.backend.extension
         
-        # Generate filename if not provided
+        # Content-addressed name: same (engine, text, language, slow) → same file in every process
         if filename is None:
-            filename = f"tts_{hash(text) % 1000000}.mp3"
+            filename = self.cache_filename(text, language, slow)
+            cached = self.cache.get(filename) if self.cache is not None else None
+            if cached is not None:
+                print(f"⚡ TTS cache hit: {filename}")
+                return cached
         
-        # Ensure .mp3 extension
-        if not filename.endswith('.mp3'):
-            filename += '.mp3'
+        # Ensure the backend's extension
+        if not filename.endswith(extension):
+            filename += extension
         
         output_path = self.output_dir / filename
         
-        # Generate speech
-        tts = gTTS(text=text, lang=language, slow=slow)
-        tts.save(str(output_path))
+        print(f"🔊 Generating speech for: {text[:50]}...")
+        
+        # Generate speech into a temp file so readers never see a partial file
+        with tempfile.NamedTemporaryFile(dir=self.output_dir, suffix=".tmp", delete=False) as temp_file:
+            try:
+                for chunk in self._render(text, language, slow):
+                    temp_file.write(chunk)
+            except Exception:
+                os.unlink(temp_file.name)
+                raise
+        os.replace(temp_file.name, output_path)
+        
+        if self.cache is not None and self.cache.is_managed(filename):
+            self.cache.put(filename)
         
         print(f"✅ Audio saved: {output_path}")
         
         return str(output_path)
     
+    def cache_filename(self, text: str, language: str = TTS_LANGUAGE, slow: bool = False) -> str:
+        """
+        Content-addressed file name for (engine, text, language, slow)
+        """
+        key = make_cache_key("tts", self.model_id, text, language=language, slow=slow)
+        return f"tts_{key}{self.backend.extension}"
+    
+    def stream(self, text: str, language: str = TTS_LANGUAGE, slow: bool = False) -> Iterator[bytes]:
+        """
+        Yield audio bytes as soon as the backend produces them
+        
+        Cached audio is read from disk; otherwise the chunks are teed into
+        the cache file, which only appears once the stream completed.
+        
+        Args:
+            text: Text to convert
+            language: Language code (mr for Marathi)
+            slow: Speak slowly
+            
+        Yields:
+            Encoded audio chunks (format given by backend.extension)
+        """
+        filename = self.cache_filename(text, language, slow)
+        cached = self.cache.get(filename) if self.cache is not None else None
+        if cached is not None:
+            print(f"⚡ TTS cache hit: {filename}")
+            with open(cached, "rb") as audio:
+                while True:
+                    chunk = audio.read(TTS_STREAM_CHUNK_BYTES)
+                    if not chunk:
+                        return
+                    yield chunk
+        
+        print(f"🔊 Streaming speech for: {text[:50]}...")
+        if self.cache is None:
+            yield from self._render(text, language, slow)
+            return
+        
+        temp_file = tempfile.NamedTemporaryFile(dir=self.output_dir, suffix=".tmp", delete=False)
+        try:
+            for chunk in self._render(text, language, slow):
+                temp_file.write(chunk)
+                yield chunk
+        except BaseException:
+            # Synthesis failed or the client went away: never cache a partial file
+            temp_file.close()
+            os.unlink(temp_file.name)
+            raise
+        temp_file.close()
+        os.replace(temp_file.name, self.output_dir / filename)
+        self.cache.put(filename)
+    
+    def _render(self, text: str, language: str, slow: bool) -> Iterator[bytes]:
+        """
+        Audio chunks for `text`: one backend call, or concurrent per-sentence calls
+        """
+        sentences = split_sentences(text)
+        if self._sentence_pool is None or len(sentences) < 2:
+            return self.backend.stream(text, language, slow)
+        
+        print(f"🔊 Synthesizing {len(sentences)} sentences in parallel")
+        parts = self._synthesize_sentences(sentences, language, slow)
+        if self.backend.extension == ".wav":
+            return iter([join_wav(list(parts))])
+        return parts  # MP3 frames concatenate as-is
+    
+    def _synthesize_sentences(self, sentences: List[str], language: str, slow: bool) -> Iterator[bytes]:
+        """
+        Audio of each sentence in order, synthesized on the bounded sentence pool
+        Each sentence goes through stream(), so it is cached on its own
+        """
+        futures = [
+            self._sentence_pool.submit(self._sentence_audio, sentence, language, slow)
+            for sentence in sentences
+        ]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+    
+    def _sentence_audio(self, sentence: str, language: str, slow: bool) -> bytes:
+        """
+        Complete audio of one sentence (cached like any other text)
+        """
+        return b"".join(self.stream(sentence, language, slow))
+    
     def synthesize_marathi(
         self, 
         marathi_text: str, 
@@ -183,7 +1056,9 @@ class SpeechPipeline:
     def __init__(
         self, 
         whisper_model: str = WHISPER_MODEL_NAME,
-        output_dir: str = AUDIO_OUTPUT_DIR
+        output_dir: str = AUDIO_OUTPUT_DIR,
+        stt: Optional[SpeechToText] = None,
+        tts: Optional[TextToSpeech] = None
     ):
         """
         Initialize speech pipeline
@@ -191,29 +1066,32 @@ class SpeechPipeline:
         Args:
             whisper_model: Whisper model size
             output_dir: Audio output directory
+            stt: Already loaded SpeechToText (loaded here if None)
+            tts: Already initialized TextToSpeech (created here if None)
         """
         print("=" * 60)
         print("🚀 Initializing Speech Pipeline")
         print("=" * 60)
         
-        self.stt = SpeechToText(whisper_model)
-        self.tts = TextToSpeech(output_dir)
+        self.stt = stt or SpeechToText(whisper_model)
+        self.tts = tts or TextToSpeech(output_dir)
         
         print("✅ Speech pipeline ready!")
         print("=" * 60)
     
-    def audio_to_text(self, audio_path: str, language: str = "de") -> str:
+    def audio_to_text(self, audio: Union[str, np.ndarray], language: str = "de", **options) -> str:
         """
         Convert audio to text
         
         Args:
-            audio_path: Path to audio file
+            audio: Path to audio file, or 16 kHz mono float32 samples
             language: Language code
+            **options: Passed to SpeechToText.transcribe (e.g. speech_segments)
             
         Returns:
             Transcribed text
         """
-        return self.stt.transcribe(audio_path, language)["text"]
+        return self.stt.transcribe(audio, language, **options)["text"]
     
     def text_to_audio(
         self, 
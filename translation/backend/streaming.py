@@ -0,0 +1,270 @@
+"""
+Streaming Speech Module
+Incremental Whisper transcription over a sliding window for WebSocket clients
+
+Protocol (/ws/speech-translate):
+  Client → server
+    text   {"type": "start", "sample_rate": 16000}   optional, default 16000
+    binary raw PCM, 16-bit little-endian, mono
+    text   {"type": "end"}                           flush and finish
+  Server → client
+    {"type": "partial", "text": ...}                 unstable tail, may change
+    {"type": "segment", "german", "english", "marathi", "start", "end"}
+    {"type": "done"}  /  {"type": "error", "detail": ...}
+"""
+
+import os
+import json
+import asyncio
+import numpy as np
+from typing import Awaitable, Callable, List, Tuple
+from fastapi import WebSocket, WebSocketDisconnect
+
+# ========================================================
+# Configuration
+# ========================================================
+
+SAMPLE_RATE = 16000  # Whisper input rate
+
+# New audio (seconds) needed before the window is decoded again
+STREAM_STEP_SECONDS = float(os.getenv("STREAM_STEP_SECONDS", "1.0"))
+
+# Segments ending this close to the live edge are not final yet
+STREAM_STABILITY_MARGIN = float(os.getenv("STREAM_STABILITY_MARGIN", "1.5"))
+
+# Longest window kept before segments are committed regardless (< 30s Whisper context)
+STREAM_WINDOW_SECONDS = float(os.getenv("STREAM_WINDOW_SECONDS", "20"))
+
+# Highest client sample rate accepted in the "start" message
+STREAM_MAX_SAMPLE_RATE = 192000
+
+# ========================================================
+# Sliding-Window Transcriber
+# ========================================================
+
+def parse_sample_rate(value) -> int:
+    """
+    Validate the sample rate a client announces in its "start" message
+
+    Args:
+        value: Value from the JSON message
+
+    Returns:
+        Sample rate in Hz
+
+    Raises:
+        ValueError: If it is not a whole number between 1 and STREAM_MAX_SAMPLE_RATE
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not float(value).is_integer():
+        raise ValueError(f"sample_rate must be a whole number, got {value!r}")
+    if not 1 <= value <= STREAM_MAX_SAMPLE_RATE:
+        raise ValueError(f"sample_rate must be between 1 and {STREAM_MAX_SAMPLE_RATE}, got {value!r}")
+    return int(value)
+
+class StreamingTranscriber:
+    """
+    Audio buffer + commit logic for incremental Whisper decoding
+
+    The buffer holds audio not yet committed. After each decode, segments
+    that end well before the live edge are committed (emitted once, then
+    cut from the buffer); the rest is reported as a partial transcript.
+    Model calls happen outside this class so it never blocks the event loop.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = SAMPLE_RATE,
+        step_seconds: float = STREAM_STEP_SECONDS,
+        stability_margin: float = STREAM_STABILITY_MARGIN,
+        window_seconds: float = STREAM_WINDOW_SECONDS
+    ):
+        """
+        Create an empty session buffer
+
+        Args:
+            sample_rate: Sample rate of the incoming PCM
+            step_seconds: New audio needed before the next decode
+            stability_margin: Distance from the live edge a segment must keep
+            window_seconds: Buffer length that forces a commit
+        """
+        self.input_rate = sample_rate
+        self.step_seconds = step_seconds
+        self.stability_margin = stability_margin
+        self.window_seconds = window_seconds
+
+        self.buffer = np.zeros(0, dtype=np.float32)
+        self.buffer_start = 0.0  # stream time (s) of buffer[0]
+        self.new_samples = 0
+        self.committed_text: List[str] = []
+
+    def add_audio(self, pcm: bytes):
+        """
+        Append 16-bit PCM audio (resampled to 16 kHz if needed)
+
+        Args:
+            pcm: Raw little-endian int16 mono samples
+        """
+        samples = np.frombuffer(pcm[:len(pcm) - len(pcm) % 2], dtype="<i2").astype(np.float32) / 32768.0
+        if self.input_rate != SAMPLE_RATE and len(samples):
+            duration = len(samples) / self.input_rate
+            target = np.linspace(0, duration, int(duration * SAMPLE_RATE), endpoint=False)
+            source = np.arange(len(samples)) / self.input_rate
+            samples = np.interp(target, source, samples).astype(np.float32)
+
+        self.buffer = np.concatenate([self.buffer, samples])
+        self.new_samples += len(samples)
+
+    def should_decode(self) -> bool:
+        """
+        True once enough new audio arrived since the last decode
+        """
+        return self.new_samples >= self.step_seconds * SAMPLE_RATE
+
+    def snapshot(self) -> Tuple[np.ndarray, str]:
+        """
+        Audio to decode now, plus a prompt with recently committed text
+
+        Returns:
+            (audio copy, initial prompt for Whisper)
+        """
+        self.new_samples = 0
+        prompt = " ".join(self.committed_text)[-200:]
+        return self.buffer.copy(), prompt
+
+    def update(self, segments: List[dict], decoded_seconds: float, final: bool = False) -> Tuple[List[dict], str]:
+        """
+        Commit stable segments from a decode of the first `decoded_seconds`
+
+        Args:
+            segments: Whisper segments (start/end relative to the snapshot)
+            decoded_seconds: Length of the decoded snapshot
+            final: Commit everything (end of stream)
+
+        Returns:
+            (committed segments with stream timestamps, partial text)
+        """
+        segments = [seg for seg in segments if seg.get("text", "").strip()]
+
+        if final:
+            stable = segments
+        else:
+            edge = decoded_seconds - self.stability_margin
+            # The last segment can still grow, so it is never committed early
+            stable = [seg for seg in segments[:-1] if seg["end"] <= edge]
+            if not stable and decoded_seconds >= self.window_seconds and len(segments) > 1:
+                stable = segments[:-1]
+            elif not stable and decoded_seconds >= self.window_seconds:
+                stable = segments  # one long segment: cut at the window
+
+        committed = [
+            {
+                "text": seg["text"].strip(),
+                "start": round(self.buffer_start + seg["start"], 2),
+                "end": round(self.buffer_start + seg["end"], 2)
+            }
+            for seg in stable
+        ]
+
+        if stable:
+            cut = min(stable[-1]["end"], decoded_seconds) if not final else len(self.buffer) / SAMPLE_RATE
+            self.buffer = self.buffer[int(cut * SAMPLE_RATE):]
+            self.buffer_start += cut
+            self.committed_text.extend(seg["text"] for seg in committed)
+        elif decoded_seconds >= self.window_seconds:
+            # A full window without speech: drop it so the buffer stays bounded
+            self.buffer = self.buffer[int(decoded_seconds * SAMPLE_RATE):]
+            self.buffer_start += decoded_seconds
+
+        partial = " ".join(seg["text"].strip() for seg in segments[len(stable):])
+        return committed, partial
+
+# ========================================================
+# WebSocket Session
+# ========================================================
+
+async def run_streaming_session(
+    websocket: WebSocket,
+    transcribe: Callable[[np.ndarray, str], Awaitable[List[dict]]],
+    translate: Callable[[str], Awaitable[dict]]
+):
+    """
+    Serve one accepted WebSocket connection until the client ends or leaves
+
+    A receiver task only buffers audio; a processor task decodes the latest
+    window whenever enough new audio arrived, so decoding never falls behind
+    on a backlog of tiny chunks.
+
+    Args:
+        websocket: Accepted WebSocket
+        transcribe: async (audio, prompt) → Whisper segments
+        translate: async German text → {"german", "english", "marathi"}
+    """
+    session = StreamingTranscriber()
+    audio_arrived = asyncio.Event()
+    ended = False
+
+    async def receiver():
+        nonlocal ended
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+
+            if message.get("bytes"):
+                session.add_audio(message["bytes"])
+                if session.should_decode():
+                    audio_arrived.set()
+            elif message.get("text"):
+                data = json.loads(message["text"])
+                if data.get("type") == "start":
+                    # Reported to the client as an error message (see below)
+                    session.input_rate = parse_sample_rate(data.get("sample_rate", SAMPLE_RATE))
+                elif data.get("type") == "end":
+                    ended = True
+                    audio_arrived.set()
+                    return
+
+    async def emit_segments(committed):
+        for segment in committed:
+            result = await translate(segment["text"])
+            await websocket.send_json({
+                "type": "segment",
+                "german": result["german"],
+                "english": result["english"],
+                "marathi": result["marathi"],
+                "start": segment["start"],
+                "end": segment["end"]
+            })
+
+    async def processor():
+        while True:
+            await audio_arrived.wait()
+            audio_arrived.clear()
+            final = ended
+
+            audio, prompt = session.snapshot()
+            if len(audio):
+                segments = await transcribe(audio, prompt)
+                committed, partial = session.update(segments, len(audio) / SAMPLE_RATE, final=final)
+                await emit_segments(committed)
+                if partial and not final:
+                    await websocket.send_json({"type": "partial", "text": partial})
+
+            if final:
+                await websocket.send_json({"type": "done"})
+                return
+
+    tasks = [asyncio.ensure_future(receiver()), asyncio.ensure_future(processor())]
+    try:
+        await asyncio.gather(*tasks)
+    except WebSocketDisconnect:
+        print("🔌 Streaming client disconnected")
+    except Exception as e:
+        print(f"❌ Streaming error: {e}")
+        try:
+            await websocket.send_json({"type": "error", "detail": str(e)})
+        except Exception:
+            pass
+    finally:
+        for task in tasks:
+            task.cancel()
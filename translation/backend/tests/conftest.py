@@ -0,0 +1,8 @@
+"""
+Backend modules import each other by plain name (as when run from backend/)
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,82 @@
+"""
+Tests for upload decoding (native WAV path, ffmpeg pipe, MP4 temp-file fallback)
+"""
+
+import io
+import shutil
+import subprocess
+import wave
+
+import pytest
+
+np = pytest.importorskip("numpy")
+speech_module = pytest.importorskip("speech_module")
+
+from speech_module import SAMPLE_RATE, AudioDecodeError, decode_audio_bytes
+
+needs_ffmpeg = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+
+def _wav(samples, rate=SAMPLE_RATE, channels=1):
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype("<i2")
+    if channels > 1:
+        pcm = np.repeat(pcm, channels)
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(pcm.tobytes())
+    return buffer.getvalue()
+
+def _tone(seconds, rate=SAMPLE_RATE):
+    t = np.arange(int(seconds * rate)) / rate
+    return (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+
+def test_wav_round_trip_without_ffmpeg(monkeypatch):
+    def no_ffmpeg(*args, **kwargs):
+        raise AssertionError("16 kHz WAV must not go through ffmpeg")
+
+    monkeypatch.setattr(speech_module, "_decode_ffmpeg", no_ffmpeg)
+    tone = _tone(0.5)
+
+    for source in (_wav(tone), io.BytesIO(_wav(tone)), io.BytesIO(_wav(tone, channels=2))):
+        samples = decode_audio_bytes(source)
+        assert samples.dtype == np.float32
+        assert len(samples) == len(tone)
+        assert np.max(np.abs(samples - tone)) < 2 / 32768
+
+@needs_ffmpeg
+def test_other_rates_are_resampled_by_ffmpeg():
+    samples = decode_audio_bytes(_wav(_tone(1.0, rate=8000), rate=8000))
+    assert abs(len(samples) - SAMPLE_RATE) < SAMPLE_RATE // 100
+
+def test_unseekable_formats_fall_back_to_a_temp_file(monkeypatch):
+    data = b"\x00\x00\x00\x18ftypmp42" + b"\x00" * 64
+    seen = {}
+
+    def pipe_fails(command, **kwargs):
+        raise subprocess.CalledProcessError(1, command)
+
+    def load_audio(path, sr):
+        with open(path, "rb") as f:
+            seen["data"] = f.read()
+        return np.zeros(sr, dtype=np.float32)
+
+    monkeypatch.setattr(speech_module.subprocess, "run", pipe_fails)
+    monkeypatch.setattr(speech_module.whisper, "load_audio", load_audio)
+
+    assert len(decode_audio_bytes(data)) == SAMPLE_RATE
+    assert seen["data"] == data
+
+def test_empty_input_raises():
+    with pytest.raises(AudioDecodeError):
+        decode_audio_bytes(b"")
+    with pytest.raises(AudioDecodeError):
+        decode_audio_bytes(io.BytesIO())
+
+@needs_ffmpeg
+def test_corrupt_input_raises():
+    with pytest.raises(AudioDecodeError):
+        decode_audio_bytes(b"RIFF\x10\x00\x00\x00WAVEnot really audio")
+    with pytest.raises(AudioDecodeError):
+        decode_audio_bytes(b"\xff" * 4096)
@@ -0,0 +1,75 @@
+"""
+Tests for the micro-batcher (grouping, max-size flushing, error fan-out)
+"""
+
+import asyncio
+
+import pytest
+
+from batching import MicroBatcher
+
+def test_concurrent_items_share_one_batch():
+    calls = []
+
+    async def process(items):
+        calls.append(list(items))
+        return [item * 2 for item in items]
+
+    async def scenario():
+        batcher = MicroBatcher(process, max_batch_size=8, max_wait_ms=50)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+        await batcher.stop()
+        return results, batcher
+
+    results, batcher = asyncio.run(scenario())
+    assert results == [0, 2, 4, 6, 8]
+    assert calls == [[0, 1, 2, 3, 4]]
+    assert batcher.stats()["batch_size_distribution"] == {"5": 1}
+
+def test_full_batch_flushes_before_window_closes():
+    calls = []
+
+    async def process(items):
+        calls.append(list(items))
+        return items
+
+    async def scenario():
+        # A window this long would time the test out if a full batch waited for it
+        batcher = MicroBatcher(process, max_batch_size=3, max_wait_ms=60_000)
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(i) for i in range(6))), timeout=5
+        )
+        await batcher.stop()
+        return results
+
+    assert asyncio.run(scenario()) == list(range(6))
+    assert calls == [[0, 1, 2], [3, 4, 5]]
+
+def test_batch_error_reaches_every_caller():
+    async def process(items):
+        raise ValueError("model failed")
+
+    async def scenario():
+        batcher = MicroBatcher(process, max_batch_size=4, max_wait_ms=20)
+        results = await asyncio.gather(
+            *(batcher.submit(i) for i in range(3)), return_exceptions=True
+        )
+        await batcher.stop()
+        return results
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(result, ValueError) for result in results)
+
+def test_result_count_mismatch_is_an_error():
+    async def process(items):
+        return items[:-1]
+
+    async def scenario():
+        batcher = MicroBatcher(process, max_batch_size=4, max_wait_ms=20)
+        try:
+            with pytest.raises(RuntimeError, match="results for"):
+                await asyncio.gather(batcher.submit(1), batcher.submit(2))
+        finally:
+            await batcher.stop()
+
+    asyncio.run(scenario())
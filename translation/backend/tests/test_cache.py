@@ -0,0 +1,145 @@
+"""
+Tests for the memory LRU and its SQLite tier (TTL and batched access times)
+and for the content-addressed TTS audio cache
+"""
+
+import os
+import json
+import time
+import sqlite3
+
+from cache import AudioFileCache, TranslationCache, TranslationCacheStore, make_cache_key
+
+def test_ttl_applies_to_store_hits(tmp_path):
+    store = TranslationCacheStore(str(tmp_path / "cache.db"), ttl_seconds=0.2)
+    cache = TranslationCache(ttl_seconds=0.2, store=store)
+    cache.put("k", "v", stage="de_en", model_id="m")
+    assert cache.get("k") == "v"
+
+    time.sleep(0.3)
+    # Expired in memory must not be read back from SQLite as a hit
+    assert cache.get("k") is None
+    assert cache.store_hits == 0
+    assert cache.misses == 1
+    assert store.count() == 0
+    assert store.expirations == 1
+
+def test_store_hit_keeps_original_age(tmp_path):
+    store = TranslationCacheStore(str(tmp_path / "cache.db"), ttl_seconds=0.3)
+    TranslationCache(ttl_seconds=0.3, store=store).put("k", "v", stage="de_en", model_id="m")
+    time.sleep(0.2)
+
+    # A fresh worker reads it from the store; the TTL still counts from the first write
+    cache = TranslationCache(ttl_seconds=0.3, store=store)
+    assert cache.get("k") == "v"
+    time.sleep(0.15)
+    assert cache.get("k") is None
+
+def test_reads_batch_access_time_updates(tmp_path):
+    db_path = str(tmp_path / "cache.db")
+    store = TranslationCacheStore(db_path, ttl_seconds=0)
+    store.put("k", "v", stage="de_en", model_id="m")
+    reader = sqlite3.connect(db_path)
+    written = reader.execute("SELECT accessed_at FROM translations").fetchone()[0]
+
+    time.sleep(0.01)
+    assert store.get("k") == "v"
+    assert reader.execute("SELECT accessed_at FROM translations").fetchone()[0] == written
+
+    store.flush()
+    assert reader.execute("SELECT accessed_at FROM translations").fetchone()[0] > written
+
+def test_warm_start_skips_expired_rows(tmp_path):
+    store = TranslationCacheStore(str(tmp_path / "cache.db"), ttl_seconds=0.2)
+    store.put("old", "1", stage="de_en", model_id="m")
+    time.sleep(0.3)
+    store.put("new", "2", stage="de_en", model_id="m")
+
+    cache = TranslationCache(ttl_seconds=0.2, store=store)
+    assert cache.warm_start() == 1
+    assert cache.get("new") == "2"
+
+def test_old_database_gets_created_at(tmp_path):
+    db_path = str(tmp_path / "cache.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE translations (key TEXT PRIMARY KEY, stage TEXT NOT NULL, "
+        "model_id TEXT NOT NULL, value TEXT NOT NULL, accessed_at REAL NOT NULL)"
+    )
+    conn.execute("INSERT INTO translations VALUES ('k', 'de_en', 'm', 'v', ?)", (time.time(),))
+    conn.commit()
+    conn.close()
+
+    store = TranslationCacheStore(db_path, ttl_seconds=60)
+    assert store.get("k") == "v"
+
+def _audio(directory, text, size=100):
+    filename = f"tts_{make_cache_key('tts', 'gtts', text)}.mp3"
+    (directory / filename).write_bytes(b"x" * size)
+    return filename
+
+def test_audio_cache_hit_by_content_address(tmp_path):
+    cache = AudioFileCache(str(tmp_path), max_bytes=10_000)
+    filename = _audio(tmp_path, "नमस्कार")
+    cache.put(filename)
+
+    # The same text maps to the same name, in this worker or another one
+    assert f"tts_{make_cache_key('tts', 'gtts', 'नमस्कार')}.mp3" == filename
+    assert cache.get(filename) == str(tmp_path / filename)
+    assert AudioFileCache(str(tmp_path), max_bytes=10_000).get(filename) == str(tmp_path / filename)
+    assert cache.get(f"tts_{make_cache_key('tts', 'gtts', 'other')}.mp3") is None
+    assert cache.stats()["files"] == 1
+
+def test_audio_index_survives_restart(tmp_path):
+    cache = AudioFileCache(str(tmp_path), max_bytes=300)
+    first, second = _audio(tmp_path, "eins"), _audio(tmp_path, "zwei")
+    cache.put(first)
+    cache.put(second)
+    time.sleep(0.01)
+    cache.get(first)  # first is now the most recently used
+    cache.flush()
+
+    restarted = AudioFileCache(str(tmp_path), max_bytes=300)
+    assert restarted.stats()["files"] == 2
+    assert restarted.last_access(first) > restarted.last_access(second)
+
+    third, fourth = _audio(tmp_path, "drei"), _audio(tmp_path, "vier")
+    restarted.put(third)
+    restarted.put(fourth)
+    assert not (tmp_path / second).exists()
+    assert (tmp_path / first).exists()
+
+def test_audio_cache_evicts_least_recently_used(tmp_path):
+    cache = AudioFileCache(str(tmp_path), max_bytes=250)
+    names = [_audio(tmp_path, text) for text in ("eins", "zwei", "drei")]
+    cache.is_protected = lambda filename: filename == names[0]
+    for filename in names:
+        cache.put(filename)
+        time.sleep(0.01)
+
+    # Over budget by one file: the oldest unprotected file goes
+    assert [(tmp_path / filename).exists() for filename in names] == [True, False, True]
+    assert cache.stats()["bytes"] == 200 and cache.evictions == 1
+
+def test_audio_workers_do_not_drop_each_others_entries(tmp_path):
+    worker_a = AudioFileCache(str(tmp_path), max_bytes=10_000)
+    worker_b = AudioFileCache(str(tmp_path), max_bytes=10_000)
+    worker_a.put(_audio(tmp_path, "eins"))
+    worker_b.put(_audio(tmp_path, "zwei"))
+    worker_a.put(_audio(tmp_path, "drei"))
+
+    assert AudioFileCache(str(tmp_path), max_bytes=10_000).stats()["files"] == 3
+    assert worker_b.stats()["files"] == 3
+
+def test_audio_cache_imports_legacy_json_index(tmp_path):
+    old, new = _audio(tmp_path, "alt"), _audio(tmp_path, "neu")
+    now = time.time()
+    os.utime(tmp_path / old, (now, now))
+    (tmp_path / ".tts_cache_index.json").write_text(json.dumps({
+        old: {"size": 100, "accessed_at": now - 3600},
+        new: {"size": 100, "accessed_at": now}
+    }))
+
+    cache = AudioFileCache(str(tmp_path), max_bytes=10_000)
+    assert cache.last_access(old) < cache.last_access(new)
+    assert not (tmp_path / ".tts_cache_index.json").exists()
@@ -0,0 +1,84 @@
+"""
+Tests for the sequential / pipelined cascade (no models: stages are fakes)
+"""
+
+import random
+import asyncio
+
+import pytest
+
+from cascade import run_pipelined, run_sequential
+
+def make_stage(tag, calls=None, fail_on=None):
+    """
+    Fake stage: tags every text, records each call, optionally fails on one input
+    """
+    async def stage(texts):
+        if calls is not None:
+            calls.append(list(texts))
+        await asyncio.sleep(0)
+        if fail_on is not None and fail_on in texts:
+            raise RuntimeError(f"{tag} failed")
+        return [f"{tag}({text})" for text in texts]
+    return stage
+
+def test_pipelined_matches_sequential_order():
+    texts = [f"s{i}" for i in range(37)]
+    sequential = asyncio.run(run_sequential(texts, make_stage("en"), make_stage("mr")))
+    pipelined = asyncio.run(run_pipelined(texts, make_stage("en"), make_stage("mr"), chunk_size=5))
+    assert pipelined == sequential
+    assert pipelined[3] == {"german": "s3", "english": "en(s3)", "marathi": "mr(en(s3))"}
+
+def test_pipelined_with_lengths_keeps_input_order():
+    texts = [f"s{i}" for i in range(40)]
+    lengths = [random.Random(i).randint(1, 50) for i in range(40)]
+    results = asyncio.run(run_pipelined(
+        texts, make_stage("en"), make_stage("mr"), chunk_size=8, lengths=lengths
+    ))
+    assert [result["german"] for result in results] == texts
+    assert all(result["marathi"] == f"mr(en({result['german']}))" for result in results)
+
+def test_pipelined_error_propagates_from_either_stage():
+    texts = [f"s{i}" for i in range(20)]
+    with pytest.raises(RuntimeError, match="en failed"):
+        asyncio.run(run_pipelined(texts, make_stage("en", fail_on="s12"), make_stage("mr"), chunk_size=4))
+    with pytest.raises(RuntimeError, match="mr failed"):
+        asyncio.run(run_pipelined(texts, make_stage("en"), make_stage("mr", fail_on="en(s2)"), chunk_size=4))
+
+def test_failed_stage_leaves_no_task_behind():
+    async def scenario():
+        with pytest.raises(RuntimeError, match="en failed"):
+            await run_pipelined(
+                [f"s{i}" for i in range(20)],
+                make_stage("en", fail_on="s12"),
+                make_stage("mr"),
+                chunk_size=4
+            )
+        return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+    assert asyncio.run(scenario()) == []
+
+def test_length_sorted_chunks_pad_less():
+    """
+    Throughput proxy: tokens a padded generate() processes = chunk size × longest item
+    Sorting before chunking must keep the bucketing benefit across chunks
+    """
+    rng = random.Random(0)
+    texts = [" ".join("w" for _ in range(rng.randint(1, 60))) for _ in range(256)]
+    lengths = [len(text.split()) for text in texts]
+
+    def padded_tokens(calls):
+        return sum(len(chunk) * max(len(text.split()) for text in chunk) for chunk in calls)
+
+    unsorted_calls, sorted_calls = [], []
+    asyncio.run(run_pipelined(texts, make_stage("en", unsorted_calls), make_stage("mr"), chunk_size=16))
+    asyncio.run(run_pipelined(
+        texts, make_stage("en", sorted_calls), make_stage("mr"), chunk_size=16, lengths=lengths
+    ))
+
+    real_tokens = sum(lengths)
+    unsorted_padding = padded_tokens(unsorted_calls) / real_tokens
+    sorted_padding = padded_tokens(sorted_calls) / real_tokens
+    assert unsorted_padding > 1.5
+    assert sorted_padding < 1.15
+    assert sorted_padding < unsorted_padding * 0.7
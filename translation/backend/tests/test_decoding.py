@@ -0,0 +1,43 @@
+"""
+Tests for decoding profile resolution and the length-derived token budget
+"""
+
+import pytest
+
+inference = pytest.importorskip("inference")
+
+from inference import (
+    DECODING_PROFILES,
+    DEFAULT_DECODING_PROFILE,
+    LENGTH_BUDGET_MARGIN,
+    length_budget,
+    resolve_decoding
+)
+
+def test_profile_resolves_per_stage_settings():
+    assert resolve_decoding("fast") == DECODING_PROFILES["fast"]
+    assert resolve_decoding(None) == DECODING_PROFILES[DEFAULT_DECODING_PROFILE]
+    assert resolve_decoding("") == DECODING_PROFILES[DEFAULT_DECODING_PROFILE]
+
+def test_beam_override_applies_to_both_stages():
+    decoding = resolve_decoding("quality", num_beams=1)
+    assert decoding["de_en"]["num_beams"] == 1 and decoding["en_mr"]["num_beams"] == 1
+    assert decoding["de_en"]["length_ratio"] == DECODING_PROFILES["quality"]["de_en"]["length_ratio"]
+    # The shared profile table is not modified
+    assert DECODING_PROFILES["quality"]["de_en"]["num_beams"] == 4
+
+def test_invalid_profile_and_beams_raise():
+    with pytest.raises(ValueError, match="Unknown decoding profile"):
+        resolve_decoding("turbo")
+    with pytest.raises(ValueError, match="num_beams"):
+        resolve_decoding("fast", num_beams=0)
+
+def test_length_budget_scales_with_source_length():
+    assert length_budget(10, 128, 1.5) == {"max_new_tokens": 15 + LENGTH_BUDGET_MARGIN}
+    assert length_budget(20, 128, 2.0) == {"max_new_tokens": 40 + LENGTH_BUDGET_MARGIN}
+
+def test_length_budget_is_capped_by_max_length():
+    assert length_budget(100, 128, 2.0) == {"max_new_tokens": 128}
+
+def test_no_ratio_uses_max_length():
+    assert length_budget(10, 128, None) == {"max_length": 128}
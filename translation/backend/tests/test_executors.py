@@ -0,0 +1,75 @@
+"""
+Tests for inference executor queue accounting (busy rejection, cancellation)
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from executors import ExecutorBusyError, InferenceExecutor
+
+async def _wait_until(predicate, timeout=5.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition not reached"
+        await asyncio.sleep(0.01)
+
+def test_full_queue_rejects_and_counts():
+    executor = InferenceExecutor("test", max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    async def scenario():
+        running = asyncio.ensure_future(executor.run(release.wait))
+        await _wait_until(lambda: executor.stats()["active"] == 1)
+        waiting = asyncio.ensure_future(executor.run(lambda: "second"))
+        await _wait_until(lambda: executor.stats()["queued"] == 1)
+
+        with pytest.raises(ExecutorBusyError):
+            await executor.run(lambda: "third")
+        busy = executor.stats()
+
+        release.set()
+        results = await asyncio.gather(running, waiting)
+        return busy, results
+
+    try:
+        busy, results = asyncio.run(scenario())
+    finally:
+        release.set()
+        executor.shutdown()
+    assert busy["active"] == 1 and busy["queued"] == 1 and busy["rejected"] == 1
+    assert results == [True, "second"]
+    stats = executor.stats()
+    assert stats["active"] == 0 and stats["queued"] == 0 and stats["completed"] == 2
+
+def test_cancelled_queued_call_frees_its_slot():
+    executor = InferenceExecutor("test", max_workers=1, max_queue=1)
+    release = threading.Event()
+    ran = []
+
+    async def scenario():
+        running = asyncio.ensure_future(executor.run(release.wait))
+        await _wait_until(lambda: executor.stats()["active"] == 1)
+        waiting = asyncio.ensure_future(executor.run(ran.append, "cancelled"))
+        await _wait_until(lambda: executor.stats()["queued"] == 1)
+
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        await _wait_until(lambda: executor.stats()["queued"] == 0)
+
+        # The freed slot takes a new call instead of reporting busy
+        replacement = asyncio.ensure_future(executor.run(lambda: "replacement"))
+        release.set()
+        return await asyncio.gather(running, replacement)
+
+    try:
+        results = asyncio.run(scenario())
+    finally:
+        release.set()
+        executor.shutdown()
+    assert results == [True, "replacement"]
+    assert ran == []
+    stats = executor.stats()
+    assert stats["queued"] == 0 and stats["completed"] == 2 and stats["rejected"] == 0
@@ -0,0 +1,90 @@
+"""
+Tests for audio cleanup (retention, limits, leases, minimum age)
+"""
+
+import os
+import time
+
+import janitor
+from janitor import AudioJanitor
+
+def _file(directory, name, age_seconds, size=10):
+    path = directory / name
+    path.write_bytes(b"x" * size)
+    mtime = time.time() - age_seconds
+    os.utime(path, (mtime, mtime))
+    return path
+
+def _names(directory):
+    return sorted(path.name for path in directory.iterdir() if path.is_file())
+
+def test_expired_files_are_deleted(tmp_path):
+    _file(tmp_path, "old.mp3", 2 * 3600)
+    _file(tmp_path, "new.mp3", 120)
+    _file(tmp_path, "stale.tmp", janitor.TEMP_FILE_MAX_AGE_SECONDS + 60)
+    _file(tmp_path, "writing.tmp", 10)
+
+    result = AudioJanitor(str(tmp_path), retention_hours=1, max_mb=0, max_files=0).sweep()
+
+    assert _names(tmp_path) == ["new.mp3", "writing.tmp"]
+    assert result["deleted_files"] == 2 and result["files"] == 2
+
+def test_leased_file_survives_until_released(tmp_path):
+    _file(tmp_path, "old.mp3", 2 * 3600)
+    cleaner = AudioJanitor(str(tmp_path), retention_hours=1, max_mb=0, max_files=0)
+
+    with cleaner.lease("old.mp3"):
+        cleaner.sweep()
+        assert _names(tmp_path) == ["old.mp3"]
+    assert not cleaner.is_leased("old.mp3")
+
+    cleaner.sweep()
+    assert _names(tmp_path) == []
+
+def test_abandoned_lease_times_out(tmp_path, monkeypatch):
+    _file(tmp_path, "old.mp3", 2 * 3600)
+    cleaner = AudioJanitor(str(tmp_path), retention_hours=1, max_mb=0, max_files=0)
+    cleaner.acquire("old.mp3")
+
+    monkeypatch.setattr(janitor, "LEASE_TIMEOUT_SECONDS", 0)
+    assert not cleaner.is_leased("old.mp3")
+    cleaner.sweep()
+    assert _names(tmp_path) == []
+
+def test_count_limit_deletes_least_recently_used(tmp_path):
+    for index, age in enumerate([500, 400, 300, 200]):
+        _file(tmp_path, f"{index}.mp3", age)
+
+    result = AudioJanitor(str(tmp_path), retention_hours=0, max_mb=0, max_files=2).sweep()
+
+    assert _names(tmp_path) == ["2.mp3", "3.mp3"]
+    assert result["files"] == 2
+
+def test_size_limit_skips_fresh_and_leased_files(tmp_path):
+    megabyte = 1024 * 1024
+    _file(tmp_path, "leased.mp3", 900, megabyte)
+    _file(tmp_path, "old.mp3", 800, megabyte)
+    _file(tmp_path, "fresh.mp3", janitor.AUDIO_MIN_AGE_SECONDS // 2, megabyte)
+    cleaner = AudioJanitor(str(tmp_path), retention_hours=0, max_mb=1, max_files=0)
+
+    with cleaner.lease("leased.mp3"):
+        result = cleaner.sweep()
+
+    # Still over the limit, but what is left is leased or too new to delete
+    assert _names(tmp_path) == ["fresh.mp3", "leased.mp3"]
+    assert result["bytes"] == 2 * megabyte
+
+def test_lease_from_another_process_is_honoured(tmp_path):
+    _file(tmp_path, "old.mp3", 2 * 3600)
+    # Two janitors on one directory, as in two serve.py workers
+    downloading = AudioJanitor(str(tmp_path), retention_hours=1, max_mb=0, max_files=0)
+    sweeping = AudioJanitor(str(tmp_path), retention_hours=1, max_mb=0, max_files=0)
+
+    lease_id = downloading.acquire("old.mp3")
+    assert sweeping.is_leased("old.mp3")
+    sweeping.sweep()
+    assert _names(tmp_path) == ["old.mp3"]
+
+    downloading.release("old.mp3", lease_id)
+    sweeping.sweep()
+    assert _names(tmp_path) == []
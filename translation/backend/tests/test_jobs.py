@@ -0,0 +1,207 @@
+"""
+Tests for the local job broker (state transitions, priority, limits, retries)
+"""
+
+import asyncio
+
+import pytest
+
+from jobs import (
+    FAILED,
+    QUEUED,
+    RUNNING,
+    SUCCEEDED,
+    Job,
+    JobBroker,
+    JobQueueFullError,
+    LocalJobBroker,
+    run_with_retry
+)
+
+class BusyError(RuntimeError):
+    pass
+
+def test_job_state_transitions_and_events():
+    async def scenario():
+        broker = LocalJobBroker(workers=1, max_queue=10)
+        release = asyncio.Event()
+
+        async def handler(job, payload):
+            job.update("working", 0.5)
+            await release.wait()
+            return payload.upper()
+
+        broker.register("echo", handler)
+        job = await broker.submit("echo", "hallo")
+        assert job.status == QUEUED
+
+        seen = []
+
+        async def follow():
+            async for state in broker.events(job.id):
+                if state is not None:
+                    seen.append((state["status"], state["stage"]))
+
+        follower = asyncio.ensure_future(follow())
+        while job.stage != "working":
+            await asyncio.sleep(0)
+        assert job.status == RUNNING
+        release.set()
+        await follower
+        await broker.stop()
+        return job, seen
+
+    job, seen = asyncio.run(scenario())
+    assert job.status == SUCCEEDED
+    assert job.result == "HALLO"
+    assert job.progress == 1.0
+    assert job.payload is None
+    assert seen[0][0] in (QUEUED, RUNNING)
+    assert ("running", "working") in seen
+    assert seen[-1] == (SUCCEEDED, "done")
+
+def test_failed_job_records_error():
+    async def scenario():
+        broker = LocalJobBroker(workers=1)
+
+        async def handler(job, payload):
+            raise ValueError("kaputt")
+
+        broker.register("bad", handler)
+        job = await broker.submit("bad", None)
+        async for _ in broker.events(job.id):
+            pass
+        await broker.stop()
+        return job, broker.stats()
+
+    job, stats = asyncio.run(scenario())
+    assert job.status == FAILED
+    assert job.error == "kaputt"
+    assert stats["failed"] == 1 and stats["succeeded"] == 0
+
+def test_priority_order_and_queue_limit():
+    async def scenario():
+        broker = LocalJobBroker(workers=1, max_queue=3)
+        order = []
+
+        async def handler(job, payload):
+            order.append(payload)
+
+        broker.register("t", handler)
+        await broker.submit("t", "low", priority=-1)
+        await broker.submit("t", "normal")
+        last = await broker.submit("t", "high", priority=5)
+        with pytest.raises(JobQueueFullError):
+            await broker.submit("t", "rejected")
+        with pytest.raises(ValueError):
+            await broker.submit("unknown", None)
+        async for _ in broker.events(last.id):
+            pass
+        while broker.stats()["queued"] or broker.stats()["running"]:
+            await asyncio.sleep(0)
+        await broker.stop()
+        return order, broker.stats()
+
+    order, stats = asyncio.run(scenario())
+    assert order == ["high", "normal", "low"]
+    assert stats["rejected"] == 1
+
+def test_busy_step_is_retried_not_failed():
+    async def scenario():
+        broker = LocalJobBroker(workers=1)
+        attempts = []
+
+        async def handler(job, payload):
+            async def step():
+                attempts.append(job.stage)
+                if len(attempts) < 3:
+                    raise BusyError("executor is busy")
+                return "ok"
+            job.update("translating")
+            return await run_with_retry(job, step, retry_on=(BusyError,), initial_delay=0.01)
+
+        broker.register("t", handler)
+        job = await broker.submit("t", None)
+        stages = []
+        async for state in broker.events(job.id):
+            if state is not None:
+                stages.append(state["stage"])
+        await broker.stop()
+        return job, attempts, stages
+
+    job, attempts, stages = asyncio.run(scenario())
+    assert job.status == SUCCEEDED and job.result == "ok"
+    assert attempts == ["translating"] * 3
+    assert any(stage.startswith("waiting for capacity") for stage in stages)
+
+def test_other_errors_are_not_retried():
+    async def scenario():
+        calls = []
+
+        async def step():
+            calls.append(1)
+            raise KeyError("x")
+
+        broker = LocalJobBroker(workers=1)
+
+        async def handler(job, payload):
+            return await run_with_retry(job, step, retry_on=(BusyError,), initial_delay=0.01)
+
+        broker.register("t", handler)
+        job = await broker.submit("t", None)
+        async for _ in broker.events(job.id):
+            pass
+        await broker.stop()
+        return job, calls
+
+    job, calls = asyncio.run(scenario())
+    assert job.status == FAILED
+    assert calls == [1]
+
+def test_broker_interface_is_abstract():
+    with pytest.raises(TypeError):
+        JobBroker()
+
+def test_timed_out_waiters_are_released():
+    async def scenario():
+        job = Job("t", None)
+        for _ in range(3):
+            assert not await job.wait_for_change(job.version, timeout=0.01)
+        return job
+
+    assert asyncio.run(scenario())._waiters == []
+
+def test_restarted_workers_keep_queued_jobs():
+    async def scenario():
+        broker = LocalJobBroker(workers=1)
+        release = asyncio.Event()
+        done = []
+
+        async def handler(job, payload):
+            if payload == "blocking":
+                await release.wait()
+            done.append(payload)
+
+        broker.register("t", handler)
+        first = await broker.submit("t", "blocking")
+        queued = await broker.submit("t", "queued")
+        while first.status != RUNNING:
+            await asyncio.sleep(0)
+        await broker.stop()
+
+        last = await broker.submit("t", "after restart")
+        async for _ in broker.events(last.id):
+            pass
+        await broker.stop()
+        return first, queued, done
+
+    first, queued, done = asyncio.run(scenario())
+    assert first.status == FAILED
+    assert queued.status == SUCCEEDED
+    assert done == ["queued", "after restart"]
+
+def test_disabled_broker_reports_reason():
+    broker = LocalJobBroker(workers=1)
+    assert not broker.shared and broker.disabled is None
+    broker.disable("several workers")
+    assert broker.stats()["disabled"] == "several workers"
@@ -0,0 +1,115 @@
+"""
+Tests for the model registry (parallel loading, ready callbacks, failures)
+"""
+
+import time
+import threading
+
+from model_registry import FAILED, READY, ModelRegistry
+
+def _wait_loaded(registry, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while any(status["status"] not in (READY, FAILED) for status in registry.status().values()):
+        assert time.monotonic() < deadline, "models still loading"
+        time.sleep(0.01)
+
+def test_models_load_in_parallel():
+    registry = ModelRegistry()
+    # Each loader waits for the other: only completes if both run at once
+    barrier = threading.Barrier(2, timeout=5)
+
+    def loader(name):
+        barrier.wait()
+        return f"model {name}"
+
+    registry.register("a", lambda: loader("a"))
+    registry.register("b", lambda: loader("b"))
+
+    registry.start()
+    _wait_loaded(registry)
+
+    assert registry.is_ready("a", "b")
+    assert registry.get("a") == "model a" and registry.get("b") == "model b"
+
+def test_when_ready_fires_once_with_models_in_order():
+    registry = ModelRegistry()
+    registry.register("a", lambda: "model a")
+    registry.register("b", lambda: "model b")
+    calls = []
+    registry.when_ready(["b", "a"], lambda *models: calls.append(models))
+
+    registry.start()
+    _wait_loaded(registry)
+    registry.start()  # nothing pending: must not fire again
+    assert calls == [("model b", "model a")]
+
+    # Registered after the models are up: fires immediately, once
+    late = []
+    registry.when_ready(["a"], lambda model: late.append(model))
+    registry.when_ready(["a", "b"], lambda *models: None)
+    assert late == ["model a"]
+
+def test_failed_loader_is_reported():
+    registry = ModelRegistry()
+
+    def broken():
+        raise RuntimeError("weights missing")
+
+    registry.register("good", lambda: "model")
+    registry.register("bad", broken)
+    calls = []
+    registry.when_ready(["good", "bad"], lambda *models: calls.append(models))
+
+    registry.start()
+    _wait_loaded(registry)
+
+    status = registry.status()
+    assert status["good"]["status"] == READY
+    assert status["bad"]["status"] == FAILED
+    assert status["bad"]["error"] == "weights missing"
+    assert registry.get("bad") is None
+    assert not registry.is_ready("good", "bad")
+    assert calls == []
+
+def test_load_all_holds_callbacks_until_start():
+    registry = ModelRegistry()
+    registry.register("a", lambda: "model a")
+    calls = []
+    registry.when_ready(["a"], lambda model: calls.append(model))
+
+    registry.load_all(run_callbacks=False)
+    assert registry.is_ready("a")
+    assert calls == []
+
+    # As in a forked worker: nothing left to load, the held callback fires
+    registry.start()
+    assert calls == ["model a"]
+
+def test_callbacks_never_overlap_across_loader_threads():
+    registry = ModelRegistry()
+    slow_started = threading.Event()
+    state = {}
+    seen = []
+
+    def load_fast():
+        slow_started.wait(5)  # finish while the slow callback is still running
+        return "fast"
+
+    def on_slow(model):
+        slow_started.set()
+        time.sleep(0.2)
+        state["pipeline"] = model
+
+    registry.register("slow", lambda: "slow")
+    registry.register("fast", load_fast)
+    registry.when_ready(["slow"], on_slow)
+    registry.when_ready(["slow", "fast"], lambda *models: seen.append(state.get("pipeline")))
+
+    registry.start()
+    _wait_loaded(registry)
+    deadline = time.monotonic() + 5
+    while not seen and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # The all-ready hook ran after the earlier hook finished, not beside it
+    assert seen == ["slow"]
@@ -0,0 +1,23 @@
+"""
+Tests for sentence splitting before speech synthesis
+"""
+
+import pytest
+
+speech_module = pytest.importorskip("speech_module")
+split_sentences = speech_module.split_sentences
+
+def test_closing_quote_stays_with_sentence():
+    assert split_sentences('हे "खरं!" आहे') == ['हे "खरं!"', 'आहे']
+    assert split_sentences("तो म्हणाला “थांबा।” मग गेला") == ["तो म्हणाला “थांबा।”", "मग गेला"]
+
+def test_closing_bracket_stays_with_sentence():
+    assert split_sentences("ते (खूप थकले होते.) आता झोपले।") == ["ते (खूप थकले होते.)", "आता झोपले।"]
+
+def test_punctuation_runs_split_once():
+    assert split_sentences("काय?! खरंच.") == ["काय?!", "खरंच."]
+    assert split_sentences("थांबा... पुढे") == ["थांबा...", "पुढे"]
+
+def test_abbreviations_and_numbers_do_not_split():
+    assert split_sentences("डॉ. पाटील आले. ते बसले") == ["डॉ. पाटील आले.", "ते बसले"]
+    assert split_sentences("किंमत 3.5 रुपये आहे. धन्यवाद") == ["किंमत 3.5 रुपये आहे.", "धन्यवाद"]
@@ -0,0 +1,89 @@
+"""
+Tests for the streaming transcriber's commit and window logic
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+streaming = pytest.importorskip("streaming")
+
+SAMPLE_RATE = streaming.SAMPLE_RATE
+
+def _transcriber(seconds, **settings):
+    transcriber = streaming.StreamingTranscriber(**settings)
+    transcriber.add_audio(b"\x00\x00" * int(seconds * SAMPLE_RATE))
+    return transcriber
+
+def _segment(text, start, end):
+    return {"text": text, "start": start, "end": end}
+
+def test_decodes_once_per_step():
+    transcriber = streaming.StreamingTranscriber(step_seconds=1.0)
+    transcriber.add_audio(b"\x00\x00" * (SAMPLE_RATE // 2))
+    assert not transcriber.should_decode()
+    transcriber.add_audio(b"\x00\x00" * (SAMPLE_RATE // 2))
+    assert transcriber.should_decode()
+    transcriber.snapshot()
+    assert not transcriber.should_decode()
+
+def test_resamples_input_rate():
+    transcriber = streaming.StreamingTranscriber(sample_rate=8000)
+    transcriber.add_audio(b"\x00\x00" * 8000)
+    assert len(transcriber.buffer) == SAMPLE_RATE
+
+def test_commits_only_segments_clear_of_the_live_edge():
+    transcriber = _transcriber(6.0, stability_margin=1.5, window_seconds=20)
+    segments = [_segment("eins", 0.0, 2.0), _segment("zwei", 2.0, 4.8), _segment("drei", 4.8, 6.0)]
+
+    committed, partial = transcriber.update(segments, decoded_seconds=6.0)
+
+    # "zwei" ends inside the margin, "drei" is the growing last segment
+    assert committed == [{"text": "eins", "start": 0.0, "end": 2.0}]
+    assert partial == "zwei drei"
+    assert transcriber.buffer_start == 2.0
+    assert len(transcriber.buffer) == 4 * SAMPLE_RATE
+
+def test_committed_timestamps_are_stream_relative():
+    transcriber = _transcriber(6.0, stability_margin=1.0)
+    transcriber.update([_segment("eins", 0.0, 2.0), _segment("zwei", 2.0, 6.0)], 6.0)
+    transcriber.add_audio(b"\x00\x00" * (2 * SAMPLE_RATE))
+
+    committed, _ = transcriber.update([_segment("zwei", 0.0, 3.0), _segment("drei", 3.0, 6.0)], 6.0)
+
+    assert committed == [{"text": "zwei", "start": 2.0, "end": 5.0}]
+    assert transcriber.snapshot()[1] == "eins zwei"
+
+def test_full_window_forces_a_commit():
+    transcriber = _transcriber(20.0, stability_margin=1.5, window_seconds=20)
+    segments = [_segment("lang", 0.0, 19.5), _segment("weiter", 19.5, 20.0)]
+
+    committed, partial = transcriber.update(segments, decoded_seconds=20.0)
+
+    assert [seg["text"] for seg in committed] == ["lang"]
+    assert partial == "weiter"
+
+def test_silent_window_is_dropped():
+    transcriber = _transcriber(20.0, window_seconds=20)
+
+    committed, partial = transcriber.update([], decoded_seconds=20.0)
+
+    assert committed == [] and partial == ""
+    assert len(transcriber.buffer) == 0
+    assert transcriber.buffer_start == 20.0
+
+def test_final_update_commits_everything():
+    transcriber = _transcriber(3.0)
+    segments = [_segment("eins", 0.0, 1.0), _segment("zwei", 1.0, 3.0)]
+
+    committed, partial = transcriber.update(segments, decoded_seconds=3.0, final=True)
+
+    assert [seg["text"] for seg in committed] == ["eins", "zwei"]
+    assert partial == ""
+    assert len(transcriber.buffer) == 0
+
+def test_sample_rate_is_validated():
+    assert streaming.parse_sample_rate(8000) == 8000
+    assert streaming.parse_sample_rate(44100.0) == 44100
+    for value in (0, -16000, 1.5, "16000", None, True, float("inf"), float("nan"), 10 ** 9):
+        with pytest.raises(ValueError):
+            streaming.parse_sample_rate(value)
@@ -0,0 +1,111 @@
+"""
+Tests for upload size limits (middleware 413s and chunked upload checks)
+"""
+
+import asyncio
+import hashlib
+import io
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from uploads import MULTIPART_OVERHEAD, UploadLimitMiddleware, UploadTooLargeError, check_upload
+
+MAX_FILE_BYTES = 1024
+MAX_BODY_BYTES = MAX_FILE_BYTES + MULTIPART_OVERHEAD
+
+async def _echo_app(scope, receive, send):
+    """
+    Reads the whole body, then answers 200 with its length
+    (a body error surfaces as the app's own 500, as in FastAPI)
+    """
+    size = 0
+    try:
+        while True:
+            message = await receive()
+            size += len(message.get("body", b""))
+            if not message.get("more_body"):
+                break
+    except Exception:
+        await send({"type": "http.response.start", "status": 500, "headers": []})
+        await send({"type": "http.response.body", "body": b"error"})
+        raise
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": str(size).encode()})
+
+def _request(chunks, content_length=None, path="/speech-translate"):
+    """
+    Send a request through the middleware
+
+    Returns:
+        (status, response body, number of body chunks the app was given)
+    """
+    headers = [] if content_length is None else [(b"content-length", str(content_length).encode())]
+    scope = {"type": "http", "path": path, "headers": headers}
+    pending = list(chunks)
+    given = []
+    sent = []
+
+    async def receive():
+        body = pending.pop(0) if pending else b""
+        given.append(body)
+        return {"type": "http.request", "body": body, "more_body": bool(pending)}
+
+    async def send(message):
+        sent.append(message)
+
+    middleware = UploadLimitMiddleware(_echo_app, MAX_FILE_BYTES, ["/speech-translate"])
+    asyncio.run(middleware(scope, receive, send))
+
+    status = next(message["status"] for message in sent if message["type"] == "http.response.start")
+    body = b"".join(message.get("body", b"") for message in sent if message["type"] == "http.response.body")
+    return status, body, len(given)
+
+def test_large_content_length_rejected_before_reading():
+    status, body, chunks_read = _request([b"x"], content_length=MAX_BODY_BYTES + 1)
+    assert status == 413
+    assert b"File too large" in body
+    assert chunks_read == 0
+
+def test_streamed_overrun_rejected():
+    chunk = b"x" * (MAX_BODY_BYTES // 4 + 1)
+    status, body, chunks_read = _request([chunk] * 10)
+    assert status == 413
+    assert b"File too large" in body
+    assert chunks_read == 4  # stopped at the chunk crossing the limit, not the end of the body
+
+def test_body_within_limit_passes():
+    status, body, _ = _request([b"x" * 100, b"y" * 100], content_length=200)
+    assert (status, body) == (200, b"200")
+
+def test_other_paths_are_not_limited():
+    status, _, _ = _request([b"x"], content_length=MAX_BODY_BYTES + 1, path="/translate-text")
+    assert status == 200
+
+class _Upload:
+    """
+    Minimal stand-in for UploadFile's async read/seek
+    """
+
+    def __init__(self, data: bytes):
+        self.file = io.BytesIO(data)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self.file.read(size)
+
+    async def seek(self, offset: int):
+        self.file.seek(offset)
+
+def test_check_upload_hashes_and_rewinds():
+    upload = _Upload(b"a" * 3000)
+    info = asyncio.run(check_upload(upload, max_bytes=3000, chunk_size=512))
+    assert info.size == 3000
+    assert info.sha256 == hashlib.sha256(b"a" * 3000).hexdigest()
+    assert upload.file.tell() == 0
+
+def test_check_upload_stops_at_limit():
+    upload = _Upload(b"a" * 10_000)
+    with pytest.raises(UploadTooLargeError):
+        asyncio.run(check_upload(upload, max_bytes=1000, chunk_size=512))
+    assert upload.file.tell() == 1024  # two chunks read, not the whole file
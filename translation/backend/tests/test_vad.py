@@ -0,0 +1,55 @@
+"""
+Tests for energy-based voice activity detection
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+speech_module = pytest.importorskip("speech_module")
+
+detect_speech_segments = speech_module.detect_speech_segments
+SAMPLE_RATE = speech_module.SAMPLE_RATE
+
+def _clip(seconds, bursts):
+    """
+    Quiet noise with 440 Hz tone bursts at the given (start, end) seconds
+    """
+    rng = np.random.default_rng(0)
+    audio = rng.normal(0, 1e-4, int(seconds * SAMPLE_RATE)).astype(np.float32)
+    for start, end in bursts:
+        t = np.arange(int(start * SAMPLE_RATE), int(end * SAMPLE_RATE))
+        audio[t] += 0.2 * np.sin(2 * np.pi * 440 * t / SAMPLE_RATE)
+    return audio
+
+def _seconds(segments):
+    return [(start / SAMPLE_RATE, end / SAMPLE_RATE) for start, end in segments]
+
+def test_silence_has_no_segments():
+    assert detect_speech_segments(np.zeros(3 * SAMPLE_RATE, dtype=np.float32)) == []
+    assert detect_speech_segments(_clip(3, [])) == []
+    assert detect_speech_segments(np.zeros(10, dtype=np.float32)) == []
+
+def test_burst_is_found_with_padding():
+    [(start, end)] = _seconds(detect_speech_segments(_clip(4, [(1.0, 2.0)])))
+    pad = speech_module.VAD_PAD_MS / 1000
+    frame = speech_module.VAD_FRAME_MS / 1000
+    assert start == pytest.approx(1.0 - pad, abs=frame)
+    assert end == pytest.approx(2.0 + pad, abs=frame)
+
+def test_short_click_is_dropped():
+    assert detect_speech_segments(_clip(3, [(1.0, 1.1)])) == []
+
+def test_short_pause_is_bridged_long_pause_splits():
+    assert len(detect_speech_segments(_clip(5, [(1.0, 2.0), (2.2, 3.0)]))) == 1
+    assert len(detect_speech_segments(_clip(6, [(0.5, 1.5), (3.0, 4.0)]))) == 2
+
+def test_long_speech_is_split_for_whisper():
+    audio = _clip(65, [(0.0, 65.0)])
+    segments = _seconds(detect_speech_segments(audio))
+
+    assert len(segments) >= 3
+    assert all(end - start <= speech_module.VAD_MAX_SEGMENT_SECONDS + 1e-6 for start, end in segments)
+    # Consecutive pieces, no audio lost
+    assert segments[0][0] == 0.0
+    assert all(a[1] == b[0] for a, b in zip(segments, segments[1:]))
+    assert segments[-1][1] == pytest.approx(65.0, abs=speech_module.VAD_FRAME_MS / 1000)
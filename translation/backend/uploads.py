@@ -0,0 +1,166 @@
+"""
+Upload Handling Module
+Chunked reads of uploaded files with incremental size limits and an on-the-fly
+content hash, plus ASGI middleware that rejects oversized request bodies early
+"""
+
+import os
+import json
+import hashlib
+from typing import Iterable, NamedTuple, Optional
+
+from fastapi import UploadFile
+
+# ========================================================
+# Configuration
+# ========================================================
+
+# Bytes read (and held) at a time while checking an upload
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(64 * 1024)))
+
+# Multipart framing (boundaries, part headers) allowed on top of the file limit
+MULTIPART_OVERHEAD = 64 * 1024
+
+# ========================================================
+# Errors
+# ========================================================
+
+class UploadTooLargeError(ValueError):
+    """
+    Raised as soon as an upload exceeds its size limit
+    """
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"File too large. Max size: {max_bytes / (1024 * 1024):.1f} MB")
+        self.max_bytes = max_bytes
+
+# ========================================================
+# Chunked Upload Reading
+# ========================================================
+
+class UploadInfo(NamedTuple):
+    """
+    Size and content digest of a checked upload
+    """
+    size: int
+    sha256: Optional[str]
+
+async def check_upload(
+    upload: UploadFile,
+    max_bytes: int,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+    compute_hash: bool = True
+) -> UploadInfo:
+    """
+    Read an upload chunk by chunk, enforcing the limit as bytes arrive
+
+    Only one chunk is in memory at a time; the file is rewound afterwards so
+    decoders can read `upload.file` directly (Starlette spools larger parts
+    to disk, so nothing here holds the whole upload in RAM).
+
+    Args:
+        upload: FastAPI upload
+        max_bytes: Maximum accepted size
+        chunk_size: Bytes per read
+        compute_hash: Also compute a SHA-256 of the content
+
+    Returns:
+        UploadInfo with size and hex digest (None if not computed)
+
+    Raises:
+        UploadTooLargeError: As soon as more than max_bytes were read
+    """
+    digest = hashlib.sha256() if compute_hash else None
+    size = 0
+    while True:
+        chunk = await upload.read(chunk_size)
+        if not chunk:
+            break
+        size += len(chunk)
+        if size > max_bytes:
+            raise UploadTooLargeError(max_bytes)
+        if digest is not None:
+            digest.update(chunk)
+
+    await upload.seek(0)
+    return UploadInfo(size, digest.hexdigest() if digest is not None else None)
+
+# ========================================================
+# Early Rejection Middleware
+# ========================================================
+
+class UploadLimitMiddleware:
+    """
+    Pure ASGI middleware limiting request bodies on upload routes
+
+    A Content-Length above the limit is answered with 413 before any body is
+    read. Bodies without one (chunked transfer) are counted while the app
+    receives them and cut off with 413 once the limit is passed.
+    """
+
+    def __init__(self, app, max_file_bytes: int, paths: Iterable[str]):
+        """
+        Args:
+            app: Wrapped ASGI application
+            max_file_bytes: Largest accepted file (multipart overhead is added on top)
+            paths: Request paths the limit applies to
+        """
+        self.app = app
+        self.max_file_bytes = max_file_bytes
+        self.max_body_bytes = max_file_bytes + MULTIPART_OVERHEAD
+        self.paths = set(paths)
+
+    async def _reject(self, send):
+        """
+        Send a 413 response
+        """
+        body = json.dumps({"detail": str(UploadTooLargeError(self.max_file_bytes))}).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"connection", b"close")
+            ]
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        content_length = headers.get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > self.max_body_bytes:
+            await self._reject(send)
+            return
+
+        received = 0
+        exceeded = False
+        response_started = False
+
+        async def limited_receive():
+            nonlocal received, exceeded
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_bytes:
+                    exceeded = True
+                    raise UploadTooLargeError(self.max_body_bytes)
+            return message
+
+        async def guarded_send(message):
+            nonlocal response_started
+            if exceeded:
+                return  # the app's own error response is replaced by the 413 below
+            response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except UploadTooLargeError:
+            pass
+        if exceeded and not response_started:
+            await self._reject(send)